@@ -3,6 +3,14 @@
 import pytest
 from _pytest.fixtures import FixtureRequest
 from _pytest.tmpdir import TempPathFactory, _mk_tmp
+from demisto_sdk.commands.common.hook_validations.docker import \
+    DOCKER_TAGS_CACHE
+from demisto_sdk.commands.common.tools import (DOCUMENT_CACHE, GIT_CHANGE_SET,
+                                               GIT_OBJECT_READER)
+from demisto_sdk.commands.lint.helpers import (DEV_IMAGES_COORDINATOR,
+                                               DOCKER_CONTAINERS_POOL,
+                                               LINT_RESULTS_CACHE,
+                                               PYTHON_VERSIONS_CACHE)
 from TestSuite.integration import Integration
 from TestSuite.pack import Pack
 from TestSuite.playbook import Playbook
@@ -41,6 +49,29 @@ def get_playbook(request: FixtureRequest, tmp_path_factory: TempPathFactory) ->
 # Fixtures
 
 
+@pytest.fixture(autouse=True)
+def clear_git_change_set():
+    """The git change set is memoized per process, so every test reads the git state (or its mock) again.
+    """
+    GIT_CHANGE_SET.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolate_sdk_caches(monkeypatch, tmp_path_factory):
+    """The docker tags, the docker images python versions, the lint dev images, worker containers and results, the
+    parsed content files and the git objects are cached in memory and on disk, so every test looks them up (or their
+    mocks) again, and never reads or writes the user cache.
+    """
+    monkeypatch.setenv('DEMISTO_SDK_CACHE_DIR', str(tmp_path_factory.mktemp('cache')))
+    DOCKER_TAGS_CACHE.clear()
+    PYTHON_VERSIONS_CACHE.clear()
+    DEV_IMAGES_COORDINATOR.clear()
+    DOCKER_CONTAINERS_POOL.clear()
+    LINT_RESULTS_CACHE.clear()
+    DOCUMENT_CACHE.clear()
+    GIT_OBJECT_READER.clear()
+
+
 @pytest.fixture
 def pack(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> Pack:
     """Mocking tmp_path
@@ -4,53 +4,10 @@ import os
 import sys
 from pathlib import Path
 
-from pkg_resources import get_distribution
-
 # Third party packages
 import click
-import git
-from demisto_sdk.commands.common import tools
-from demisto_sdk.commands.common.configuration import Configuration
-# Common tools
-from demisto_sdk.commands.common.constants import (
-    API_MODULES_PACK, SKIP_RELEASE_NOTES_FOR_TYPES, FileType)
-from demisto_sdk.commands.common.tools import (filter_files_by_type,
-                                               filter_files_on_pack, find_type,
-                                               get_last_remote_release_version,
-                                               get_pack_name, print_error,
-                                               print_warning)
-from demisto_sdk.commands.common.update_id_set import merge_id_sets_from_files
-from demisto_sdk.commands.create_artifacts.content_artifacts_creator import (
-    ArtifactsManager, create_content_artifacts)
-from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
-from demisto_sdk.commands.download.downloader import Downloader
-from demisto_sdk.commands.find_dependencies.find_dependencies import \
-    PackDependencies
-from demisto_sdk.commands.format.format_module import format_manager
-from demisto_sdk.commands.generate_docs.generate_integration_doc import \
-    generate_integration_doc
-from demisto_sdk.commands.generate_docs.generate_playbook_doc import \
-    generate_playbook_doc
-from demisto_sdk.commands.generate_docs.generate_script_doc import \
-    generate_script_doc
-from demisto_sdk.commands.generate_test_playbook.test_playbook_generator import \
-    PlaybookTestsGenerator
-from demisto_sdk.commands.init.initiator import Initiator
-from demisto_sdk.commands.json_to_outputs.json_to_outputs import \
-    json_to_outputs
-from demisto_sdk.commands.lint.lint_manager import LintManager
-from demisto_sdk.commands.openapi_codegen.openapi_codegen import \
-    OpenAPIIntegration
-# Import demisto-sdk commands
-from demisto_sdk.commands.run_cmd.runner import Runner
-from demisto_sdk.commands.run_playbook.playbook_runner import PlaybookRunner
-from demisto_sdk.commands.secrets.secrets import SecretsValidator
-from demisto_sdk.commands.split_yml.extractor import Extractor
-from demisto_sdk.commands.unify.unifier import Unifier
-from demisto_sdk.commands.update_release_notes.update_rn import (
-    UpdateRN, update_api_modules_dependents_rn)
-from demisto_sdk.commands.upload.uploader import Uploader
-from demisto_sdk.commands.validate.validate_manager import ValidateManager
+
+# The implementation of every command is imported only when the command is invoked, to keep the CLI startup fast.
 
 
 class DemistoSDK:
@@ -75,15 +32,17 @@ pass_config = click.make_pass_decorator(DemistoSDK, ensure=True)
 )
 @pass_config
 def main(config, version):
+    from demisto_sdk.commands.common.configuration import Configuration
+    from demisto_sdk.commands.common.tools import (
+        get_cached_remote_release_version, get_sdk_version, print_warning)
     config.configuration = Configuration()
-    cur_version = get_distribution('demisto-sdk').version
-    last_release = get_last_remote_release_version()
-    if last_release and cur_version != last_release:
+    cur_version = get_sdk_version()
+    last_release = get_cached_remote_release_version()
+    if last_release and cur_version and cur_version != last_release:
         print_warning(f'You are using demisto-sdk {cur_version}, however version {last_release} is available.\n'
                       f'You should consider upgrading via "pip3 install --upgrade demisto-sdk" command.')
     if version:
-        version = get_distribution('demisto-sdk').version
-        print(f'demisto-sdk {version}')
+        print(f'demisto-sdk {cur_version}')
 
 
 # ====================== split-yml ====================== #
@@ -121,6 +80,9 @@ def main(config, version):
 )
 @pass_config
 def extract(config, **kwargs):
+    from demisto_sdk.commands.common.constants import FileType
+    from demisto_sdk.commands.common.tools import find_type, print_error
+    from demisto_sdk.commands.split_yml.extractor import Extractor
     file_type = find_type(kwargs.get('input'), ignore_sub_categories=True)
     if file_type not in [FileType.INTEGRATION, FileType.SCRIPT]:
         print_error('File is not an Integration or Script.')
@@ -162,6 +124,9 @@ def extract(config, **kwargs):
 )
 @pass_config
 def extract_code(config, **kwargs):
+    from demisto_sdk.commands.common.constants import FileType
+    from demisto_sdk.commands.common.tools import find_type, print_error
+    from demisto_sdk.commands.split_yml.extractor import Extractor
     file_type = find_type(kwargs.get('input'), ignore_sub_categories=True)
     if file_type not in [FileType.INTEGRATION, FileType.SCRIPT]:
         print_error('File is not an Integration or Script.')
@@ -191,6 +156,7 @@ def extract_code(config, **kwargs):
     show_default=False
 )
 def unify(**kwargs):
+    from demisto_sdk.commands.unify.unifier import Unifier
     # Input is of type Path.
     kwargs['input'] = str(kwargs['input'])
     unifier = Unifier(**kwargs)
@@ -268,9 +234,20 @@ def unify(**kwargs):
 @click.option(
     '--skip-id-set-creation', is_flag=True,
     help='Skip validation of pack dependencies.')
+@click.option(
+    '-v', '--verbose', is_flag=True,
+    help='Verbose output, e.g. the parsed files cache statistics.')
+@click.option(
+    '-w', '--workers', type=click.IntRange(min=1), default=1, show_default=True,
+    help='The number of processes to validate packs with, when validating all files or given packs.')
 @pass_config
 def validate(config, **kwargs):
+    import git
+    from demisto_sdk.commands.common import tools
+    from demisto_sdk.commands.common.tools import print_error
+    from demisto_sdk.commands.validate.validate_manager import ValidateManager
     sys.path.append(config.configuration.env_dir)
+    tools.set_log_verbose(kwargs.get('verbose', False))
 
     file_path = kwargs['input']
 
@@ -295,7 +272,8 @@ def validate(config, **kwargs):
             skip_dependencies=kwargs['skip_pack_dependencies'],
             id_set_path=kwargs.get('id_set_path'),
             staged=kwargs['staged'],
-            skip_id_set_creation=kwargs.get('skip_id_set_creation')
+            skip_id_set_creation=kwargs.get('skip_id_set_creation'),
+            workers=kwargs.get('workers')
         )
         return validator.run_validation()
     except (git.InvalidGitRepositoryError, git.NoSuchPathError, FileNotFoundError) as e:
@@ -325,6 +303,8 @@ def validate(config, **kwargs):
               help='Number of cpus/vcpus availble - only required when os not reflect number of cpus (CircleCI'
                    'allways show 32, but medium has 3.', hidden=True, default=os.cpu_count())
 def create_arifacts(**kwargs) -> int:
+    from demisto_sdk.commands.create_artifacts.content_artifacts_creator import (
+        ArtifactsManager, create_content_artifacts)
     artifacts_conf = ArtifactsManager(**kwargs)
     return create_content_artifacts(artifacts_conf)
 
@@ -357,6 +337,7 @@ def create_arifacts(**kwargs) -> int:
     '--prev-ver', help='The branch against which to run secrets validation')
 @pass_config
 def secrets(config, **kwargs):
+    from demisto_sdk.commands.secrets.secrets import SecretsValidator
     sys.path.append(config.configuration.env_dir)
     secrets_validator = SecretsValidator(
         configuration=config.configuration,
@@ -409,6 +390,7 @@ def lint(input: str, git: bool, all_packs: bool, verbose: int, quiet: bool, para
         2. Package in docker image checks -  pylint, pytest, powershell - test, powershell - analyze.\n
     Meant to be used with integrations/scripts that use the folder (package) structure. Will lookup up what
     docker image to use and will setup the dev dependencies and file in the target folder."""
+    from demisto_sdk.commands.lint.lint_manager import LintManager
     lint_manager = LintManager(input=input,
                                git=git,
                                all_packs=all_packs,
@@ -457,6 +439,7 @@ def lint(input: str, git: bool, all_packs: bool, verbose: int, quiet: bool, para
     help="Automatic yes to prompts; assume 'yes' as answer to all prompts and run non-interactively",
     is_flag=True)
 def format_yml(**kwargs):
+    from demisto_sdk.commands.format.format_module import format_manager
     return format_manager(**kwargs)
 
 
@@ -481,6 +464,7 @@ def format_yml(**kwargs):
 @click.option(
     "-v", "--verbose", help="Verbose output", is_flag=True)
 def upload(**kwargs):
+    from demisto_sdk.commands.upload.uploader import Uploader
     uploader = Uploader(**kwargs)
     return uploader.upload()
 
@@ -514,6 +498,7 @@ def upload(**kwargs):
 @click.option(
     "-fmt", "--run-format", help="Whether to run demisto-sdk format on downloaded files or not", is_flag=True)
 def download(**kwargs):
+    from demisto_sdk.commands.download.downloader import Downloader
     downloader: Downloader = Downloader(**kwargs)
     return downloader.download()
 
@@ -549,6 +534,7 @@ def download(**kwargs):
     "-r", "--raw-response", help="Used with `json-to-outputs` flag. Use the raw response of the query for"
     " `json-to-outputs`", is_flag=True)
 def run(**kwargs):
+    from demisto_sdk.commands.run_cmd.runner import Runner
     runner = Runner(**kwargs)
     return runner.run()
 
@@ -584,6 +570,7 @@ def run(**kwargs):
 @click.option(
     "--insecure", help="Skip certificate validation", is_flag=True)
 def run_playbook(**kwargs):
+    from demisto_sdk.commands.run_playbook.playbook_runner import PlaybookRunner
     playbook_runner = PlaybookRunner(**kwargs)
     return playbook_runner.run_playbook()
 
@@ -613,6 +600,8 @@ file/UI/PyCharm. This script auto generates the YAML for a command from the JSON
     "--interactive", help="If passed, then for each output field will ask user interactively to enter the "
                           "description. By default is interactive mode is disabled", is_flag=True)
 def json_to_outputs_command(**kwargs):
+    from demisto_sdk.commands.json_to_outputs.json_to_outputs import \
+        json_to_outputs
     json_to_outputs(**kwargs)
 
 
@@ -641,6 +630,10 @@ def json_to_outputs_command(**kwargs):
 @click.option(
     "-v", "--verbose", help="Verbose output for debug purposes - shows full exception stack trace", is_flag=True)
 def generate_test_playbook(**kwargs):
+    from demisto_sdk.commands.common.constants import FileType
+    from demisto_sdk.commands.common.tools import find_type, print_error
+    from demisto_sdk.commands.generate_test_playbook.test_playbook_generator import \
+        PlaybookTestsGenerator
     file_type = find_type(kwargs.get('input'), ignore_sub_categories=True)
     if file_type not in [FileType.INTEGRATION, FileType.SCRIPT]:
         print_error('Generating test playbook is possible only for an Integration or a Script.')
@@ -679,6 +672,7 @@ def generate_test_playbook(**kwargs):
     '--common_server', is_flag=True,
     help="Copy the CommonServerPython. Relevant for initialization of Scripts and Integrations within a Pack.")
 def init(**kwargs):
+    from demisto_sdk.commands.init.initiator import Initiator
     initiator = Initiator(**kwargs)
     initiator.init()
     return 0
@@ -724,6 +718,14 @@ def init(**kwargs):
 @click.option(
     "-v", "--verbose", is_flag=True, help="Verbose output - mainly for debugging purposes.")
 def generate_doc(**kwargs):
+    from demisto_sdk.commands.common.constants import FileType
+    from demisto_sdk.commands.common.tools import find_type, print_error
+    from demisto_sdk.commands.generate_docs.generate_integration_doc import \
+        generate_integration_doc
+    from demisto_sdk.commands.generate_docs.generate_playbook_doc import \
+        generate_playbook_doc
+    from demisto_sdk.commands.generate_docs.generate_script_doc import \
+        generate_script_doc
     input_path = kwargs.get('input')
     output_path = kwargs.get('output')
     command = kwargs.get('command')
@@ -785,8 +787,13 @@ def generate_doc(**kwargs):
     '-h', '--help'
 )
 @click.option(
-    "-o", "--output", help="Output file path, the default is the Tests directory.", default='', required=False)
+    "-o", "--output", help="Output file path, the default is the Tests directory. An output path with a .db or "
+                           ".sqlite extension creates a compact SQLite id set.", default='', required=False)
+@click.option(
+    "-c", "--cache-path", help="Path of the id set cache file. When given, only files which changed since the cache "
+                               "was written are re-parsed.", required=False)
 def id_set_command(**kwargs):
+    from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
     id_set_creator = IDSetCreator(**kwargs)
     id_set_creator.create_id_set()
 
@@ -807,6 +814,7 @@ def id_set_command(**kwargs):
     '-o', '--output', help='File path of the united id_set', required=True
 )
 def merge_id_sets_command(**kwargs):
+    from demisto_sdk.commands.common.update_id_set import merge_id_sets_from_files
     first = kwargs['id_set1']
     second = kwargs['id_set2']
     output = kwargs['output']
@@ -818,6 +826,23 @@ def merge_id_sets_command(**kwargs):
     )
 
 
+@main.command(name='convert-id-set',
+              hidden=True,
+              short_help='Convert an id_set between the JSON and the SQLite formats')
+@click.help_option(
+    '-h', '--help'
+)
+@click.option(
+    '-i', '--input', help='The id_set file path, either a JSON or an SQLite id_set', required=True
+)
+@click.option(
+    '-o', '--output', help='File path of the converted id_set', required=True
+)
+def convert_id_set_command(**kwargs):
+    from demisto_sdk.commands.common.id_set_db import convert_id_set
+    convert_id_set(input_path=kwargs['input'], output_path=kwargs['output'])
+
+
 # ====================== update-release-notes =================== #
 @main.command(name="update-release-notes",
               short_help='''Auto-increment pack version and generate release notes template.''')
@@ -850,6 +875,16 @@ def merge_id_sets_command(**kwargs):
     "-idp", "--id-set-path", help="The path of the id-set.json used for APIModule updates.",
     type=click.Path(resolve_path=True))
 def update_pack_releasenotes(**kwargs):
+    import git
+    from demisto_sdk.commands.common.constants import (
+        API_MODULES_PACK, SKIP_RELEASE_NOTES_FOR_TYPES)
+    from demisto_sdk.commands.common.tools import (filter_files_by_type,
+                                                   filter_files_on_pack,
+                                                   get_pack_name, print_error,
+                                                   print_warning)
+    from demisto_sdk.commands.update_release_notes.update_rn import (
+        UpdateRN, update_api_modules_dependents_rn)
+    from demisto_sdk.commands.validate.validate_manager import ValidateManager
     _pack = kwargs.get('input')
     update_type = kwargs.get('update_type')
     pre_release = kwargs.get('pre_release')
@@ -933,8 +968,13 @@ def update_pack_releasenotes(**kwargs):
     '-h', '--help'
 )
 @click.option(
-    "-i", "--input", help="Pack path to find dependencies. For example: Pack/HelloWorld", required=True,
+    "-i", "--input", help="Pack path to find dependencies. For example: Pack/HelloWorld", required=False,
     type=click.Path(exists=True, dir_okay=True))
+@click.option(
+    "--all-packs", help="Find the dependencies of all the packs in the repository at once.", is_flag=True)
+@click.option(
+    "-w", "--workers", help="The number of processes to find the dependencies of all the packs with. "
+                            "Defaults to the number of CPUs.", type=click.IntRange(min=1), required=False)
 @click.option(
     "-idp", "--id-set-path", help="Path to id set json file.", required=False)
 @click.option(
@@ -944,10 +984,27 @@ def update_pack_releasenotes(**kwargs):
     "-v", "--verbose", help="Path to debug md file. will state pack dependency per item.",
     hidden=True, required=False)
 def find_dependencies_command(id_set_path, verbose, no_update, **kwargs):
+    from demisto_sdk.commands.common.tools import print_error
+    from demisto_sdk.commands.find_dependencies.find_dependencies import \
+        PackDependencies
     update_pack_metadata = not no_update
     input_path: Path = kwargs["input"]  # To not shadow python builtin `input`
+    if kwargs['all_packs']:
+        if input_path:
+            print_error("Use either the -i or the --all-packs option.")
+            sys.exit(1)
+        try:
+            PackDependencies.find_all_packs_dependencies(id_set_path=id_set_path,
+                                                         debug_file_path=verbose,
+                                                         update_pack_metadata=update_pack_metadata,
+                                                         workers=kwargs['workers'] or 0,
+                                                         )
+        except ValueError as exp:
+            print_error(str(exp))
+        return
+
     try:
-        assert "Packs/" in input_path
+        assert input_path and "Packs/" in input_path
         pack_name = str(input_path).replace("Packs/", "")
         assert "/" not in pack_name
     except AssertionError:
@@ -1000,6 +1057,10 @@ def find_dependencies_command(id_set_path, verbose, no_update, **kwargs):
     '-a', '--use_default', is_flag=True, help='Use the automatically generated integration configuration'
                                               ' (Skip the second run).')
 def openapi_codegen_command(**kwargs):
+    from demisto_sdk.commands.common import tools
+    from demisto_sdk.commands.common.tools import print_error
+    from demisto_sdk.commands.openapi_codegen.openapi_codegen import \
+        OpenAPIIntegration
     if not kwargs.get('output_dir'):
         output_dir = os.getcwd()
     else:
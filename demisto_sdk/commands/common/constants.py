@@ -747,6 +747,8 @@ PYTHON_SUBTYPES = {'python3', 'python2'}
 CONTENT_GITHUB_LINK = r'https://raw.githubusercontent.com/demisto/content'
 CONTENT_GITHUB_MASTER_LINK = CONTENT_GITHUB_LINK + '/master'
 SDK_API_GITHUB_RELEASES = r'https://api.github.com/repos/demisto/demisto-sdk/releases'
+SDK_LATEST_VERSION_CACHE_FILE = 'latest_version.json'
+SDK_LATEST_VERSION_CACHE_TTL = 24 * 60 * 60  # seconds
 CONTENT_GITHUB_UPSTREAM = r'upstream.*demisto/content'
 CONTENT_GITHUB_ORIGIN = r'origin.*demisto/content'
 
@@ -1,25 +1,18 @@
-import re
 from typing import Callable, List
 
-from demisto_sdk.commands.common.tools import run_command
+from demisto_sdk.commands.common.tools import GIT_CHANGE_SET
 
 
 def git_path() -> str:
-    git_path = run_command('git rev-parse --show-toplevel')
-    return git_path.replace('\n', '')
+    return GIT_CHANGE_SET.top_level
 
 
 def get_current_working_branch() -> str:
-    branches = run_command('git branch')
-    branch_name_reg = re.search(r'\* (.*)', branches)
-    if branch_name_reg:
-        return branch_name_reg.group(1)
-
-    return ''
+    return GIT_CHANGE_SET.branch_name
 
 
 def get_changed_files(from_branch: str = 'master', filter_results: Callable = None):
-    temp_files = run_command(f'git diff --name-status {from_branch}').split('\n')
+    temp_files = GIT_CHANGE_SET.name_status(from_branch).split('\n')
     files: List = []
     for file in temp_files:
         if file:
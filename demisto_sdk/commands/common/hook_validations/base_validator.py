@@ -151,6 +151,9 @@ class BaseValidator:
 
     @staticmethod
     def add_to_report_error_list(error_code, file_path, error_list):
-        formatted_file_and_error = f'{file_path} - [{error_code}]'
+        BaseValidator.add_to_report_error_list_entry(f'{file_path} - [{error_code}]', error_list)
+
+    @staticmethod
+    def add_to_report_error_list_entry(formatted_file_and_error, error_list):
         if formatted_file_and_error not in error_list:
             error_list.append(formatted_file_and_error)
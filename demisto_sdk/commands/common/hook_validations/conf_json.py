@@ -4,6 +4,7 @@ from demisto_sdk.commands.common.constants import CONF_PATH
 from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
+from demisto_sdk.commands.common.tools import DOCUMENT_CACHE
 
 
 class ConfJsonValidator(BaseValidator):
@@ -22,8 +23,7 @@ class ConfJsonValidator(BaseValidator):
         self.conf_data = self.load_conf_file()
 
     def load_conf_file(self):
-        with open(self.CONF_PATH) as data_file:
-            return json.load(data_file)
+        return DOCUMENT_CACHE.load(self.CONF_PATH, json.load)
 
     def is_valid_conf_json(self):
         """Validate the fields skipped_tests, skipped_integrations and unmockable_integrations in conf.json file."""
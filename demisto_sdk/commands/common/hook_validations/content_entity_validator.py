@@ -11,9 +11,9 @@ from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
 from demisto_sdk.commands.common.hook_validations.structure import \
     StructureValidator
-from demisto_sdk.commands.common.tools import (_get_file_id,
-                                               is_test_config_match,
-                                               run_command)
+from demisto_sdk.commands.common.tools import (DOCUMENT_CACHE, GIT_CHANGE_SET,
+                                               _get_file_id,
+                                               is_test_config_match)
 
 
 class ContentEntityValidator(BaseValidator):
@@ -69,7 +69,7 @@ class ContentEntityValidator(BaseValidator):
         Returns:
             (bool): is release branch
         """
-        diff_string_config_yml = run_command("git diff origin/master .circleci/config.yml")
+        diff_string_config_yml = GIT_CHANGE_SET.diff('origin/master', '.circleci/config.yml')
         if re.search(r'[+-][ ]+CONTENT_VERSION: ".*', diff_string_config_yml):
             return True
         return False
@@ -118,8 +118,7 @@ class ContentEntityValidator(BaseValidator):
         return True
 
     def _load_conf_file(self):
-        with open(self.CONF_PATH) as data_file:
-            return json.load(data_file)
+        return DOCUMENT_CACHE.load(self.CONF_PATH, json.load)
 
     def are_tests_registered_in_conf_json_file_or_yml_file(self, test_playbooks: list) -> bool:
         """
@@ -1,6 +1,11 @@
+import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime, timedelta
-from functools import lru_cache
+from typing import Dict, Iterable, Optional
 
 from pkg_resources import parse_version
 
@@ -8,7 +13,9 @@ import requests
 from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
-from demisto_sdk.commands.common.tools import get_yaml
+from demisto_sdk.commands.common.tools import (atomic_write_json,
+                                               get_sdk_cache_dir, get_yaml,
+                                               load_json_cache)
 
 # disable insecure warnings
 requests.packages.urllib3.disable_warnings()
@@ -22,6 +29,12 @@ ACCEPT_HEADER = {
 # use 10 seconds timeout for requests
 TIMEOUT = 10
 DEFAULT_REGISTRY = 'registry-1.docker.io'
+DOCKER_HUB_URL = 'https://hub.docker.com'
+
+DOCKER_TAGS_CACHE_FILE = 'docker_tags.json'
+DOCKER_TAGS_CACHE_TTL = 60 * 60  # seconds
+# the number of docker images which are looked up concurrently, and the size of the connections pool
+DOCKER_TAGS_LOOKUP_WORKERS = 8
 
 
 class DockerImageValidator(BaseValidator):
@@ -228,48 +241,16 @@ class DockerImageValidator(BaseValidator):
         return latest_tag_name
 
     @staticmethod
-    @lru_cache(256)
     def get_docker_image_latest_tag_request(docker_image_name: str) -> str:
         """
-        Get the latest tag for a docker image by request to docker hub.
+        Get the latest tag for a docker image by request to docker hub, through the docker tags cache.
         Args:
             docker_image_name: The docker image name.
 
         Returns:
             The latest tag for the docker image.
         """
-        tag = ''
-        auth_token = DockerImageValidator.docker_auth(docker_image_name, False, DEFAULT_REGISTRY)
-        headers = ACCEPT_HEADER.copy()
-        if auth_token:
-            headers['Authorization'] = 'Bearer {}'.format(auth_token)
-        # first try to get the docker image tags using normal http request
-        res = requests.get(
-            url='https://hub.docker.com/v2/repositories/{}/tags'.format(docker_image_name),
-            verify=False,
-            timeout=TIMEOUT,
-        )
-        if res.status_code == 200:
-            tags = res.json().get('results', [])
-            # if http request successful find the latest tag by date in the response
-            if tags:
-                tag = DockerImageValidator.find_latest_tag_by_date(tags)
-
-        else:
-            # if http request did not succeed than get tags using the API.
-            # See: https://docs.docker.com/registry/spec/api/#listing-image-tags
-            res = requests.get(
-                'https://{}/v2/{}/tags/list'.format(DEFAULT_REGISTRY, docker_image_name),
-                headers=headers,
-                timeout=TIMEOUT,
-                verify=False
-            )
-            res.raise_for_status()
-            # the API returns tags in lexical order with no date info - so try an get the numeric highest tag
-            tags = res.json().get('tags', [])
-            if tags:
-                tag = DockerImageValidator.lexical_find_latest_tag(tags)
-        return tag
+        return DOCKER_TAGS_CACHE.get_latest_tag(docker_image_name)
 
     def get_docker_image_latest_tag(self, docker_image_name, yml_docker_image):
         """Returns the docker image latest tag of the given docker image
@@ -333,3 +314,192 @@ class DockerImageValidator(BaseValidator):
                 return 'demisto/python', self.get_docker_image_latest_tag('demisto/python', None)
             else:
                 return 'demisto/python3', self.get_docker_image_latest_tag('demisto/python3', None)
+
+
+def get_yml_docker_image_name(yml_data: dict) -> str:
+    """Returns the name of the docker image an integration or a script yml is validated with, without its tag.
+
+    Args:
+        yml_data: The integration or script yml data.
+
+    Returns:
+        The demisto docker image name, or an empty string if the docker image is not a demisto image.
+    """
+    script = yml_data.get('script')
+    if not isinstance(script, dict):
+        # in scripts the script key holds the code
+        script = yml_data
+    docker_image = script.get('dockerimage')
+    if not docker_image:
+        return 'demisto/python' if script.get('subtype', 'python2') == 'python2' else 'demisto/python3'
+
+    image_regex = re.findall(r'(demisto\/.+)', docker_image, re.IGNORECASE)
+    return image_regex[0].split(':')[0] if image_regex else ''
+
+
+class DockerTagsCache:
+    """The latest tags of the docker images, shared by all the validated files.
+
+    The tags are kept in memory for the run, and on disk for DOCKER_TAGS_CACHE_TTL seconds. An expired tag is
+    revalidated with the ETag of its tags list, so an unchanged list is not downloaded again. A failed lookup is
+    remembered for the run, so an unreachable registry is waited for once per docker image.
+    """
+
+    def __init__(self, hub_url: str = DOCKER_HUB_URL, registry: str = DEFAULT_REGISTRY):
+        self.hub_url = hub_url
+        self.registry = registry
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, dict]] = None
+        self._errors: Dict[str, Exception] = {}
+        self._session: Optional[requests.Session] = None
+
+    @property
+    def cache_path(self) -> str:
+        return os.path.join(get_sdk_cache_dir(), DOCKER_TAGS_CACHE_FILE)
+
+    @property
+    def session(self) -> requests.Session:
+        """A requests session which keeps the connections to docker hub open for all the lookups."""
+        if self._session is None:
+            session = requests.Session()
+            session.verify = False
+            adapter = requests.adapters.HTTPAdapter(pool_connections=DOCKER_TAGS_LOOKUP_WORKERS,
+                                                    pool_maxsize=DOCKER_TAGS_LOOKUP_WORKERS)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._session = session
+        return self._session
+
+    @property
+    def entries(self) -> Dict[str, dict]:
+        """The cache entries by docker image name, loaded from the cache file on first use."""
+        if self._entries is None:
+            self._entries = load_json_cache(self.cache_path)
+        return self._entries
+
+    def clear(self):
+        """Forgets the tags and the failed lookups of the run, the cache file is read again on the next lookup."""
+        with self._lock:
+            self._entries = None
+            self._errors = {}
+
+    def save(self):
+        """Writes the cache entries to the cache file, ignoring write errors as the cache is only an optimization."""
+        with self._lock:
+            entries = dict(self.entries)
+        with suppress(OSError):
+            atomic_write_json(self.cache_path, entries)
+
+    @staticmethod
+    def is_fresh(entry: Optional[dict]) -> bool:
+        return isinstance(entry, dict) and isinstance(entry.get('checked_at'), (int, float)) and \
+            0 <= time.time() - entry['checked_at'] < DOCKER_TAGS_CACHE_TTL
+
+    def get_latest_tag(self, docker_image_name: str, save: bool = True) -> str:
+        """Get the latest tag for a docker image, from the cache or by request to docker hub.
+
+        Args:
+            docker_image_name: The docker image name.
+            save: Whether to write the cache file when the tag is looked up.
+
+        Returns:
+            The latest tag for the docker image.
+        """
+        with self._lock:
+            entry = self.entries.get(docker_image_name)
+            error = self._errors.get(docker_image_name)
+        if error:
+            raise error
+        if entry and self.is_fresh(entry):
+            return entry['tag']
+
+        try:
+            entry = self.request_latest_tag(docker_image_name, entry if isinstance(entry, dict) else None)
+        except Exception as exc:
+            with self._lock:
+                self._errors[docker_image_name] = exc
+            raise
+
+        with self._lock:
+            self.entries[docker_image_name] = entry
+        if save:
+            self.save()
+        return entry['tag']
+
+    def prefetch(self, docker_image_names: Iterable[str]):
+        """Looks up the latest tags of the given docker images concurrently, so the validations find them cached.
+        The lookup errors are raised again when the tag of the docker image is requested.
+
+        Args:
+            docker_image_names: The docker images names, each distinct image is looked up once.
+        """
+        with self._lock:
+            missing_images = {name for name in docker_image_names
+                              if name and not self.is_fresh(self.entries.get(name)) and name not in self._errors}
+        if not missing_images:
+            return
+
+        def lookup(docker_image_name):
+            try:
+                self.get_latest_tag(docker_image_name, save=False)
+            except Exception:
+                pass
+
+        with ThreadPoolExecutor(max_workers=min(DOCKER_TAGS_LOOKUP_WORKERS, len(missing_images))) as executor:
+            list(executor.map(lookup, sorted(missing_images)))
+        self.save()
+
+    def request_latest_tag(self, docker_image_name: str, entry: Optional[dict] = None) -> dict:
+        """
+        Get the latest tag for a docker image by request to docker hub.
+        Args:
+            docker_image_name: The docker image name.
+            entry: The expired cache entry of the docker image, revalidated by its ETag.
+
+        Returns:
+            The cache entry of the docker image, with the latest tag and the ETag of the tags list.
+        """
+        tag = ''
+        etag = ''
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        # first try to get the docker image tags using normal http request
+        res = self.session.get(
+            url='{}/v2/repositories/{}/tags'.format(self.hub_url, docker_image_name),
+            headers=headers,
+            timeout=TIMEOUT,
+        )
+        if res.status_code == 304 and entry:
+            # the tags list didn't change since the tag was cached
+            return dict(entry, checked_at=time.time())
+
+        if res.status_code == 200:
+            etag = res.headers.get('ETag', '')
+            tags = res.json().get('results', [])
+            # if http request successful find the latest tag by date in the response
+            if tags:
+                tag = DockerImageValidator.find_latest_tag_by_date(tags)
+
+        else:
+            # if http request did not succeed than get tags using the API.
+            # See: https://docs.docker.com/registry/spec/api/#listing-image-tags
+            auth_token = DockerImageValidator.docker_auth(docker_image_name, False, self.registry)
+            headers = ACCEPT_HEADER.copy()
+            if auth_token:
+                headers['Authorization'] = 'Bearer {}'.format(auth_token)
+            res = self.session.get(
+                'https://{}/v2/{}/tags/list'.format(self.registry, docker_image_name),
+                headers=headers,
+                timeout=TIMEOUT,
+            )
+            res.raise_for_status()
+            # the API returns tags in lexical order with no date info - so try an get the numeric highest tag
+            tags = res.json().get('tags', [])
+            if tags:
+                tag = DockerImageValidator.lexical_find_latest_tag(tags)
+
+        return {'tag': tag, 'etag': etag, 'checked_at': time.time()}
+
+
+DOCKER_TAGS_CACHE = DockerTagsCache()
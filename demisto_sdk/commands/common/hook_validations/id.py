@@ -1,4 +1,3 @@
-import json
 import os
 import re
 from collections import OrderedDict
@@ -9,9 +8,13 @@ from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
+from demisto_sdk.commands.common.id_set_db import (SQLiteIDSet,
+                                                   SQLiteIDSetSection,
+                                                   load_id_set)
 from demisto_sdk.commands.common.tools import (collect_ids,
                                                get_script_or_integration_id)
-from demisto_sdk.commands.common.update_id_set import (get_integration_data,
+from demisto_sdk.commands.common.update_id_set import (IDSetSection,
+                                                       get_integration_data,
                                                        get_playbook_data,
                                                        get_script_data)
 from demisto_sdk.commands.unify.unifier import Unifier
@@ -48,26 +51,31 @@ class IDSetValidator(BaseValidator):
         if not is_test_run and self.is_circle:
             self.id_set = self.load_id_set()
             self.id_set_path = os.path.join(self.configuration.env_dir, 'configs', 'id_set.json')
-            self.script_set = self.id_set[self.SCRIPTS_SECTION]
-            self.playbook_set = self.id_set[self.PLAYBOOK_SECTION]
-            self.integration_set = self.id_set[self.INTEGRATION_SECTION]
-            self.test_playbook_set = self.id_set[self.TEST_PLAYBOOK_SECTION]
+            self.script_set = self.get_id_set_section(self.SCRIPTS_SECTION)
+            self.playbook_set = self.get_id_set_section(self.PLAYBOOK_SECTION)
+            self.integration_set = self.get_id_set_section(self.INTEGRATION_SECTION)
+            self.test_playbook_set = self.get_id_set_section(self.TEST_PLAYBOOK_SECTION)
 
     def load_id_set(self):
-        with open(self.ID_SET_PATH, 'r') as id_set_file:
-            try:
-                id_set = json.load(id_set_file)
-            except ValueError as ex:
-                if "Expecting property name" in str(ex):
-                    error_message, error_code = Errors.id_set_conflicts()
-                    if self.handle_error(error_message, error_code, file_path="id_set.json"):
-                        raise
-                    else:
-                        pass
-
-                raise
-
-            return id_set
+        try:
+            id_set = load_id_set(self.ID_SET_PATH)
+        except ValueError as ex:
+            if "Expecting property name" in str(ex):
+                error_message, error_code = Errors.id_set_conflicts()
+                if self.handle_error(error_message, error_code, file_path="id_set.json"):
+                    raise
+                else:
+                    pass
+
+            raise
+
+        return id_set
+
+    def get_id_set_section(self, section):
+        """Returns the id_set section for the lookups by id, an SQLite id_set section is looked up without reading it."""
+        if isinstance(self.id_set, SQLiteIDSet):
+            return self.id_set.get_section(section)
+        return IDSetSection.from_list(self.id_set[section])
 
     def is_valid_in_id_set(self, file_path: str, obj_data: OrderedDict, obj_set: list):
         """Check if the file is represented correctly in the id_set
@@ -83,15 +91,15 @@ class IDSetValidator(BaseValidator):
         is_found = False
         file_id = list(obj_data.keys())[0]
 
-        for checked_instance in obj_set:
-            checked_instance_id = list(checked_instance.keys())[0]
-            checked_instance_data = checked_instance[checked_instance_id]
+        if not isinstance(obj_set, SQLiteIDSetSection):
+            obj_set = IDSetSection.from_list(obj_set)
+        for checked_instance in obj_set.get_by_id(file_id):
+            checked_instance_data = checked_instance[file_id]
             checked_instance_toversion = checked_instance_data.get('toversion', '99.99.99')
             checked_instance_fromversion = checked_instance_data.get('fromversion', '0.0.0')
             obj_to_version = obj_data[file_id].get('toversion', '99.99.99')
             obj_from_version = obj_data[file_id].get('fromversion', '0.0.0')
-            if checked_instance_id == file_id and checked_instance_toversion == obj_to_version and \
-                    checked_instance_fromversion == obj_from_version:
+            if checked_instance_toversion == obj_to_version and checked_instance_fromversion == obj_from_version:
                 is_found = True
                 if checked_instance_data != obj_data[file_id]:
                     error_message, error_code = Errors.id_set_not_updated(file_path)
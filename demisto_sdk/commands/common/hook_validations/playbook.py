@@ -4,12 +4,20 @@ import click
 from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.hook_validations.content_entity_validator import \
     ContentEntityValidator
+from demisto_sdk.commands.common.playbook_graph import PlaybookTasksGraph
 from demisto_sdk.commands.common.tools import LOG_COLORS
 
 
 class PlaybookValidator(ContentEntityValidator):
     """PlaybookValidator is designed to validate the correctness of the file structure we enter to content repo."""
 
+    @property
+    def tasks_graph(self) -> PlaybookTasksGraph:
+        """The tasks flow graph of the playbook, built on its first use."""
+        if getattr(self, '_tasks_graph', None) is None:
+            self._tasks_graph = PlaybookTasksGraph(self.current_file)
+        return self._tasks_graph
+
     def is_valid_playbook(self, is_new_playbook: bool = True, validate_rn: bool = True, id_set_file=None) -> bool:
         """Check whether the playbook is valid or not.
 
@@ -107,21 +115,20 @@ class PlaybookValidator(ContentEntityValidator):
             bool. if the Playbook handles all condition branches correctly.
         """
         is_all_condition_branches_handled: bool = True
-        tasks: Dict = self.current_file.get('tasks', {})
-        for task in tasks.values():
-            if task.get('type') == 'condition':
-                # builtin conditional task
-                if task.get('conditions'):
-                    is_all_condition_branches_handled = self.is_builtin_condition_task_branches_handled(
-                        task) and is_all_condition_branches_handled
-                # ask conditional task
-                elif task.get('message'):
-                    is_all_condition_branches_handled = self.is_ask_condition_branches_handled(
-                        task) and is_all_condition_branches_handled
-                # script conditional task
-                elif task.get('scriptName'):
-                    is_all_condition_branches_handled = self.is_script_condition_branches_handled(
-                        task) and is_all_condition_branches_handled
+        for task_id in self.tasks_graph.condition_tasks:
+            task = self.tasks_graph.tasks[task_id]
+            # builtin conditional task
+            if task.get('conditions'):
+                is_all_condition_branches_handled = self.is_builtin_condition_task_branches_handled(
+                    task) and is_all_condition_branches_handled
+            # ask conditional task
+            elif task.get('message'):
+                is_all_condition_branches_handled = self.is_ask_condition_branches_handled(
+                    task) and is_all_condition_branches_handled
+            # script conditional task
+            elif task.get('scriptName'):
+                is_all_condition_branches_handled = self.is_script_condition_branches_handled(
+                    task) and is_all_condition_branches_handled
         return is_all_condition_branches_handled
 
     def is_builtin_condition_task_branches_handled(self, task: Dict) -> bool:
@@ -232,24 +239,13 @@ class PlaybookValidator(ContentEntityValidator):
         Return:
             bool. if the Playbook has root is connected to all tasks.
         """
-        start_task_id = self.current_file.get('starttaskid')
-        tasks = self.current_file.get('tasks', {})
-        tasks_bucket = set()
-        next_tasks_bucket = set()
-        for task_id, task in tasks.items():
-            if task_id != start_task_id:
-                tasks_bucket.add(task_id)
-            next_tasks = task.get('nexttasks', {})
-            for next_task_ids in next_tasks.values():
-                if next_task_ids:
-                    next_tasks_bucket.update(next_task_ids)
-        orphan_tasks = tasks_bucket.difference(next_tasks_bucket)
+        orphan_tasks = self.tasks_graph.get_orphan_tasks()
         if orphan_tasks:
             error_message, error_code = Errors.playbook_unconnected_tasks(orphan_tasks)
             if not self.handle_error(error_message, error_code, file_path=self.file_path):
                 return False
 
-        return tasks_bucket.issubset(next_tasks_bucket)
+        return not orphan_tasks
 
     def is_valid_deprecated_playbook(self) -> bool:
         is_valid = True
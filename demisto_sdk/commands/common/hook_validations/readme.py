@@ -1,13 +1,15 @@
 import atexit
+import itertools
 import json
 import os
 import re
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
-from threading import Lock
-from typing import Optional
+from threading import Lock, local
+from typing import Dict, Iterable, List, Optional
 
 import requests
 from demisto_sdk.commands.common.errors import Errors
@@ -19,6 +21,81 @@ from demisto_sdk.commands.common.tools import (get_content_path, print_warning,
 NO_HTML = '<!-- NOT_HTML_DOC -->'
 YES_HTML = '<!-- HTML_DOC -->'
 
+# copied from: https://github.com/demisto/content-docs/blob/2402bd1ab1a71f5bf1a23e1028df6ce3b2729cbb/content-repo/mdx_utils.py#L11
+# to use the same logic as we have in the content-docs build
+MDX_FIXES = [
+    (re.compile('<br>(?!</br>)', re.IGNORECASE), '<br/>'),
+    (re.compile('<hr>(?!</hr>)', re.IGNORECASE), '<hr/>'),
+    (re.compile('<pre>', re.IGNORECASE), '<pre>{`'),
+    (re.compile('</pre>', re.IGNORECASE), '`}</pre>'),
+]
+HTML_COMMENT_REGEX = re.compile(r'<\!--.*?-->', re.DOTALL)
+
+MDX_SERVER_LISTENING_REGEX = re.compile(r'MDX server is listening on port: (\d+)')
+# the default number of mdx servers in the pool of the batch validation, overridden by the DEMISTO_MDX_PARSERS env var
+MAX_MDX_PARSERS = 8
+
+
+class MdxServerPool:
+    """A pool of mdx-parse-server.js processes, each one listening on a free port.
+
+    The READMEs are sent to the servers concurrently, every thread keeps its own keep-alive connection to one of
+    the servers, so the parsing is spread over the node processes and doesn't wait for a connection per README.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.processes: List[subprocess.Popen] = []
+        self.ports: List[int] = []
+        self._servers_counter = itertools.count()
+        self._thread_data = local()
+
+    def start(self):
+        self.grow(self.size)
+
+    def grow(self, size: int):
+        """Starts more servers, so there are at least size servers in the pool.
+        If a server fails to start, the new servers are stopped and the running ones are kept."""
+        mdx_parse_server = Path(__file__).parent.parent / 'mdx-parse-server.js'
+        processes = [subprocess.Popen(['node', str(mdx_parse_server), '0'], stdout=subprocess.PIPE, text=True)
+                     for _ in range(size - len(self.processes))]
+        ports = []
+        for process in processes:
+            line = process.stdout.readline()  # type: ignore
+            match = MDX_SERVER_LISTENING_REGEX.search(line)
+            if not match:
+                for new_process in processes:
+                    new_process.terminate()
+                raise Exception(f'Failed starting mdx server. stdout: {line}.')
+            ports.append(int(match.group(1)))
+        self.processes.extend(processes)
+        self.ports.extend(ports)
+        self.size = len(self.processes)
+
+    def stop(self):
+        for process in self.processes:
+            process.terminate()
+        self.processes = []
+        self.ports = []
+
+    def parse(self, readme_content: str) -> Optional[str]:
+        """Parses the mdx of a README with the server of the current thread.
+
+        Returns:
+            str. the mdx parse error, an empty string if the README is valid, or None if the server didn't respond.
+        """
+        if not hasattr(self._thread_data, 'session'):
+            self._thread_data.session = requests.Session()
+            self._thread_data.port = self.ports[next(self._servers_counter) % len(self.ports)]
+        try:
+            response = self._thread_data.session.post(f'http://localhost:{self._thread_data.port}',
+                                                      data=readme_content.encode('utf-8'), timeout=10)
+        except requests.exceptions.RequestException:
+            return None
+        if response.status_code != 200:
+            return response.text or f'MDX server responded with status code {response.status_code}'
+        return ''
+
 
 class ReadMeValidator(BaseValidator):
     """ReadMeValidator is a validator for readme.md files
@@ -35,14 +112,19 @@ class ReadMeValidator(BaseValidator):
     # Static var to hold the mdx server process
     _MDX_SERVER_PROCESS: Optional[subprocess.Popen] = None
     _MDX_SERVER_LOCK = Lock()
+    # Static var to hold the mdx servers pool of the batch validation
+    _MDX_SERVER_POOL: Optional[MdxServerPool] = None
 
-    def __init__(self, file_path: str, ignored_errors=None, print_as_warnings=False, suppress_print=False):
+    def __init__(self, file_path: str, ignored_errors=None, print_as_warnings=False, suppress_print=False,
+                 mdx_results: Optional[Dict[str, str]] = None):
         super().__init__(ignored_errors=ignored_errors, print_as_warnings=print_as_warnings,
                          suppress_print=suppress_print)
         self.content_path = get_content_path()
         self.file_path = Path(file_path)
         self.pack_path = self.file_path.parent
         self.node_modules_path = self.content_path / Path('node_modules')
+        # the mdx parse errors of the READMEs verified in batch, see verify_mdx_files
+        self.mdx_results = mdx_results or {}
 
     def is_valid_file(self) -> bool:
         """Check whether the readme file is valid or not
@@ -85,33 +167,89 @@ class ReadMeValidator(BaseValidator):
         return True
 
     def is_mdx_file(self) -> bool:
-        html = self.is_html_doc()
-        valid = os.environ.get('DEMISTO_README_VALIDATION') or os.environ.get('CI') or self.are_modules_installed_for_verify(self.content_path)
-        if valid and not html:
-            # add to env var the directory of node modules
-            os.environ['NODE_PATH'] = str(self.node_modules_path) + os.pathsep + os.getenv("NODE_PATH", "")
+        if self.should_verify_mdx():
+            mdx_error = self.mdx_results.get(str(self.file_path))
+            if mdx_error is not None:
+                if mdx_error:
+                    error_message, error_code = Errors.readme_error(mdx_error)
+                    if self.handle_error(error_message, error_code, file_path=self.file_path):
+                        return False
+                return True
+
+            self.add_node_modules_to_node_path()
             if os.getenv('DEMISTO_MDX_CMD_VERIFY'):
                 return self.mdx_verify()
             else:
                 return self.mdx_verify_server()
         return True
 
+    def should_verify_mdx(self) -> bool:
+        """Whether the README should be parsed as mdx - it is not an html doc, and the node modules are available."""
+        return self.is_mdx_verify_available() and not self.is_html_doc()
+
+    def is_mdx_verify_available(self) -> bool:
+        return bool(os.environ.get('DEMISTO_README_VALIDATION') or os.environ.get('CI') or
+                    self.are_modules_installed_for_verify(self.content_path))
+
+    def add_node_modules_to_node_path(self):
+        # add to env var the directory of node modules
+        os.environ['NODE_PATH'] = str(self.node_modules_path) + os.pathsep + os.getenv("NODE_PATH", "")
+
     @staticmethod
     def fix_mdx(txt: str) -> str:
-        # copied from: https://github.com/demisto/content-docs/blob/2402bd1ab1a71f5bf1a23e1028df6ce3b2729cbb/content-repo/mdx_utils.py#L11
-        # to use the same logic as we have in the content-docs build
-        replace_tuples = [
-            ('<br>(?!</br>)', '<br/>'),
-            ('<hr>(?!</hr>)', '<hr/>'),
-            ('<pre>', '<pre>{`'),
-            ('</pre>', '`}</pre>'),
-        ]
-        for old, new in replace_tuples:
-            txt = re.sub(old, new, txt, flags=re.IGNORECASE)
+        for regex, new in MDX_FIXES:
+            txt = regex.sub(new, txt)
         # remove html comments
-        txt = re.sub(r'<\!--.*?-->', '', txt, flags=re.DOTALL)
+        txt = HTML_COMMENT_REGEX.sub('', txt)
         return txt
 
+    @staticmethod
+    def verify_mdx_files(file_paths: Iterable[str], parsers: Optional[int] = None) -> Dict[str, str]:
+        """Parses the mdx of the given READMEs concurrently, with a pool of mdx servers.
+
+        Args:
+            file_paths: the paths of the READMEs.
+            parsers: the number of mdx servers in the pool, by default the DEMISTO_MDX_PARSERS env var or the number
+                of CPUs (up to MAX_MDX_PARSERS). The pool is started once with a server per README (up to parsers),
+                and grows when a later batch has more READMEs.
+
+        Returns:
+            Dict[str, str]. the mdx parse error of every parsed README by its path, an empty string if it is valid.
+            The READMEs which are not in the results are verified one by one by the validator.
+        """
+        readme_paths = [Path(file_path) for file_path in file_paths]
+        if not readme_paths or os.getenv('DEMISTO_MDX_CMD_VERIFY'):
+            return {}
+        try:
+            readme_validator = ReadMeValidator(str(readme_paths[0]), suppress_print=True)
+            if not readme_validator.is_mdx_verify_available():
+                return {}
+        except Exception:
+            # the errors are reported when the READMEs are validated one by one
+            return {}
+        readme_paths = [readme_path for readme_path in readme_paths if not ReadMeValidator.is_html_file(readme_path)]
+        if not readme_paths:
+            return {}
+
+        readme_validator.add_node_modules_to_node_path()
+        parsers = parsers or int(os.getenv('DEMISTO_MDX_PARSERS') or 0) or min(os.cpu_count() or 1, MAX_MDX_PARSERS)
+        try:
+            pool = ReadMeValidator.start_mdx_server_pool(min(parsers, len(readme_paths)))
+        except Exception as exc:
+            print_warning(f'Could not start the mdx servers, the READMEs will be verified one by one: {exc}')
+            return {}
+
+        readmes_contents = []
+        for readme_path in readme_paths:
+            with open(readme_path, 'r') as f:
+                readmes_contents.append(ReadMeValidator.fix_mdx(f.read()))
+        # twice the servers threads, so a server parses a README while the next one is sent to it
+        with ThreadPoolExecutor(max_workers=2 * pool.size) as executor:
+            mdx_errors = list(executor.map(pool.parse, readmes_contents))
+
+        return {str(readme_path): mdx_error
+                for readme_path, mdx_error in zip(readme_paths, mdx_errors) if mdx_error is not None}
+
     @staticmethod
     @lru_cache(None)
     def are_modules_installed_for_verify(content_path: str) -> bool:
@@ -146,8 +284,12 @@ class ReadMeValidator(BaseValidator):
         return valid
 
     def is_html_doc(self) -> bool:
+        return self.is_html_file(self.file_path)
+
+    @staticmethod
+    def is_html_file(file_path: Path) -> bool:
         txt = ''
-        with open(self.file_path, 'r') as f:
+        with open(file_path, 'r') as f:
             txt = f.read(4096).strip()
         if txt.startswith(NO_HTML):
             return False
@@ -183,11 +325,30 @@ class ReadMeValidator(BaseValidator):
                     ReadMeValidator.stop_mdx_server()
                     raise Exception(f'Failed starting mdx server. stdout: {line}.')
 
+    @staticmethod
+    def start_mdx_server_pool(size: int) -> MdxServerPool:
+        """Starts the mdx servers pool, or grows the running one to at least size servers."""
+        with ReadMeValidator._MDX_SERVER_LOCK:
+            if not ReadMeValidator._MDX_SERVER_POOL:
+                pool = MdxServerPool(size)
+                pool.start()
+                ReadMeValidator._MDX_SERVER_POOL = pool
+            elif ReadMeValidator._MDX_SERVER_POOL.size < size:
+                try:
+                    ReadMeValidator._MDX_SERVER_POOL.grow(size)
+                except Exception as exc:
+                    print_warning(f'Could not start more mdx servers, using the '
+                                  f'{ReadMeValidator._MDX_SERVER_POOL.size} running ones: {exc}')
+            return ReadMeValidator._MDX_SERVER_POOL
+
     @staticmethod
     def stop_mdx_server():
         if ReadMeValidator._MDX_SERVER_PROCESS:
             ReadMeValidator._MDX_SERVER_PROCESS.terminate()
             ReadMeValidator._MDX_SERVER_PROCESS = None
+        if ReadMeValidator._MDX_SERVER_POOL:
+            ReadMeValidator._MDX_SERVER_POOL.stop()
+            ReadMeValidator._MDX_SERVER_POOL = None
 
 
 atexit.register(ReadMeValidator.stop_mdx_server)
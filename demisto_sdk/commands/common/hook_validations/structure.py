@@ -8,6 +8,7 @@ import os
 import re
 from typing import Optional, Tuple
 
+import pykwalify
 import yaml
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.constants import (
@@ -16,12 +17,60 @@ from demisto_sdk.commands.common.constants import (
 from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
-from demisto_sdk.commands.common.tools import (get_content_file_type_dump,
+from demisto_sdk.commands.common.tools import (DOCUMENT_CACHE,
+                                               get_content_file_type_dump,
                                                get_remote_file,
                                                is_file_path_in_pack)
 from demisto_sdk.commands.format.format_constants import \
     OLD_FILE_DEFAULT_1_FROMVERSION
+from pykwalify.compat import yml
 from pykwalify.core import Core
+from pykwalify.rule import Rule
+
+COMPILED_SCHEMAS = {}  # type: dict
+
+
+def get_compiled_schema(schema_path: str) -> tuple:
+    """Loads a pykwalify schema and builds its rules, once per process.
+
+    Args:
+        schema_path (str): path of the schema file.
+
+    Returns:
+        tuple. The schema data, its root rule and its partial schemas rules by name.
+    """
+    if schema_path not in COMPILED_SCHEMAS:
+        with open(schema_path, 'r') as schema_file:
+            schema = yml.load(schema_file)
+
+        root_schema = {}
+        partial_rules = {}
+        for key, value in schema.items():
+            if key.startswith('schema;'):
+                partial_rules[key.split(';', 1)[1]] = Rule(schema=value)
+            else:
+                root_schema[key] = value
+
+        COMPILED_SCHEMAS[schema_path] = (schema, Rule(schema=root_schema), partial_rules)
+
+    return COMPILED_SCHEMAS[schema_path]
+
+
+class CompiledSchemaCore(Core):
+    """A pykwalify Core which validates against the precompiled rules of the schema,
+    instead of re-reading the schema file and re-building its rules for every validated file.
+    """
+
+    def __init__(self, schema_path: str, **kwargs):
+        schema, self.compiled_root_rule, self.partial_rules = get_compiled_schema(schema_path)
+        super().__init__(schema_data=schema, **kwargs)
+
+    def _start_validate(self, value=None):
+        self.errors = []
+        # partial schemas are looked up by name on validation, and different schemas use the same names
+        pykwalify.partial_schemas.update(self.partial_rules)
+        self.root_rule = self.compiled_root_rule
+        self._validate(value, self.root_rule, '', [])
 
 
 class StructureValidator(BaseValidator):
@@ -67,7 +116,7 @@ class StructureValidator(BaseValidator):
             self.old_file = {}
         else:
             self.old_file = get_remote_file(old_file_path if old_file_path else file_path, tag=tag,
-                                            suppress_print=suppress_print)
+                                            suppress_print=suppress_print, old_version=True)
         self.configuration = configuration
 
     def is_valid_file(self):
@@ -132,9 +181,15 @@ class StructureValidator(BaseValidator):
             scheme_file_name = 'integration' if self.scheme_name.value == 'betaintegration' else self.scheme_name.value  # type: ignore
             path = os.path.normpath(
                 os.path.join(__file__, "..", "..", self.SCHEMAS_PATH, '{}.yml'.format(scheme_file_name)))
-            core = Core(source_file=self.file_path,
-                        schema_files=[path])
-            core.validate(raise_exception=True)
+            if self.current_file and isinstance(self.current_file, dict):
+                source_data = self.current_file
+                if self.file_path.endswith('.yml'):
+                    # The file was loaded as YAML 1.1 and pykwalify loads it as YAML 1.2, which reads some
+                    # scalars (e.g. yes/no) differently - validate it as pykwalify would have loaded it.
+                    source_data = DOCUMENT_CACHE.load(self.file_path, yml.load)
+                CompiledSchemaCore(path, source_data=source_data).validate(raise_exception=True)
+            else:
+                CompiledSchemaCore(path, source_file=self.file_path).validate(raise_exception=True)
         except Exception as err:
             try:
                 error_message, error_code = self.parse_error_msg(err)
@@ -254,9 +309,7 @@ class StructureValidator(BaseValidator):
         if file_extension in ACCEPTED_FILE_EXTENSIONS:
             if file_extension in self.FILE_SUFFIX_TO_LOAD_FUNCTION:
                 load_function = self.FILE_SUFFIX_TO_LOAD_FUNCTION[file_extension]
-                with open(self.file_path, 'r') as file_obj:
-                    loaded_file_data = load_function(file_obj)  # type: ignore
-                    return loaded_file_data
+                return DOCUMENT_CACHE.load(self.file_path, load_function)  # type: ignore
 
             # Ignore loading image and markdown
             elif file_extension in ['.png', '.md']:
@@ -0,0 +1,194 @@
+"""Compact SQLite storage of the id_set.
+
+The JSON id_set has to be parsed as a whole, even when a command needs a single section of it.
+The SQLite id_set stores every item in its own row, indexed by section and id, so a single section or a
+single id can be read without parsing the rest of the file.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+from collections.abc import Mapping
+from contextlib import suppress
+from pathlib import Path
+from typing import Optional
+
+ID_SET_DB_VERSION = 2
+ID_SET_DB_EXTENSIONS = ('.db', '.sqlite')
+SQLITE_HEADER = b'SQLite format 3\x00'
+
+
+def get_item_hash(section: str, item: dict) -> str:
+    """Returns a hash of the id_set item which doesn't depend on the order of its keys."""
+    return hashlib.sha1(f'{section}:{json.dumps(item, sort_keys=True)}'.encode()).hexdigest()
+
+
+def is_sqlite_id_set(id_set_path: str) -> bool:
+    """Checks whether the file in the given path is an SQLite id_set (rather than a JSON one)."""
+    try:
+        with open(id_set_path, 'rb') as id_set_file:
+            return id_set_file.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    except IOError:
+        return False
+
+
+class SQLiteIDSet(Mapping):
+    """A read only id_set which is backed by an SQLite id_set file.
+
+    Behaves like the id_set dict: `id_set['scripts']` returns the list of the scripts section items.
+    Each section is read and parsed only on its first access.
+    """
+
+    def __init__(self, id_set_path: str):
+        self.id_set_path = id_set_path
+        self._connection_pid = None  # type: Optional[int]
+        self._process_connection = None  # type: Optional[sqlite3.Connection]
+        metadata = dict(self._connection.execute('SELECT key, value FROM metadata'))
+        if int(metadata.get('version', 0)) != ID_SET_DB_VERSION:
+            raise ValueError(f'{id_set_path} is an SQLite id_set of an unsupported version '
+                             f'({metadata.get("version")}), re-create it with `demisto-sdk create-id-set`.')
+        self._section_names = json.loads(metadata['sections'])
+        self._sections = {}  # type: dict
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        # a connection must not be used across a fork, so a forked process (e.g. a validation worker) opens its own
+        if self._process_connection is None or self._connection_pid != os.getpid():
+            self._process_connection = sqlite3.connect(Path(self.id_set_path).resolve().as_uri() + '?mode=ro',
+                                                       uri=True)
+            self._connection_pid = os.getpid()
+        return self._process_connection
+
+    def __reduce__(self):
+        return self.__class__, (self.id_set_path,)
+
+    def __getitem__(self, section):
+        if section not in self._sections:
+            if section not in self._section_names:
+                raise KeyError(section)
+            rows = self._connection.execute('SELECT data FROM items WHERE section = ? ORDER BY position', (section,))
+            self._sections[section] = json.loads('[' + ','.join(data for data, in rows) + ']')
+        return self._sections[section]
+
+    def __iter__(self):
+        return iter(self._section_names)
+
+    def __len__(self):
+        return len(self._section_names)
+
+    def get_items_hashes(self, section: str) -> list:
+        """Returns the hash of every item of the given section (see get_item_hash), without parsing the items."""
+        rows = self._connection.execute('SELECT item_hash FROM items WHERE section = ? ORDER BY position', (section,))
+        return [item_hash for item_hash, in rows]
+
+    def get_section(self, section: str) -> 'SQLiteIDSetSection':
+        """Returns a view of the given section for lookups by id, which doesn't read the section."""
+        return SQLiteIDSetSection(self, section)
+
+    def get_by_id(self, section: str, item_id: str) -> list:
+        """Returns the items of the given section with the given id, without reading the rest of the section."""
+        if section in self._sections:
+            return [item for item in self._sections[section] if item_id in item]
+        rows = self._connection.execute('SELECT data FROM items WHERE section = ? AND item_id = ? ORDER BY position',
+                                        (section, item_id))
+        return [json.loads(data) for data, in rows]
+
+    def close(self):
+        if self._process_connection is not None and self._connection_pid == os.getpid():
+            self._process_connection.close()
+        self._process_connection = None
+
+
+class SQLiteIDSetSection:
+    """A section of an SQLite id_set which is looked up by id, like an IDSetSection, without reading the section."""
+
+    def __init__(self, id_set: SQLiteIDSet, section: str):
+        self.id_set = id_set
+        self.section = section
+
+    def get_by_id(self, item_id: str) -> list:
+        return self.id_set.get_by_id(self.section, item_id)
+
+
+def write_sqlite_id_set(id_set: Mapping, id_set_path: str):
+    """Writes the id_set to an SQLite id_set file, replacing the file if it exists.
+
+    Args:
+        id_set (dict): the id_set.
+        id_set_path (str): path of the SQLite id_set file.
+    """
+    directory = os.path.dirname(id_set_path) or '.'
+    temp_fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f'{os.path.basename(id_set_path)}.', suffix='.tmp')
+    os.close(temp_fd)
+    try:
+        connection = sqlite3.connect(temp_path)
+        try:
+            with connection:
+                connection.execute('CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+                connection.execute('CREATE TABLE items (section TEXT NOT NULL, position INTEGER NOT NULL, '
+                                   'item_id TEXT NOT NULL, item_hash TEXT NOT NULL, data TEXT NOT NULL, '
+                                   'PRIMARY KEY (section, position))')
+                connection.execute('CREATE INDEX items_by_id ON items (section, item_id)')
+                connection.executemany('INSERT INTO metadata VALUES (?, ?)', [
+                    ('version', str(ID_SET_DB_VERSION)),
+                    ('sections', json.dumps(list(id_set))),
+                ])
+                for section, items in id_set.items():
+                    connection.executemany('INSERT INTO items VALUES (?, ?, ?, ?, ?)', (
+                        (section, position, next(iter(item)), get_item_hash(section, item), json.dumps(item))
+                        for position, item in enumerate(items)
+                    ))
+        finally:
+            connection.close()
+        os.replace(temp_path, id_set_path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+
+def load_id_set(id_set_path: str) -> Mapping:
+    """Loads an id_set file of either format. SQLite id_sets are loaded lazily, section by section.
+
+    Args:
+        id_set_path (str): path of a JSON or an SQLite id_set file.
+
+    Returns:
+        dict. The id_set.
+    """
+    if is_sqlite_id_set(id_set_path):
+        return SQLiteIDSet(id_set_path)
+
+    with open(id_set_path, 'r') as id_set_file:
+        return json.load(id_set_file)
+
+
+def save_id_set(id_set: Mapping, id_set_path: str):
+    """Saves the id_set as SQLite if the path has an SQLite extension (.db, .sqlite), otherwise as JSON.
+
+    Args:
+        id_set (dict): the id_set.
+        id_set_path (str): path of the id_set file.
+    """
+    if id_set_path.lower().endswith(ID_SET_DB_EXTENSIONS):
+        write_sqlite_id_set(id_set, id_set_path)
+    else:
+        with open(id_set_path, 'w', encoding='utf-8') as id_set_file:
+            json.dump(dict(id_set), id_set_file, indent=4)
+
+
+def convert_id_set(input_path: str, output_path: str):
+    """Converts an id_set file from JSON to SQLite or from SQLite to JSON, according to the input file format.
+
+    Args:
+        input_path (str): path of the id_set file to convert.
+        output_path (str): path of the converted id_set file.
+    """
+    id_set = load_id_set(input_path)
+    if isinstance(id_set, SQLiteIDSet):
+        with open(output_path, 'w', encoding='utf-8') as id_set_file:
+            json.dump(dict(id_set), id_set_file, indent=4)
+        id_set.close()
+    else:
+        write_sqlite_id_set(id_set, output_path)
@@ -6,6 +6,7 @@ function requestHandler(req, res) {
     if (req.method != 'POST') {
         res.statusCode = 405
         res.end('Only POST is supported')
+        return
     }
     let body = ''
     req.setEncoding('utf8');
@@ -25,10 +26,12 @@ function requestHandler(req, res) {
 }
 
 const server = http.createServer(requestHandler);
+// the port to listen on, 0 listens on a free port - the port is printed once listening
+const port = process.argv.length > 2 ? Number(process.argv[2]) : 6161
 
-server.listen(6161, (err) => {
+server.listen(port, (err) => {
     if (err) {
         return console.log('MDX server failed starting.', err)
     }
-    console.log(`MDX server is listening on port: 6161`)
+    console.log(`MDX server is listening on port: ${server.address().port}`)
 });
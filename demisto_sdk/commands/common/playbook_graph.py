@@ -0,0 +1,98 @@
+"""Flow graph of the tasks of a playbook.
+
+Every task of a playbook points to its next tasks through the branches of its `nexttasks`.
+The graph is built once from the playbook dict as adjacency lists, and answers the reachability,
+mandatory tasks and orphan tasks queries of `create-id-set` and `validate` in linear time.
+"""
+from collections import deque
+from typing import Dict, List, Optional, Set
+
+from demisto_sdk.commands.common.tools import print_warning
+
+
+class PlaybookTasksGraph:
+    """The tasks flow graph of a playbook.
+
+    A task is reachable if there is a path to it from the start task.
+    A task is mandatory if there is a path to it from the start task which passes only through tasks that
+    can't be skipped (tasks without `skipunavailable`), the start task is always mandatory.
+    """
+
+    def __init__(self, playbook_data: dict):
+        self.playbook_id = playbook_data.get('id')
+        self.start_task_id = playbook_data.get('starttaskid', '')
+        self.tasks: Dict = playbook_data.get('tasks') or {}
+
+        self.next_tasks: Dict[str, List[str]] = {}
+        self.referenced_tasks: Set[str] = set()
+        self.condition_tasks: List[str] = []
+        for task_id, task in self.tasks.items():
+            next_task_ids: List[str] = []
+            for branch_next_task_ids in (task.get('nexttasks') or {}).values():
+                if branch_next_task_ids:
+                    next_task_ids.extend(branch_next_task_ids)
+            self.next_tasks[task_id] = next_task_ids
+            self.referenced_tasks.update(next_task_ids)
+            if task.get('type') == 'condition':
+                self.condition_tasks.append(task_id)
+
+        self._reachable_tasks: Optional[Set[str]] = None
+        self._mandatory_tasks: Optional[Set[str]] = None
+
+    def _bfs(self, follow_skippable: bool) -> Set[str]:
+        """Collects the tasks which are reachable from the start task.
+
+        Args:
+            follow_skippable (bool): whether to pass through tasks which can be skipped.
+
+        Returns:
+            set. the ids of the reachable tasks.
+        """
+        if self.start_task_id not in self.tasks:
+            # In this case the playbook is invalid, starttaskid contains invalid task id.
+            if follow_skippable:
+                print_warning(f'{self.playbook_id}: No such task {self.start_task_id} in playbook')
+            return set()
+
+        visited = {self.start_task_id}
+        queue = deque([self.start_task_id])
+        while queue:
+            for next_task_id in self.next_tasks[queue.popleft()]:
+                if next_task_id in visited:
+                    continue
+                next_task = self.tasks.get(next_task_id)
+                if not next_task:
+                    if follow_skippable:
+                        print_warning(f'{self.playbook_id}: No such task {next_task_id} in playbook')
+                    continue
+                if not follow_skippable and next_task.get('skipunavailable', False):
+                    continue
+                visited.add(next_task_id)
+                queue.append(next_task_id)
+
+        return visited
+
+    @property
+    def reachable_tasks(self) -> Set[str]:
+        """The ids of the tasks which are reachable from the start task."""
+        if self._reachable_tasks is None:
+            self._reachable_tasks = self._bfs(follow_skippable=True)
+        return self._reachable_tasks
+
+    @property
+    def mandatory_tasks(self) -> Set[str]:
+        """The ids of the tasks which are reachable from the start task without passing through skippable tasks."""
+        if self._mandatory_tasks is None:
+            self._mandatory_tasks = self._bfs(follow_skippable=False)
+        return self._mandatory_tasks
+
+    def is_reachable(self, task_id: str) -> bool:
+        return task_id in self.reachable_tasks
+
+    def is_mandatory(self, task_id: str) -> bool:
+        return task_id in self.mandatory_tasks
+
+    def get_orphan_tasks(self) -> Set[str]:
+        """Returns the ids of the tasks, other than the start task, which are not the next task of any task."""
+        return {task_id for task_id in self.tasks
+                if task_id != self.start_task_id and task_id not in self.referenced_tasks}
@@ -1,5 +1,12 @@
+import json
 import os
+import time
+from multiprocessing import cpu_count
 
+import pytest
+import yaml
+from demisto_sdk.commands.common import update_id_set
+from demisto_sdk.commands.common.git_tools import git_path
 from demisto_sdk.commands.common.update_id_set import ID_SET_ENTITIES
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
 from TestSuite.test_tools import ChangeCWD
@@ -28,3 +35,62 @@ def test_create_id_set_flow(repo, mocker):
             assert len(entity_content_in_id_set) == number_of_packs_to_create
         else:
             assert len(entity_content_in_id_set) == number_of_packs_to_create * 2
+
+
+BENCHMARK_PACKS = int(os.getenv('DEMISTO_SDK_ID_SET_BENCHMARK_PACKS', 0))
+BENCHMARK_FILES = {
+    'Integrations': 'integration-test.yml',
+    'Scripts': 'fake-script.yml',
+    'Playbooks': 'format_playbook.yml',
+    'TestPlaybooks': 'format_test_playbook.yml',
+    'IncidentFields': 'incidentfield-valid.json',
+    'IncidentTypes': 'incidenttype-valid.json',
+    'IndicatorFields': 'indicatorfield-valid.json',
+    'IndicatorTypes': 'format_indicatortype-copy.json',
+    'Layouts': 'format_layout-copy.json',
+    'Classifiers': 'format_new_classifier.json',
+    'Dashboards': 'dashboard-valid.json',
+    'Reports': 'format_report.json',
+    'Widgets': 'format_widget.json',
+}
+
+
+@pytest.mark.skipif(not BENCHMARK_PACKS, reason='Set DEMISTO_SDK_ID_SET_BENCHMARK_PACKS to run the id_set benchmark')
+def test_create_id_set_benchmark(tmp_path, mocker, capsys):
+    """
+    Given
+    - a content repo with DEMISTO_SDK_ID_SET_BENCHMARK_PACKS packs, each containing one file of every entity
+
+    When
+    - creating the id_set
+
+    Then
+    - report the wall-clock time and the CPU utilisation of the id_set creation
+    """
+    test_files_dir = os.path.join(git_path(), 'demisto_sdk', 'tests', 'test_files')
+    for entity, file_name in BENCHMARK_FILES.items():
+        with open(os.path.join(test_files_dir, file_name)) as f:
+            data = yaml.safe_load(f) if file_name.endswith('.yml') else json.load(f)
+        for pack_index in range(BENCHMARK_PACKS):
+            item_id = f'{entity}_{pack_index}'
+            if 'commonfields' in data:
+                data['commonfields']['id'] = item_id
+            else:
+                data['id'] = item_id
+            data['name'] = item_id
+            entity_dir = tmp_path / 'Packs' / f'pack_{pack_index}' / entity
+            entity_dir.mkdir(parents=True, exist_ok=True)
+            with open(entity_dir / f'{entity.lower()}-{item_id}{os.path.splitext(file_name)[1]}', 'w') as f:
+                yaml.safe_dump(data, f) if file_name.endswith('.yml') else json.dump(data, f)
+    mocker.patch.object(update_id_set, 'find_duplicates', return_value=[])
+
+    start_wall_time, start_times = time.time(), os.times()
+    with ChangeCWD(str(tmp_path)):
+        id_set = IDSetCreator(output=None, print_logs=False).create_id_set()
+    wall_time, end_times = time.time() - start_wall_time, os.times()
+    cpu_time = sum(end - start for start, end in zip(start_times[:4], end_times[:4]))
+
+    assert sum(len(items) for items in id_set.values()) == BENCHMARK_PACKS * len(BENCHMARK_FILES)
+    with capsys.disabled():
+        print(f'\nid_set creation of {BENCHMARK_PACKS} packs: wall-clock {wall_time:.2f}s, CPU {cpu_time:.2f}s, '
+              f'utilisation {100 * cpu_time / (wall_time * cpu_count()):.0f}% of {cpu_count()} cores')
@@ -1,12 +1,17 @@
+import json
 import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch
 
 import mock
 import pytest
 from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.git_tools import git_path
-from demisto_sdk.commands.common.hook_validations.docker import \
-    DockerImageValidator
+from demisto_sdk.commands.common.hook_validations.docker import (
+    DOCKER_TAGS_CACHE_TTL, DockerImageValidator, DockerTagsCache,
+    get_yml_docker_image_name)
 from demisto_sdk.commands.common.tools import get_yaml
 
 RETURN_ERROR_TARGET = 'GetDockerImageLatestTag.return_error'
@@ -334,3 +339,119 @@ class TestDockerImage:
         assert validator.is_valid is False
         assert error in captured.out
         assert code in captured.out
+
+
+@pytest.mark.parametrize('yml_data, docker_image_name', [
+    ({'script': {'dockerimage': 'demisto/pyjwt:1.0', 'subtype': 'python3'}}, 'demisto/pyjwt'),
+    ({'script': 'code', 'dockerimage': 'demisto/stix2:1.0.0.204'}, 'demisto/stix2'),
+    ({'script': {'subtype': 'python3'}}, 'demisto/python3'),
+    ({'script': ''}, 'demisto/python'),
+    ({'dockerimage': 'other/image:1.0'}, ''),
+])
+def test_get_yml_docker_image_name(yml_data, docker_image_name):
+    assert get_yml_docker_image_name(yml_data) == docker_image_name
+
+
+class TestDockerTagsCache:
+    class HubStandIn(BaseHTTPRequestHandler):
+        """A local docker hub which serves one tag for every docker image, and records the concurrent requests."""
+        lock = threading.Lock()
+        requests = []
+        active_requests = 0
+        max_active_requests = 0
+
+        def do_GET(self):
+            cls = type(self)
+            with cls.lock:
+                cls.requests.append(self.path)
+                cls.active_requests += 1
+                cls.max_active_requests = max(cls.max_active_requests, cls.active_requests)
+            time.sleep(0.05)
+            image_name = self.path[len('/v2/repositories/'):-len('/tags')]
+            body = json.dumps({'results': [{'name': f'{image_name}-1.0', 'last_updated': '2020-10-23T09:13:30.84299Z'}]})
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.end_headers()
+            self.wfile.write(body.encode())
+            with cls.lock:
+                cls.active_requests -= 1
+
+        def log_message(self, *args):
+            pass
+
+    def test_prefetch(self, mocker):
+        """
+        Given
+        - 300 integrations which use 40 docker images, and a local docker hub.
+
+        When
+        - Prefetching the docker images tags, and then getting the tag of every integration.
+
+        Then
+        - Ensure every docker image is looked up once, and the lookups run concurrently.
+        - Ensure getting the tags after the prefetch doesn't send any request.
+        """
+        server = ThreadingHTTPServer(('127.0.0.1', 0), self.HubStandIn)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            cache = DockerTagsCache(hub_url=f'http://127.0.0.1:{server.server_address[1]}')
+            docker_images = [f'demisto/image{i % 40}' for i in range(300)]
+
+            cache.prefetch(docker_images)
+            assert len(self.HubStandIn.requests) == 40
+            assert self.HubStandIn.max_active_requests > 1
+
+            assert [cache.get_latest_tag(image) for image in docker_images] == [f'{image}-1.0'
+                                                                                for image in docker_images]
+            assert len(self.HubStandIn.requests) == 40
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_persistent_cache(self, requests_mock, tmp_path, monkeypatch):
+        """
+        Given
+        - A docker image tag which was looked up in a previous run.
+
+        When
+        - Getting the tag in a new run, before and after the cache TTL.
+
+        Then
+        - Ensure the tag is read from the cache file without a request before the TTL.
+        - Ensure after the TTL the tag is revalidated with its ETag, and kept if the tags didn't change.
+        """
+        monkeypatch.setenv('DEMISTO_SDK_CACHE_DIR', str(tmp_path))
+        tags_request = requests_mock.get('https://hub.docker.com/v2/repositories/demisto/python3/tags',
+                                         json={'results': MOCK_TAG_LIST}, headers={'ETag': '"tags"'})
+        assert DockerTagsCache().get_latest_tag('demisto/python3') == '1.0.0.2876'
+
+        assert DockerTagsCache().get_latest_tag('demisto/python3') == '1.0.0.2876'
+        assert tags_request.call_count == 1
+
+        now = time.time()
+        monkeypatch.setattr(time, 'time', lambda: now + 2 * DOCKER_TAGS_CACHE_TTL)
+        requests_mock.get('https://hub.docker.com/v2/repositories/demisto/python3/tags', status_code=304)
+        assert DockerTagsCache().get_latest_tag('demisto/python3') == '1.0.0.2876'
+        assert requests_mock.last_request.headers['If-None-Match'] == '"tags"'
+
+    def test_failed_lookup(self, requests_mock, mocker):
+        """
+        Given
+        - A docker image which can't be looked up.
+
+        When
+        - Prefetching the docker image tag, and then getting the tag twice.
+
+        Then
+        - Ensure the lookup error is raised when getting the tag, and the docker hub is requested once.
+        """
+        mocker.patch.object(DockerImageValidator, 'docker_auth', return_value='auth')
+        tags_request = requests_mock.get('https://hub.docker.com/v2/repositories/demisto/error/tags', status_code=404)
+        requests_mock.get('https://registry-1.docker.io/v2/demisto/error/tags/list', status_code=404)
+        cache = DockerTagsCache()
+
+        cache.prefetch(['demisto/error'])
+        for _ in range(2):
+            with pytest.raises(Exception):
+                cache.get_latest_tag('demisto/error')
+        assert tags_request.call_count == 1
@@ -0,0 +1,125 @@
+import json
+import os
+import pickle
+
+import pytest
+from demisto_sdk.commands.common.id_set_db import (SQLiteIDSet, convert_id_set,
+                                                   get_item_hash,
+                                                   is_sqlite_id_set,
+                                                   load_id_set, save_id_set)
+
+ID_SET = {
+    'scripts': [
+        {'ScriptFoo': {'name': 'ScriptFoo', 'pack': 'Foo', 'toversion': '5.9.9'}},
+        {'ScriptFoo': {'name': 'ScriptFoo', 'pack': 'Foo', 'fromversion': '6.0.0'}},
+        {'ScriptBar': {'name': 'ScriptBar', 'pack': 'Bar'}},
+    ],
+    'integrations': [
+        {'Foo': {'name': 'Foo', 'pack': 'Foo', 'commands': ['foo-get']}},
+    ],
+    'playbooks': [],
+}
+
+
+@pytest.fixture
+def sqlite_id_set_path(tmp_path):
+    id_set_path = str(tmp_path / 'id_set.db')
+    save_id_set(ID_SET, id_set_path)
+    return id_set_path
+
+
+def test_save_id_set__by_extension(tmp_path, sqlite_id_set_path):
+    """
+    Given
+    - an id_set
+
+    When
+    - saving it to a .db path and to a .json path
+
+    Then
+    - ensure the .db file is an SQLite id_set and the .json file is a JSON id_set
+    """
+    json_id_set_path = str(tmp_path / 'id_set.json')
+    save_id_set(ID_SET, json_id_set_path)
+
+    assert is_sqlite_id_set(sqlite_id_set_path)
+    assert not is_sqlite_id_set(json_id_set_path)
+    with open(json_id_set_path) as id_set_file:
+        assert json.load(id_set_file) == ID_SET
+
+
+def test_load_id_set__lazy_sections(sqlite_id_set_path):
+    """
+    Given
+    - an SQLite id_set
+
+    When
+    - loading it and accessing a single section
+
+    Then
+    - ensure only the accessed section is parsed
+    - ensure the sections and their items order are kept
+    - ensure a single id can be looked up without reading its section
+    - ensure the items hashes are read without reading their section
+    """
+    id_set = load_id_set(sqlite_id_set_path)
+
+    assert isinstance(id_set, SQLiteIDSet)
+    assert id_set.get('integrations') == ID_SET['integrations']
+    assert list(id_set._sections) == ['integrations']
+    assert id_set.get_by_id('scripts', 'ScriptFoo') == ID_SET['scripts'][:2]
+    assert id_set.get_section('scripts').get_by_id('ScriptBar') == ID_SET['scripts'][2:]
+    assert id_set.get_items_hashes('scripts') == [get_item_hash('scripts', item) for item in ID_SET['scripts']]
+    assert list(id_set._sections) == ['integrations']
+    assert list(id_set) == ['scripts', 'integrations', 'playbooks']
+    assert id_set['scripts'] == ID_SET['scripts']
+    assert id_set['playbooks'] == []
+    assert id_set.get('Layouts', []) == []
+    assert dict(pickle.loads(pickle.dumps(id_set))) == ID_SET
+
+
+def test_convert_id_set(tmp_path):
+    """
+    Given
+    - a JSON id_set
+
+    When
+    - converting it to SQLite and back to JSON
+
+    Then
+    - ensure the result is the same as the original id_set
+    """
+    json_id_set_path = str(tmp_path / 'id_set.json')
+    with open(json_id_set_path, 'w') as id_set_file:
+        json.dump(ID_SET, id_set_file)
+
+    convert_id_set(json_id_set_path, str(tmp_path / 'converted.db'))
+    convert_id_set(str(tmp_path / 'converted.db'), str(tmp_path / 'converted.json'))
+
+    assert is_sqlite_id_set(str(tmp_path / 'converted.db'))
+    with open(tmp_path / 'converted.json') as id_set_file:
+        assert json.load(id_set_file) == ID_SET
+
+
+def test_save_id_set__temporary_file(tmp_path, mocker):
+    """
+    Given
+    - an SQLite id_set path
+
+    When
+    - saving an id_set to it, and failing while saving another id_set to it
+
+    Then
+    - ensure the id_set is written through a uniquely named temporary file, which is removed
+    - ensure a failed write keeps the existing id_set and removes its temporary file
+    """
+    id_set_path = str(tmp_path / 'id_set.db')
+    save_id_set(ID_SET, id_set_path)
+    assert os.listdir(tmp_path) == ['id_set.db']
+
+    mocker.patch('demisto_sdk.commands.common.id_set_db.get_item_hash', side_effect=KeyboardInterrupt)
+    with pytest.raises(KeyboardInterrupt):
+        save_id_set({'scripts': [{'ScriptBaz': {'name': 'ScriptBaz'}}]}, id_set_path)
+
+    assert os.listdir(tmp_path) == ['id_set.db']
+    assert dict(load_id_set(id_set_path)) == ID_SET
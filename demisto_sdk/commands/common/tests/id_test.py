@@ -20,6 +20,33 @@ def test_validness_in_set():
         "The id validator couldn't find id as valid one"
 
 
+def test_validness_in_sqlite_set(tmp_path, mocker):
+    """
+    Given
+    - an SQLite id_set
+
+    When
+    - checking whether scripts are represented correctly in the id_set
+
+    Then
+    - ensure the scripts are looked up by id, without reading the scripts section
+    """
+    from demisto_sdk.commands.common.id_set_db import (SQLiteIDSet,
+                                                       save_id_set)
+    id_set_path = str(tmp_path / 'id_set.db')
+    save_id_set({'scripts': [{'test': {'name': 'test'}}], 'playbooks': [], 'integrations': [],
+                 'TestPlaybooks': []}, id_set_path)
+    mocker.patch.object(IDSetValidator, 'ID_SET_PATH', id_set_path)
+    validator = IDSetValidator(is_circle=True, configuration=CONFIG)
+
+    assert validator.is_valid_in_id_set(file_path="test", obj_data={"test": {"name": "test"}},
+                                        obj_set=validator.script_set)
+    assert validator.is_valid_in_id_set(file_path="test", obj_data={"test": {"name": "not test"}},
+                                        obj_set=validator.script_set) is False
+    assert isinstance(validator.id_set, SQLiteIDSet)
+    assert not validator.id_set._sections
+
+
 def test_obj_not_found_in_set():
     validator = IDSetValidator(is_circle=False, is_test_run=True, configuration=CONFIG)
 
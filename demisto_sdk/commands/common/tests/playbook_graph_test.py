@@ -0,0 +1,75 @@
+from demisto_sdk.commands.common.playbook_graph import PlaybookTasksGraph
+
+PLAYBOOK = {
+    'id': 'Playbook',
+    'starttaskid': '0',
+    'tasks': {
+        '0': {'type': 'start', 'nexttasks': {'#none#': ['1', '2']}},
+        '1': {'type': 'regular', 'skipunavailable': True, 'nexttasks': {'#none#': ['3']}},
+        '2': {'type': 'condition', 'nexttasks': {'#default#': ['3'], 'yes': ['4', '5']}},
+        '3': {'type': 'regular', 'nexttasks': {'#none#': ['0']}},
+        '4': {'type': 'regular', 'skipunavailable': True, 'nexttasks': {'#none#': ['6']}},
+        '5': {'type': 'regular', 'nexttasks': {'#none#': None}},
+        '6': {'type': 'regular'},
+        '7': {'type': 'regular', 'nexttasks': {'#none#': ['8']}},
+        '8': {'type': 'regular', 'nexttasks': {'#none#': ['7']}},
+        '9': {'type': 'regular'},
+    }
+}
+
+
+class TestPlaybookTasksGraph:
+    def test_reachable_and_mandatory_tasks(self):
+        """
+        Given
+            - A playbook with skippable tasks, a task which is reachable by both a skippable and a mandatory path,
+              and a loop.
+
+        When
+            - Building the tasks graph of the playbook.
+
+        Then
+            - Ensure the reachable tasks are all the tasks connected to the start task.
+            - Ensure a task is mandatory if one of the paths to it doesn't pass through skippable tasks.
+        """
+        graph = PlaybookTasksGraph(PLAYBOOK)
+
+        assert graph.reachable_tasks == {'0', '1', '2', '3', '4', '5', '6'}
+        assert graph.mandatory_tasks == {'0', '2', '3', '5'}
+        assert graph.is_mandatory('3')
+        assert not graph.is_mandatory('6')
+        assert not graph.is_reachable('7')
+        assert graph.condition_tasks == ['2']
+
+    def test_orphan_tasks(self):
+        """
+        Given
+            - A playbook with a task which isn't the next task of any task, and a loop of unreachable tasks.
+
+        When
+            - Getting the orphan tasks of the playbook.
+
+        Then
+            - Ensure only the task without predecessors is an orphan.
+        """
+        assert PlaybookTasksGraph(PLAYBOOK).get_orphan_tasks() == {'9'}
+
+    def test_missing_tasks(self, mocker):
+        """
+        Given
+            - A playbook which points to a task which doesn't exist.
+            - A playbook which its start task doesn't exist.
+
+        When
+            - Getting the reachable tasks of the playbooks.
+
+        Then
+            - Ensure the missing tasks are skipped with a warning.
+        """
+        print_warning = mocker.patch('demisto_sdk.commands.common.playbook_graph.print_warning')
+        graph = PlaybookTasksGraph({'id': 'Playbook', 'starttaskid': '0',
+                                    'tasks': {'0': {'nexttasks': {'#none#': ['1', '2']}}, '1': {'type': 'title'}}})
+        assert graph.reachable_tasks == {'0', '1'}
+        print_warning.assert_called_once_with('Playbook: No such task 2 in playbook')
+
+        assert PlaybookTasksGraph({'id': 'Playbook', 'starttaskid': '3', 'tasks': {}}).reachable_tasks == set()
@@ -1,5 +1,6 @@
 import io
 import os
+import shutil
 import sys
 
 import pytest
@@ -82,3 +83,107 @@ def test_is_image_path_valid():
     assert images_paths[0] and alternative_images_paths[0] in captured_output.getvalue()
     assert images_paths[1] and alternative_images_paths[1] in captured_output.getvalue()
     assert images_paths[2] not in captured_output.getvalue()
+
+
+def test_fix_mdx():
+    assert ReadMeValidator.fix_mdx('a<BR>b<hr></hr><pre>c</pre><!-- comment\n-->d') == 'a<br/>b<hr></hr><pre>{`c`}</pre>d'
+
+
+def test_is_mdx_file_with_mdx_results(mocker, tmp_path):
+    """
+    Given
+        - READMEs which their mdx was parsed in batch, and a README which was not.
+    When
+        - Run validate on the READMEs.
+    Then
+        - Ensure the batch results are used, and only the README which was not parsed is sent to the mdx server.
+    """
+    mocker.patch('demisto_sdk.commands.common.hook_validations.readme.get_content_path', return_value=str(tmp_path))
+    mocker.patch.dict(os.environ, {'DEMISTO_README_VALIDATION': 'yes'})
+    mdx_verify_server = mocker.patch.object(ReadMeValidator, 'mdx_verify_server', return_value=True)
+    readmes = []
+    for name in ('valid', 'invalid', 'not_parsed'):
+        readme = tmp_path / name / 'README.md'
+        readme.parent.mkdir()
+        readme.write_text(f'# {name}')
+        readmes.append(str(readme))
+    mdx_results = {readmes[0]: '', readmes[1]: 'MDX parse failure: Unexpected token'}
+
+    assert [ReadMeValidator(readme, mdx_results=mdx_results).is_mdx_file() for readme in readmes] == [True, False, True]
+    assert mdx_verify_server.call_count == 1
+
+
+@pytest.mark.skipif(not shutil.which('node'), reason='node is not installed')
+def test_verify_mdx_files(mocker, tmp_path):
+    """
+    Given
+        - Valid and invalid READMEs, an html README, and a local mdx module.
+    When
+        - Parsing the mdx of the READMEs in batch with a pool of mdx servers.
+    Then
+        - Ensure every README which is not html is parsed, and only the invalid READMEs have a parse error.
+    """
+    mdx_module = tmp_path / 'node_modules' / '@mdx-js' / 'mdx' / 'index.js'
+    mdx_module.parent.mkdir(parents=True)
+    mdx_module.write_text("module.exports = async function (body) {\n"
+                          "    if (body.includes('<invalid')) { throw new Error('Unexpected token'); }\n"
+                          "};\n")
+    mocker.patch('demisto_sdk.commands.common.hook_validations.readme.get_content_path', return_value=str(tmp_path))
+    mocker.patch.dict(os.environ, {'DEMISTO_README_VALIDATION': 'yes',
+                                   'NODE_PATH': str(tmp_path / 'node_modules')})
+    readmes = {}
+    for i in range(10):
+        readmes[str(tmp_path / f'{i}_README.md')] = '# <invalid>' if i % 3 == 0 else '# valid<br>'
+    readmes[str(tmp_path / 'html_README.md')] = '<!-- HTML_DOC --><p><invalid></p>'
+    for readme, content in readmes.items():
+        with open(readme, 'w') as f:
+            f.write(content)
+
+    try:
+        mdx_results = ReadMeValidator.verify_mdx_files(readmes, parsers=2)
+    finally:
+        ReadMeValidator.stop_mdx_server()
+
+    assert sorted(mdx_results) == sorted(readme for readme in readmes if 'html' not in readme)
+    assert sorted(readme for readme, mdx_error in mdx_results.items() if mdx_error) == \
+        sorted(str(tmp_path / f'{i}_README.md') for i in (0, 3, 6, 9))
+    assert 'Unexpected token' in mdx_results[str(tmp_path / '0_README.md')]
+
+
+@pytest.mark.skipif(not shutil.which('node'), reason='node is not installed')
+def test_verify_mdx_files__grow_pool(mocker, tmp_path):
+    """
+    Given
+        - A batch with a single README, followed by a batch with more READMEs.
+    When
+        - Parsing the mdx of the READMEs of every batch with the mdx servers pool.
+    Then
+        - Ensure the pool is started with a single server and grows to the number of parsers for the second batch.
+        - Ensure the READMEs of both batches are parsed.
+    """
+    mdx_module = tmp_path / 'node_modules' / '@mdx-js' / 'mdx' / 'index.js'
+    mdx_module.parent.mkdir(parents=True)
+    mdx_module.write_text("module.exports = async function (body) {\n"
+                          "    if (body.includes('<invalid')) { throw new Error('Unexpected token'); }\n"
+                          "};\n")
+    mocker.patch('demisto_sdk.commands.common.hook_validations.readme.get_content_path', return_value=str(tmp_path))
+    mocker.patch.dict(os.environ, {'DEMISTO_README_VALIDATION': 'yes',
+                                   'NODE_PATH': str(tmp_path / 'node_modules')})
+    readmes = []
+    for i in range(4):
+        readme = tmp_path / f'{i}_README.md'
+        readme.write_text('# <invalid>' if i % 2 else '# valid')
+        readmes.append(str(readme))
+
+    try:
+        first_results = ReadMeValidator.verify_mdx_files(readmes[:1], parsers=3)
+        assert ReadMeValidator._MDX_SERVER_POOL.size == 1
+        second_results = ReadMeValidator.verify_mdx_files(readmes[1:], parsers=3)
+        assert ReadMeValidator._MDX_SERVER_POOL.size == 3
+    finally:
+        ReadMeValidator.stop_mdx_server()
+
+    assert first_results == {readmes[0]: ''}
+    assert sorted(second_results) == readmes[1:]
+    assert second_results[readmes[2]] == ''
+    assert 'Unexpected token' in second_results[readmes[3]]
@@ -17,6 +17,8 @@ from demisto_sdk.commands.common.constants import (
     PACKS_SCRIPT_TEST_PY_REGEX, PACKS_SCRIPT_YML_REGEX,
     PACKS_WIDGET_JSON_REGEX, PLAYBOOK_README_REGEX, PLAYBOOK_YML_REGEX,
     TEST_PLAYBOOK_YML_REGEX)
+from demisto_sdk.commands.common.hook_validations import \
+    structure as structure_module
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
 from demisto_sdk.commands.common.hook_validations.structure import (
@@ -109,6 +111,32 @@ class TestStructureValidator:
         validator = StructureValidator(file_path=path, predefined_scheme='reputation')
         assert validator.is_valid_scheme() is answer
 
+    def test_scheme_validation__compiled_once(self, mocker):
+        """
+        Given
+        - a valid and an invalid playbook
+
+        When
+        - validating their scheme
+
+        Then
+        - ensure the playbook schema file is read only once
+        - ensure every file is parsed as YAML 1.2 once, and validated once
+        """
+        mocker.patch.dict(structure_module.COMPILED_SCHEMAS, clear=True)
+        load_schema = mocker.spy(structure_module.yml, 'load')
+        valid_validator = StructureValidator(file_path=VALID_PLAYBOOK_ID_PATH, predefined_scheme='playbook')
+        invalid_validator = StructureValidator(file_path=INVALID_PLAYBOOK_PATH, predefined_scheme='playbook')
+        mocker.patch.object(StructureValidator, 'handle_error', return_value='error')
+        core_init = mocker.spy(structure_module.CompiledSchemaCore, '__init__')
+
+        assert valid_validator.is_valid_scheme() is True
+        assert valid_validator.is_valid_scheme() is True
+        assert invalid_validator.is_valid_scheme() is False
+
+        assert load_schema.call_count == 3  # the schema and the two playbooks
+        assert [call.kwargs.get('source_file') for call in core_init.call_args_list] == [None, None, None]
+
     INPUTS_VALID_FROM_VERSION_MODIFIED = [
         (VALID_TEST_PLAYBOOK_PATH, INVALID_PLAYBOOK_PATH, False),
         (INVALID_PLAYBOOK_PATH, VALID_PLAYBOOK_ID_PATH, False),
@@ -1,10 +1,13 @@
 import glob
 import json
 import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Union
 
+import git
 import pytest
+import yaml
 from demisto_sdk.commands.common import tools
 from demisto_sdk.commands.common.constants import (INTEGRATIONS_DIR,
                                                    LAYOUTS_DIR, PACKS_DIR,
@@ -13,26 +16,16 @@ from demisto_sdk.commands.common.constants import (INTEGRATIONS_DIR,
                                                    TEST_PLAYBOOKS_DIR,
                                                    FileType)
 from demisto_sdk.commands.common.git_tools import git_path
-from demisto_sdk.commands.common.tools import (LOG_COLORS, arg_to_list,
-                                               filter_files_by_type,
-                                               filter_files_on_pack,
-                                               filter_packagify_changes,
-                                               find_type, get_code_lang,
-                                               get_dict_from_file,
-                                               get_entity_id_by_entity_type,
-                                               get_entity_name_by_entity_type,
-                                               get_file, get_files_in_dir,
-                                               get_ignore_pack_skipped_tests,
-                                               get_last_release_version,
-                                               get_latest_release_notes_text,
-                                               get_release_notes_file_path,
-                                               get_ryaml,
-                                               has_remote_configured,
-                                               is_origin_content_repo,
-                                               is_v2_file,
-                                               retrieve_file_ending,
-                                               run_command_os,
-                                               server_version_compare)
+from demisto_sdk.commands.common.tools import (
+    LOG_COLORS, DocumentCache, GitObjectReader, arg_to_list,
+    filter_files_by_type, filter_files_on_pack, filter_packagify_changes,
+    find_type, get_cached_remote_release_version, get_code_lang,
+    get_dict_from_file, get_entity_id_by_entity_type,
+    get_entity_name_by_entity_type, get_file, get_files_in_dir,
+    get_ignore_pack_skipped_tests, get_last_release_version,
+    get_latest_release_notes_text, get_release_notes_file_path, get_ryaml,
+    get_yaml, has_remote_configured, is_origin_content_repo, is_v2_file,
+    retrieve_file_ending, run_command_os, server_version_compare)
 from demisto_sdk.tests.constants_test import (IGNORED_PNG,
                                               INDICATORFIELD_EXTRA_FIELDS,
                                               SOURCE_FORMAT_INTEGRATION_COPY,
@@ -185,6 +178,10 @@ class TestGenericFunctions:
 
 
 class TestGetRemoteFile:
+    @pytest.fixture(autouse=True)
+    def no_local_revisions(self, mocker):
+        mocker.patch.object(tools.GIT_OBJECT_READER, 'has_revision', return_value=False)
+
     def test_get_remote_file_sanity(self):
         hello_world_yml = tools.get_remote_file('Packs/HelloWorld/Integrations/HelloWorld/HelloWorld.yml')
         assert hello_world_yml
@@ -319,6 +316,142 @@ class TestReleaseVersion:
 
         assert tag == '20.0.0'
 
+    def test_cached_remote_release_version(self, mocker, tmp_path):
+        """
+        Given
+        - A version check cache which was written now.
+        - A version check cache which is older than the cache TTL.
+
+        When
+        - Getting the latest demisto-sdk version.
+
+        Then
+        - Ensure the cached version is returned without checking the remote version.
+        - Ensure the stale cached version is returned, and the cache is refreshed in a background thread.
+        - Ensure the refresh thread is waited for before forking worker processes.
+        """
+        mocker.patch.object(tools, 'REMOTE_RELEASE_VERSION_REFRESH', None)
+        mocker.patch.dict(os.environ, {'DEMISTO_SDK_CACHE_DIR': str(tmp_path)})
+        os.environ.pop('DEMISTO_SDK_SKIP_VERSION_CHECK', None)
+        os.environ.pop('CI', None)
+        get_remote_version = mocker.patch.object(tools, 'get_last_remote_release_version', return_value='2.0.0')
+        cache_path = tmp_path / 'latest_version.json'
+
+        cache_path.write_text(json.dumps({'version': '1.0.0', 'checked_at': tools.time.time()}))
+        assert get_cached_remote_release_version() == '1.0.0'
+        assert not get_remote_version.called
+
+        thread = mocker.patch.object(tools.threading, 'Thread')
+        cache_path.write_text(json.dumps({'version': '1.0.0', 'checked_at': 0}))
+        assert get_cached_remote_release_version() == '1.0.0'
+        target = thread.call_args[1]['target']
+        target(*thread.call_args[1]['args'])
+        assert json.loads(cache_path.read_text())['version'] == '2.0.0'
+        get_remote_version.assert_called_once_with(print_errors=False)
+        tools.wait_for_remote_release_version_refresh()
+        thread.return_value.join.assert_called_once()
+
+    def test_cached_remote_release_version_offline(self, mocker, tmp_path):
+        """
+        Given
+        - No version check cache, and no connection to the remote.
+
+        When
+        - Getting the latest demisto-sdk version twice.
+
+        Then
+        - Ensure an empty version is returned without waiting for the check.
+        - Ensure the failed check is cached, so the second run doesn't check the remote version again.
+        """
+        mocker.patch.object(tools, 'REMOTE_RELEASE_VERSION_REFRESH', None)
+        mocker.patch.dict(os.environ, {'DEMISTO_SDK_CACHE_DIR': str(tmp_path / 'cache')})
+        os.environ.pop('DEMISTO_SDK_SKIP_VERSION_CHECK', None)
+        os.environ.pop('CI', None)
+        get_remote_version = mocker.patch.object(tools, 'get_last_remote_release_version', return_value='')
+
+        thread = mocker.patch.object(tools.threading, 'Thread')
+        thread.return_value.start.side_effect = lambda: thread.call_args[1]['target'](*thread.call_args[1]['args'])
+
+        assert get_cached_remote_release_version() == ''
+        assert get_cached_remote_release_version() == ''
+        assert get_remote_version.call_count == 1
+
+    def test_cached_remote_release_version_disabled(self, mocker, tmp_path):
+        """
+        Given
+        - The DEMISTO_SDK_SKIP_VERSION_CHECK env var.
+
+        When
+        - Getting the latest demisto-sdk version.
+
+        Then
+        - Ensure the remote version is not checked and the cache is not written.
+        """
+        mocker.patch.dict(os.environ, {'DEMISTO_SDK_CACHE_DIR': str(tmp_path), 'DEMISTO_SDK_SKIP_VERSION_CHECK': '1'})
+        thread = mocker.patch.object(tools.threading, 'Thread')
+
+        assert get_cached_remote_release_version() == ''
+        assert not thread.called
+        assert not os.listdir(tmp_path)
+
+
+class TestJsonCache:
+    def test_atomic_write_json(self, tmp_path):
+        """
+        Given
+        - A cache file path in a missing directory.
+
+        When
+        - Writing a JSON object to it and loading it.
+
+        Then
+        - Ensure the object is loaded as the given type, and no temporary files are left.
+        """
+        cache_path = str(tmp_path / 'cache' / 'cache.json')
+
+        tools.atomic_write_json(cache_path, OrderedDict([('b', 1), ('a', 2)]))
+
+        assert tools.load_json_cache(cache_path, object_pairs_hook=OrderedDict) == OrderedDict([('b', 1), ('a', 2)])
+        assert os.listdir(tmp_path / 'cache') == ['cache.json']
+
+    def test_atomic_write_json__error(self, tmp_path):
+        """
+        Given
+        - An existing cache file.
+
+        When
+        - Writing data which is not JSON serializable to it.
+
+        Then
+        - Ensure the error is raised, the cache file is kept and the temporary file is removed.
+        """
+        cache_path = tmp_path / 'cache.json'
+        cache_path.write_text('{"a": 1}')
+
+        with pytest.raises(TypeError):
+            tools.atomic_write_json(str(cache_path), {'a': object()})
+
+        assert tools.load_json_cache(str(cache_path)) == {'a': 1}
+        assert os.listdir(tmp_path) == ['cache.json']
+
+    @pytest.mark.parametrize('content', [None, '{"a": ', '[1, 2]'])
+    def test_load_json_cache__invalid(self, tmp_path, content):
+        """
+        Given
+        - A missing cache file, a partially written one and one which does not hold a JSON object.
+
+        When
+        - Loading the cache.
+
+        Then
+        - Ensure an empty cache is loaded.
+        """
+        cache_path = tmp_path / 'cache.json'
+        if content is not None:
+            cache_path.write_text(content)
+
+        assert tools.load_json_cache(str(cache_path)) == {}
+
 
 class TestEntityAttributes:
     @pytest.mark.parametrize('data, entity', [({'commonfields': {'id': 1}}, INTEGRATIONS_DIR),
@@ -375,6 +508,302 @@ class TestGetFile:
         assert file_data.get('name') is not None
 
 
+class TestDocumentCache:
+    def test_load(self, tmp_path):
+        """
+        Given
+        - a yml file
+
+        When
+        - loading it several times, modifying the loaded data and then the file itself
+
+        Then
+        - ensure the file is parsed only once until it changes
+        - ensure modifying the loaded data doesn't affect the next loads
+        """
+        yml_path = tmp_path / 'integration.yml'
+        yml_path.write_text('name: foo\nscript:\n  commands:\n  - name: foo-get\n')
+        cache = DocumentCache()
+
+        first_load = cache.load(str(yml_path), yaml.safe_load)
+        first_load['script']['commands'].append({'name': 'foo-set'})
+        second_load = cache.load(str(yml_path), yaml.safe_load)
+
+        assert second_load == {'name': 'foo', 'script': {'commands': [{'name': 'foo-get'}]}}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        yml_path.write_text('name: bar\n')
+        os.utime(yml_path, ns=(0, 0))
+        assert cache.load(str(yml_path), yaml.safe_load) == {'name': 'bar'}
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_load__lru_eviction(self, tmp_path):
+        """
+        Given
+        - a cache of 2 documents
+
+        When
+        - loading 3 files, reloading the first one in between
+
+        Then
+        - ensure the least recently used file is evicted
+        """
+        paths = []
+        for index in range(3):
+            paths.append(str(tmp_path / f'file{index}.json'))
+            with open(paths[-1], 'w') as json_file:
+                json.dump({'id': index}, json_file)
+        cache = DocumentCache(max_size=2)
+
+        cache.load(paths[0], json.load)
+        cache.load(paths[1], json.load)
+        cache.load(paths[0], json.load)
+        cache.load(paths[2], json.load)
+        cache.load(paths[0], json.load)
+        cache.load(paths[1], json.load)
+
+        assert (cache.hits, cache.misses) == (2, 4)
+
+    def test_load__concurrent(self, tmp_path):
+        """
+        Given
+        - a cache of a single document
+
+        When
+        - loading several files from many threads at once, evicting the documents all the time
+
+        Then
+        - ensure every load returns its file data
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        paths = []
+        for index in range(4):
+            paths.append(str(tmp_path / f'file{index}.json'))
+            with open(paths[-1], 'w') as json_file:
+                json.dump({'id': index}, json_file)
+        cache = DocumentCache(max_size=1)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            loads = list(executor.map(lambda index: cache.load(paths[index % 4], json.load), range(2000)))
+
+        assert loads == [{'id': index % 4} for index in range(2000)]
+        assert cache.hits + cache.misses == 2000
+
+    def test_get_yaml__shared_cache(self, tmp_path, mocker):
+        """
+        Given
+        - a yml file
+
+        When
+        - loading it with get_yaml, get_dict_from_file and find_type
+
+        Then
+        - ensure it is parsed once
+        """
+        mocker.patch.object(tools, 'DOCUMENT_CACHE', DocumentCache())
+        yml_path = str(tmp_path / 'script.yml')
+        with open(yml_path, 'w') as yml_file:
+            yml_file.write('commonfields:\n  id: foo\nscript: print(1)\ntype: python\n')
+
+        assert get_yaml(yml_path)['commonfields'] == {'id': 'foo'}
+        assert get_dict_from_file(yml_path)[0]['type'] == 'python'
+        assert find_type(yml_path) == FileType.SCRIPT
+        assert (tools.DOCUMENT_CACHE.hits, tools.DOCUMENT_CACHE.misses) == (2, 1)
+
+
+class TestGitObjectReader:
+    @pytest.fixture
+    def content_repo(self, tmp_path, monkeypatch, mocker):
+        repo = git.Repo.init(str(tmp_path))
+        yml_path = tmp_path / 'Packs' / 'Foo' / 'Scripts' / 'script-Foo.yml'
+        yml_path.parent.mkdir(parents=True)
+        yml_path.write_text('commonfields:\n  id: Foo\n')
+        repo.index.add([str(yml_path)])
+        repo.index.commit('first commit')
+        repo.create_tag('1.0.0')
+        yml_path.write_text('commonfields:\n  id: Bar\n')
+
+        monkeypatch.chdir(tmp_path)
+        mocker.patch.object(tools, 'GIT_OBJECT_READER', GitObjectReader())
+        yield repo
+        tools.GIT_OBJECT_READER.close()
+
+    def test_get_remote_file__local_revision(self, content_repo, mocker):
+        """
+        Given
+        - a git repository with a committed file which was modified locally
+
+        When
+        - getting the file from a revision which exists locally
+
+        Then
+        - ensure the committed version is returned without sending HTTP requests
+        - ensure an old version of a file which does not exist in the revision is returned as empty without sending
+          HTTP requests
+        """
+        requests_get = mocker.patch.object(tools.requests, 'get')
+        yml_path = os.path.join('Packs', 'Foo', 'Scripts', 'script-Foo.yml')
+
+        assert tools.get_remote_file(yml_path, tag='master')['commonfields']['id'] == 'Foo'
+        assert tools.get_remote_file(os.path.abspath(yml_path), tag='1.0.0') == {'commonfields': {'id': 'Foo'}}
+        assert tools.get_remote_file(yml_path, tag='1.0.0', return_content=True) == b'commonfields:\n  id: Foo\n'
+        assert tools.get_remote_file('Packs/Foo/Scripts/script-New.yml', tag='master', suppress_print=True,
+                                     old_version=True) == {}
+        assert not requests_get.called
+
+    def test_get_remote_file__missing_from_local_revision(self, content_repo, mocker):
+        """
+        Given
+        - a git repository whose master branch does not contain a file of the content repository
+
+        When
+        - getting the file from master
+
+        Then
+        - ensure the file is downloaded from GitHub
+        """
+        requests_get = mocker.patch.object(tools.requests, 'get')
+        requests_get.return_value.content = b'{"approved_list": ["Use Case"]}'
+
+        assert tools.get_remote_file('Tests/Marketplace/approved_usecases.json') == {'approved_list': ['Use Case']}
+        assert requests_get.call_args[0][0].endswith('/master/Tests/Marketplace/approved_usecases.json')
+
+    def test_read__path_with_spaces(self, content_repo):
+        """
+        Given
+        - a git repository with a committed file whose path contains spaces
+
+        When
+        - reading a missing file whose path contains spaces, and then the committed file
+
+        Then
+        - ensure the missing file is returned as None
+        - ensure the committed file is still read from the repository
+        """
+        yml_path = content_repo.working_dir + '/Packs/Foo/Scripts/script Foo Bar.yml'
+        with open(yml_path, 'w') as yml_file:
+            yml_file.write('commonfields:\n  id: Foo Bar\n')
+        content_repo.index.add([yml_path])
+        content_repo.index.commit('second commit')
+
+        assert tools.GIT_OBJECT_READER.read('master', 'Packs/Foo/Scripts/missing one.yml') is None
+        assert tools.GIT_OBJECT_READER.read('master', yml_path) == b'commonfields:\n  id: Foo Bar\n'
+
+    def test_get_remote_file__no_local_revision(self, content_repo, mocker):
+        """
+        Given
+        - a git repository
+
+        When
+        - getting a file from a revision which does not exist locally
+
+        Then
+        - ensure the file is downloaded from GitHub
+        """
+        requests_get = mocker.patch.object(tools.requests, 'get')
+        requests_get.return_value.content = b'{"id": "Foo"}'
+
+        assert tools.get_remote_file('Packs/Foo/pack_metadata.json', tag='NoSuchBranch') == {'id': 'Foo'}
+        assert requests_get.call_args[0][0].endswith('/NoSuchBranch/Packs/Foo/pack_metadata.json')
+
+
+class TestGitChangeSet:
+    def test_change_set(self, tmp_path, monkeypatch, mocker):
+        """
+        Given
+        - a git repository on a feature branch with committed, staged, renamed and unstaged changes
+
+        When
+        - reading the change set of the repository twice
+
+        Then
+        - ensure the branch name and the staged, unstaged and renamed files are read from the git status
+        - ensure the committed changes are read from the diff against the base branch
+        - ensure git is called once for the status and once for every diff
+        """
+        repo = git.Repo.init(str(tmp_path))
+        for file_name in ('Committed.yml', 'Renamed.yml', 'Unstaged.yml'):
+            (tmp_path / file_name).write_text(f'id: {file_name}\n')
+        repo.index.add(['Committed.yml', 'Renamed.yml', 'Unstaged.yml'])
+        repo.index.commit('first commit')
+        repo.git.checkout('-b', 'feature')
+        (tmp_path / 'Committed.yml').write_text('id: Changed\n')
+        repo.index.add(['Committed.yml'])
+        repo.index.commit('second commit')
+        (tmp_path / 'Staged.yml').write_text('id: Staged\n')
+        repo.git.add('Staged.yml')
+        repo.git.mv('Renamed.yml', 'New.yml')
+        (tmp_path / 'Unstaged.yml').write_text('id: Changed\n')
+        monkeypatch.chdir(tmp_path)
+        run_command = mocker.spy(tools, 'run_command')
+
+        change_set = tools.GitChangeSet()
+        for _ in range(2):
+            assert change_set.branch_name == 'feature'
+            assert change_set.staged_files == {'Staged.yml', 'New.yml'}
+            assert change_set.unstaged_files == {'Unstaged.yml'}
+            assert change_set.renamed_files == {'New.yml': 'Renamed.yml'}
+            assert change_set.name_status('master...feature') == 'M\tCommitted.yml\n'
+
+        assert run_command.call_count == 2
+
+    def test_change_set__detached(self, tmp_path, monkeypatch):
+        """
+        Given
+        - a git repository with a detached HEAD
+
+        When
+        - reading the branch name
+
+        Then
+        - ensure the branch name is the `git branch` description of the detached HEAD
+        """
+        repo = git.Repo.init(str(tmp_path))
+        (tmp_path / 'File.yml').write_text('id: File\n')
+        repo.index.add(['File.yml'])
+        commit = repo.index.commit('first commit')
+        repo.git.checkout(commit.hexsha)
+        monkeypatch.chdir(tmp_path)
+
+        assert tools.GitChangeSet().branch_name == f'(HEAD detached at {commit.hexsha[:7]})'
+
+    def test_change_set__invalidate_working_tree(self, tmp_path, monkeypatch, mocker):
+        """
+        Given
+        - a git repository with a committed file
+
+        When
+        - reading the diffs of the file, changing it and invalidating the working tree
+
+        Then
+        - ensure the diffs are memoized
+        - ensure the status and the diffs against the working tree are read again after the invalidation
+        - ensure the diffs between revisions are kept
+        """
+        repo = git.Repo.init(str(tmp_path))
+        (tmp_path / 'File.yml').write_text('id: File\n')
+        repo.index.add(['File.yml'])
+        repo.index.commit('first commit')
+        monkeypatch.chdir(tmp_path)
+        run_command = mocker.spy(tools, 'run_command')
+
+        change_set = tools.GitChangeSet()
+        for _ in range(2):
+            assert change_set.diff('HEAD', 'File.yml') == ''
+            assert change_set.name_status('HEAD...HEAD') == ''
+            assert change_set.unstaged_files == set()
+        assert run_command.call_count == 3
+
+        (tmp_path / 'File.yml').write_text('id: Changed\n')
+        change_set.invalidate_working_tree()
+
+        assert '+id: Changed' in change_set.diff('HEAD', 'File.yml')
+        assert change_set.name_status('HEAD...HEAD') == ''
+        assert change_set.unstaged_files == {'File.yml'}
+        assert run_command.call_count == 5
+
+
 def test_get_latest_release_notes_text_invalid():
     """
     Given
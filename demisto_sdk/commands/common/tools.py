@@ -7,17 +7,21 @@ import os
 import re
 import shlex
 import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from configparser import ConfigParser, MissingSectionHeaderError
+from contextlib import suppress
 from distutils.version import LooseVersion
 from functools import partial
 from pathlib import Path
 from subprocess import DEVNULL, PIPE, Popen, check_output
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from typing import (TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple,
+                    Type, Union)
 
 import click
 import colorama
-import demisto_client
-import git
 import requests
 import urllib3
 import yaml
@@ -30,11 +34,16 @@ from demisto_sdk.commands.common.constants import (
     PACKAGE_SUPPORTING_DIRECTORIES, PACKAGE_YML_FILE_REGEX, PACKS_DIR,
     PACKS_DIR_REGEX, PACKS_PACK_IGNORE_FILE_NAME, PACKS_README_FILE_NAME,
     PLAYBOOKS_DIR, RELEASE_NOTES_DIR, RELEASE_NOTES_REGEX, REPORTS_DIR,
-    SCRIPTS_DIR, SDK_API_GITHUB_RELEASES, TEST_PLAYBOOKS_DIR, TYPE_PWSH,
+    SCRIPTS_DIR, SDK_API_GITHUB_RELEASES, SDK_LATEST_VERSION_CACHE_FILE,
+    SDK_LATEST_VERSION_CACHE_TTL, TEST_PLAYBOOKS_DIR, TYPE_PWSH,
     UNRELEASE_HEADER, WIDGETS_DIR, FileType)
+from demisto_sdk.commands.common.id_set_db import load_id_set
 from packaging.version import parse
 from ruamel.yaml import YAML
 
+if TYPE_CHECKING:
+    import demisto_client
+
 # disable insecure warnings
 urllib3.disable_warnings()
 
@@ -114,6 +123,7 @@ def src_root() -> Path:
     Returns:
         Path: src root path.
     """
+    import git
     git_dir = git.Repo(Path.cwd(),
                        search_parent_directories=True).working_tree_dir
 
@@ -160,37 +170,275 @@ def run_command(command, is_silenced=True, exit_on_error=True, cwd=None):
     return output
 
 
-def get_remote_file(full_file_path, tag='master', return_content=False, suppress_print=False):
+class GitObjectReader:
+    """Reads file versions from the local git object database.
+
+    All the reads go through a single long-lived `git cat-file --batch` process, and every revision and file version
+    is read at most once per process.
     """
+
+    def __init__(self):
+        self._process = None  # type: Optional[Popen]
+        self._process_key = None  # type: Optional[Tuple[int, str]]
+        self._unavailable = set()  # type: set
+        self._revisions = {}  # type: Dict[Tuple[str, str], bool]
+        self._blobs = {}  # type: Dict[Tuple[str, str, str], Optional[bytes]]
+
+    def _batch_process(self) -> Optional[Popen]:
+        # a process inherited from a forked parent shares its pipes and relative paths are resolved from the
+        # directory git was started in, so a new process is started per process id and working directory
+        process_key = (os.getpid(), os.getcwd())
+        if process_key != self._process_key:
+            self.close()
+            try:
+                self._process = Popen(['git', 'cat-file', '--batch'], stdin=PIPE, stdout=PIPE, stderr=DEVNULL)
+            except OSError:
+                self._process = None
+            self._process_key = process_key
+        return self._process
+
+    def _cat(self, object_name: str) -> Optional[bytes]:
+        cwd = os.getcwd()
+        if cwd in self._unavailable or '\n' in object_name:
+            return None
+
+        process = self._batch_process()
+        if not process:
+            self._unavailable.add(cwd)
+            return None
+        try:
+            process.stdin.write(object_name.encode('utf-8') + b'\n')  # type: ignore
+            process.stdin.flush()  # type: ignore
+            header = process.stdout.readline()  # type: ignore
+        except OSError:
+            self._unavailable.add(cwd)
+            return None
+        if not header:
+            # git exited, e.g. not running inside a git repository
+            self._unavailable.add(cwd)
+            return None
+
+        # the header is '<object name> missing' or '<sha> <type> <size>', and the object name may contain spaces
+        fields = header.rstrip(b'\n').rsplit(b' ', 2)
+        if fields[-1] in (b'missing', b'ambiguous'):
+            return None
+        try:
+            size = int(fields[2])
+        except (IndexError, ValueError):
+            # an unexpected reply leaves the output out of sync, so the next read starts a new process
+            self.close()
+            return None
+        try:
+            content = process.stdout.read(size + 1)  # type: ignore
+        except OSError:
+            self._unavailable.add(cwd)
+            return None
+        return content[:-1]
+
+    def has_revision(self, revision: str) -> bool:
+        """Whether the revision (a branch, a tag or a commit) exists in the local repository."""
+        key = (os.getcwd(), revision)
+        if key not in self._revisions:
+            self._revisions[key] = self._cat(f'{revision}^{{commit}}') is not None
+        return self._revisions[key]
+
+    def read(self, revision: str, file_path: str) -> Optional[bytes]:
+        """Returns the contents of the file in the given revision, or None if the file does not exist in it.
+
+        Args:
+            revision (str): a branch, a tag or a commit.
+            file_path (str): the file path, relative to the current working directory.
+        """
+        file_path = os.path.relpath(file_path).replace('\\', '/')
+        key = (os.getcwd(), revision, file_path)
+        if key not in self._blobs:
+            self._blobs[key] = self._cat(f'{revision}:./{file_path}')
+        return self._blobs[key]
+
+    def close(self):
+        if self._process and self._process_key and self._process_key[0] == os.getpid():
+            self._process.stdin.close()  # type: ignore
+            self._process.wait()
+        self._process = None
+        self._process_key = None
+
+    def clear(self):
+        self.close()
+        self._unavailable.clear()
+        self._revisions.clear()
+        self._blobs.clear()
+
+
+GIT_OBJECT_READER = GitObjectReader()
+
+
+class GitChangeSet:
+    """The changes of the local git repository which the commands work on.
+
+    The branch name and the staged, unstaged and renamed files are read with a single `git status` call, and every
+    diff, the remotes and the tags are read at most once per process and working directory.
+    """
+
+    def __init__(self):
+        self._cache = {}  # type: Dict[Tuple[str, ...], Any]
+
+    def _memoize(self, key: Tuple[str, ...], compute: Callable[[], Any]) -> Any:
+        key = (os.getcwd(),) + key
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    @staticmethod
+    def _read_status() -> dict:
+        status = {'branch_name': '', 'staged': set(), 'unstaged': set(), 'renamed': {}}  # type: Dict[str, Any]
+        # every entry is NUL terminated, a renamed file entry is followed by its original path
+        entries = iter(run_command('git status --porcelain=v2 --branch --untracked-files=no -z').split('\0'))
+        for entry in entries:
+            if entry.startswith('# branch.head '):
+                status['branch_name'] = entry[len('# branch.head '):]
+            elif entry[:2] in ('1 ', '2 ', 'u '):
+                # ordinary, renamed and unmerged entries have 8, 9 and 10 fields before the path
+                fields = entry.split(' ', {'1': 8, '2': 9, 'u': 10}[entry[0]])
+                index_status, work_tree_status, path = fields[1][0], fields[1][1], fields[-1]
+                if entry[0] == '2':
+                    status['renamed'][path] = next(entries)
+                if index_status != '.':
+                    status['staged'].add(path)
+                if work_tree_status != '.':
+                    status['unstaged'].add(path)
+        return status
+
+    @property
+    def _status(self) -> dict:
+        return self._memoize(('status',), self._read_status)
+
+    @property
+    def branch_name(self) -> str:
+        """The current branch name, `(HEAD detached at <revision>)` when HEAD is detached."""
+        branch_name = self._status['branch_name']
+        if branch_name == '(detached)':
+            # the status does not tell which revision is checked out, keep the `git branch` description of it
+            branch_name = self._memoize(('detached_branch_name',), self._read_detached_branch_name)
+        return branch_name
+
+    @staticmethod
+    def _read_detached_branch_name() -> str:
+        branch_name_reg = re.search(r'\* (.*)', run_command('git branch'))
+        return branch_name_reg.group(1) if branch_name_reg else ''
+
+    @property
+    def staged_files(self) -> set:
+        return self._status['staged']
+
+    @property
+    def unstaged_files(self) -> set:
+        return self._status['unstaged']
+
+    @property
+    def renamed_files(self) -> Dict[str, str]:
+        """The staged renamed files, mapped from their new path to their original path."""
+        return self._status['renamed']
+
+    def name_status(self, revisions: str) -> str:
+        """Returns the `git diff --name-status` output of the given revisions, e.g. `origin/master...HEAD`."""
+        return self._memoize(('diff', revisions), lambda: run_command(f'git diff --name-status {revisions}'))
+
+    def diff(self, revisions: str, path: str, exit_on_error: bool = True) -> str:
+        """Returns the `git diff` output of the given revisions for a single path."""
+        return self._memoize(('diff', revisions, path),
+                             lambda: run_command(f'git diff {revisions} -- {path}', exit_on_error=exit_on_error))
+
+    @property
+    def is_merging(self) -> bool:
+        """Whether a merge is in progress."""
+        return bool(self._memoize(('merge_head',), lambda: run_command('git rev-parse -q --verify MERGE_HEAD')))
+
+    @property
+    def top_level(self) -> str:
+        """The path of the top level directory of the repository."""
+        return self._memoize(('top_level',), lambda: run_command('git rev-parse --show-toplevel').replace('\n', ''))
+
+    @property
+    def remotes(self) -> str:
+        """The `git remote -v` output."""
+        return self._memoize(('remotes',), lambda: run_command('git remote -v'))
+
+    @property
+    def tags(self) -> List[str]:
+        return self._memoize(('tags',), lambda: run_command('git tag').split('\n'))
+
+    def invalidate_working_tree(self):
+        """Drops the status and the diffs against the working tree, to be called after files are written."""
+        for key in list(self._cache):
+            if key[1] == 'status' or (key[1] == 'diff' and '..' not in key[2]):
+                del self._cache[key]
+
+    def clear(self):
+        self._cache.clear()
+
+
+GIT_CHANGE_SET = GitChangeSet()
+
+
+def get_local_revisions(tag: str) -> List[str]:
+    """Returns the local revisions which match a content repository branch or tag, the remote ones first."""
+    if tag.startswith('origin/'):
+        return [tag]
+    return [f'origin/{tag}', tag]
+
+
+def get_remote_file(full_file_path, tag='master', return_content=False, suppress_print=False, old_version=False):
+    """
+    The file is read from the local git repository when the tag and the file are available in it,
+    and is downloaded from the content repository on GitHub otherwise.
+
     Args:
         full_file_path (string):The full path of the file.
         tag (string): The branch name. default is 'master'
         return_content (bool): Determines whether to return the file's raw content or the dict representation of it.
         suppress_print (bool): whether to suppress the warning message in case the file was not found.
+        old_version (bool): whether the file is the old version of a file of the local repository. A file which is
+            missing from a local revision is then a new file, and is not downloaded.
     Returns:
         The file content in the required format.
 
     """
-    # 'origin/' prefix is used to compared with remote branches but it is not a part of the github url.
-    tag = tag.lstrip('origin/')
+    content = None
+    for revision in get_local_revisions(tag):
+        if GIT_OBJECT_READER.has_revision(revision):
+            content = GIT_OBJECT_READER.read(revision, full_file_path)
+            if content is None and old_version:
+                if not suppress_print:
+                    print_warning('Could not find the old entity file under "{}:{}".\n'
+                                  'please make sure that you did not break backward compatibility.'
+                                  .format(revision, full_file_path))
+                return {}
+            break
+
+    if content is None:
+        # 'origin/' prefix is used to compared with remote branches but it is not a part of the github url.
+        tag = tag.lstrip('origin/')
+
+        # The replace in the end is for Windows support
+        github_path = os.path.join(CONTENT_GITHUB_LINK, tag, full_file_path).replace('\\', '/')
+        print_v(f'Could not read {full_file_path} of {tag} from the local git repository, downloading {github_path}')
+        try:
+            res = requests.get(github_path, verify=False, timeout=10)
+            res.raise_for_status()
+        except Exception as exc:
+            if not suppress_print:
+                print_warning('Could not find the old entity file under "{}".\n'
+                              'please make sure that you did not break backward compatibility. '
+                              'Reason: {}'.format(github_path, exc))
+            return {}
+        content = res.content
 
-    # The replace in the end is for Windows support
-    github_path = os.path.join(CONTENT_GITHUB_LINK, tag, full_file_path).replace('\\', '/')
-    try:
-        res = requests.get(github_path, verify=False, timeout=10)
-        res.raise_for_status()
-    except Exception as exc:
-        if not suppress_print:
-            print_warning('Could not find the old entity file under "{}".\n'
-                          'please make sure that you did not break backward compatibility. '
-                          'Reason: {}'.format(github_path, exc))
-        return {}
     if return_content:
-        return res.content
+        return content
     if full_file_path.endswith('json'):
-        details = json.loads(res.content)
+        details = json.loads(content)
     elif full_file_path.endswith('yml'):
-        details = yaml.safe_load(res.content)
+        details = yaml.safe_load(content)
     # if neither yml nor json then probably a CHANGELOG or README file.
     else:
         details = {}
@@ -231,7 +479,7 @@ def filter_packagify_changes(modified_files, added_files, removed_files, tag='ma
         if file_path.split("/")[0] in PACKAGE_SUPPORTING_DIRECTORIES:
             if PACKS_README_FILE_NAME in file_path:
                 continue
-            details = get_remote_file(file_path, tag)
+            details = get_remote_file(file_path, tag, old_version=True)
             if details:
                 uniq_identifier = '_'.join([
                     details['name'],
@@ -301,8 +549,7 @@ def has_remote_configured():
     opposed to the master branch of the fork.
     :return: bool : True if remote is configured, False if not.
     """
-    remotes = run_command('git remote -v')
-    if re.search(CONTENT_GITHUB_UPSTREAM, remotes):
+    if re.search(CONTENT_GITHUB_UPSTREAM, GIT_CHANGE_SET.remotes):
         return True
     else:
         return False
@@ -314,20 +561,24 @@ def is_origin_content_repo():
     validation needs to be ran against the origin master branch or the upstream master branch
     :return: bool : True if remote is configured, False if not.
     """
-    remotes = run_command('git remote -v')
-    if re.search(CONTENT_GITHUB_ORIGIN, remotes):
+    if re.search(CONTENT_GITHUB_ORIGIN, GIT_CHANGE_SET.remotes):
         return True
     else:
         return False
 
 
-def get_last_remote_release_version():
+def is_version_check_disabled() -> bool:
+    return bool(os.environ.get('DEMISTO_SDK_SKIP_VERSION_CHECK') or os.environ.get('CI'))
+
+
+def get_last_remote_release_version(print_errors: bool = True):
     """
     Get latest release tag from remote github page
 
+    :param print_errors: whether to print a warning if the request fails
     :return: tag
     """
-    if not os.environ.get('DEMISTO_SDK_SKIP_VERSION_CHECK') and not os.environ.get('CI'):
+    if not is_version_check_disabled():
         try:
             releases_request = requests.get(SDK_API_GITHUB_RELEASES, verify=False, timeout=5)
             releases_request.raise_for_status()
@@ -342,25 +593,217 @@ def get_last_remote_release_version():
             if isinstance(exc, requests.exceptions.ConnectionError):
                 exc_msg = f'{exc_msg[exc_msg.find(">") + 3:-3]}.\n' \
                           f'This may happen if you are not connected to the internet.'
-            print_warning(f'Could not get latest demisto-sdk version.\nEncountered error: {exc_msg}')
+            if print_errors:
+                print_warning(f'Could not get latest demisto-sdk version.\nEncountered error: {exc_msg}')
 
     return ''
 
 
+def get_sdk_cache_dir() -> str:
+    """
+    Get the directory of the demisto-sdk cache files, set by the DEMISTO_SDK_CACHE_DIR env var
+
+    :return: the cache directory path, ~/.demisto-sdk by default
+    """
+    return os.environ.get('DEMISTO_SDK_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.demisto-sdk')
+
+
+def load_json_cache(cache_path: str, object_pairs_hook: Callable = dict) -> dict:
+    """
+    Read a JSON object from a cache file
+
+    :param cache_path: the path of the cache file
+    :param object_pairs_hook: the type of the loaded objects, e.g. OrderedDict
+    :return: the cached object, an empty one if the file is missing, unreadable or does not hold a JSON object
+    """
+    try:
+        with open(cache_path, 'r') as cache_file:
+            cache = json.load(cache_file, object_pairs_hook=object_pairs_hook)
+    except (OSError, ValueError):
+        return object_pairs_hook()
+    return cache if isinstance(cache, dict) else object_pairs_hook()
+
+
+def atomic_write_json(file_path: str, data: Any):
+    """
+    Write data as JSON to a uniquely named temporary file and rename it to the file path, so concurrent writers never
+    clash and readers never see a partially written file
+
+    :param file_path: the path of the file
+    :param data: the data to write, must be json serializable
+    """
+    directory = os.path.dirname(file_path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    temp_fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f'{os.path.basename(file_path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(temp_fd, 'w') as temp_file:
+            json.dump(data, temp_file)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+
+def refresh_remote_release_version_cache(cache_path: str, cached_version: str = ''):
+    """
+    Get latest release version from remote github page and write it with the check time to the cache file.
+    A failed check is cached as well, so an offline machine tries again only after the cache TTL.
+
+    :param cache_path: the path of the cache file
+    :param cached_version: the version to keep in the cache if the check fails
+    """
+    cache = {
+        'version': get_last_remote_release_version(print_errors=False) or cached_version,
+        'checked_at': time.time(),
+    }
+    with suppress(OSError):
+        atomic_write_json(cache_path, cache)
+
+
+# The background thread refreshing the version check cache, see get_cached_remote_release_version
+REMOTE_RELEASE_VERSION_REFRESH = None  # type: Optional[threading.Thread]
+
+
+def get_cached_remote_release_version() -> str:
+    """
+    Get latest release version from the version check cache, without waiting for the network.
+    If the cache is missing or older than SDK_LATEST_VERSION_CACHE_TTL, it is refreshed in a background thread
+    for the next runs.
+
+    :return: the cached latest release version, or an empty string if it is not known
+    """
+    if is_version_check_disabled():
+        return ''
+
+    cache_path = os.path.join(get_sdk_cache_dir(), SDK_LATEST_VERSION_CACHE_FILE)
+    cache = load_json_cache(cache_path)
+    cached_version = cache.get('version')
+    if not isinstance(cached_version, str):
+        cached_version = ''
+    checked_at = cache.get('checked_at')
+    if not isinstance(checked_at, (int, float)):
+        checked_at = 0
+    if not 0 <= time.time() - checked_at < SDK_LATEST_VERSION_CACHE_TTL:
+        # a daemon thread never delays the command, if the command ends first the check is done in a later run
+        global REMOTE_RELEASE_VERSION_REFRESH
+        REMOTE_RELEASE_VERSION_REFRESH = threading.Thread(target=refresh_remote_release_version_cache,
+                                                          args=(cache_path, cached_version), daemon=True)
+        REMOTE_RELEASE_VERSION_REFRESH.start()
+
+    return cached_version
+
+
+def wait_for_remote_release_version_refresh():
+    """
+    Wait for the background refresh of the version check cache, if it is running.
+    Must be called before forking worker processes: a process forked while the refresh runs may inherit the locks it
+    holds (e.g. of the logging and ssl modules) in a locked state. The wait is bounded by the check request timeout.
+    """
+    if REMOTE_RELEASE_VERSION_REFRESH:
+        REMOTE_RELEASE_VERSION_REFRESH.join()
+
+
+def get_sdk_version() -> str:
+    """
+    Get the installed demisto-sdk version
+
+    :return: the version string, or an empty string if demisto-sdk is not installed as a distribution
+    """
+    try:
+        from pkg_resources import get_distribution
+        return get_distribution('demisto-sdk').version
+    except Exception:
+        return ''
+
+
+def copy_document(document):
+    """Copies the dicts and lists of a parsed document, the rest of the (immutable) values are shared."""
+    if isinstance(document, dict):
+        return {key: copy_document(value) for key, value in document.items()}
+    if isinstance(document, list):
+        return [copy_document(value) for value in document]
+    return document
+
+
+class DocumentCache:
+    """Process wide cache of parsed content files.
+
+    The documents are keyed by path and parse method, and are re-parsed once the mtime or the size of the file
+    changes. The least recently used documents are evicted once there are more than `max_size` of them.
+    Every `load` returns a private copy of the document, so a caller modifying it does not affect the other callers.
+    The cache is thread safe, the files are parsed outside of its lock.
+    """
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._documents = OrderedDict()  # type: OrderedDict
+        self._lock = threading.Lock()
+
+    def load(self, file_path: str, method: Callable):
+        """Returns a copy of the file parsed with method, parsing it only if it changed since it was cached.
+
+        Args:
+            file_path (str): the file path.
+            method (Callable): parses a stream of the file contents, e.g. yaml.safe_load or json.load.
+
+        Returns:
+            The parsed file.
+        """
+        path = os.path.abspath(os.path.expanduser(file_path))
+        file_stat = os.stat(path)
+        key = (path, method)
+        file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        with self._lock:
+            cached = self._documents.get(key)
+            if cached and cached[0] == file_version:
+                self.hits += 1
+                self._documents.move_to_end(key)
+                return copy_document(cached[1])
+            self.misses += 1
+
+        with open(path, mode="r", encoding="utf8") as f:
+            replaced = f.read().replace("simple: =", "simple: '='")
+        # revert str to stream for loader
+        document = method(io.StringIO(replaced))
+        with self._lock:
+            self._documents[key] = (file_version, document)
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
+
+        return copy_document(document)
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def print_stats(self):
+        print_v(f'Parsed files cache: {self.hits} hits, {self.misses} misses')
+
+
+try:
+    DOCUMENT_CACHE = DocumentCache(int(os.getenv('DEMISTO_SDK_DOCUMENT_CACHE_SIZE', 512)))
+except ValueError:
+    DOCUMENT_CACHE = DocumentCache()
+
+
 def get_file(method, file_path, type_of_file):
     data_dictionary = None
-    with open(os.path.expanduser(file_path), mode="r", encoding="utf8") as f:
-        if file_path.endswith(type_of_file):
-            read_file = f.read()
-            replaced = read_file.replace("simple: =", "simple: '='")
-            # revert str to stream for loader
-            stream = io.StringIO(replaced)
-            try:
-                data_dictionary = method(stream)
-            except Exception as e:
-                print_error(
-                    "{} has a structure issue of file type{}. Error was: {}".format(file_path, type_of_file, str(e)))
-                return {}
+    if file_path.endswith(type_of_file):
+        try:
+            data_dictionary = DOCUMENT_CACHE.load(file_path, method)
+        except OSError:
+            raise
+        except Exception as e:
+            print_error(
+                "{} has a structure issue of file type{}. Error was: {}".format(file_path, type_of_file, str(e)))
+            return {}
     if type(data_dictionary) is dict:
         return data_dictionary
     return {}
@@ -1006,6 +1449,7 @@ def is_external_repository():
     Returns True if script executed from private repository
 
     """
+    import git
     git_repo = git.Repo(os.getcwd(), search_parent_directories=True)
     private_settings_path = os.path.join(git_repo.working_dir, '.private-repo-settings')
     return os.path.exists(private_settings_path)
@@ -1016,6 +1460,7 @@ def get_content_path() -> str:
     Returns:
         str: Absolute content path
     """
+    import git
     try:
         git_repo = git.Repo(os.getcwd(), search_parent_directories=True)
         remote_url = git_repo.remote().urls.__next__()
@@ -1096,8 +1541,7 @@ def get_last_release_version():
 
     :return: tag
     """
-    tags = run_command('git tag').split('\n')
-    tags = [tag for tag in tags if re.match(r'\d+\.\d+\.\d+', tag) is not None]
+    tags = [tag for tag in GIT_CHANGE_SET.tags if re.match(r'\d+\.\d+\.\d+', tag) is not None]
     tags.sort(key=LooseVersion, reverse=True)
 
     return tags[0]
@@ -1111,6 +1555,7 @@ def is_file_from_content_repo(file_path: str) -> Tuple[bool, str]:
         bool: if file is part of content repo.
         str: relative path of file in content repo.
     """
+    import git
     git_repo = git.Repo(os.getcwd(),
                         search_parent_directories=True)
     remote_url = git_repo.remote().urls.__next__()
@@ -1411,15 +1856,14 @@ def camel_to_snake(camel: str) -> str:
 def open_id_set_file(id_set_path):
     id_set = None
     try:
-        with open(id_set_path, 'r') as id_set_file:
-            id_set = json.load(id_set_file)
+        id_set = load_id_set(id_set_path)
     except IOError:
         print_warning("Could not open id_set file")
     finally:
         return id_set
 
 
-def get_demisto_version(demisto_client: demisto_client) -> str:
+def get_demisto_version(demisto_client: 'demisto_client') -> str:
     """
     Args:
         demisto_client: A configured demisto_client instance
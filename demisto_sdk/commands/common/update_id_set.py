@@ -1,34 +1,36 @@
-import copy
 import glob
-import itertools
+import hashlib
 import json
 import os
 import re
 import time
-from collections import OrderedDict
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime
 from distutils.version import LooseVersion
 from enum import Enum
-from functools import partial
+from functools import lru_cache, partial
 from multiprocessing import Pool, cpu_count
-from typing import Callable, Optional, Tuple
+from typing import Callable, Dict, Mapping, Optional, Tuple
 
 import click
-import networkx
 from demisto_sdk.commands.common.constants import (CLASSIFIERS_DIR,
                                                    DASHBOARDS_DIR,
                                                    INCIDENT_FIELDS_DIR,
                                                    INCIDENT_TYPES_DIR,
                                                    INDICATOR_FIELDS_DIR,
                                                    INDICATOR_TYPES_DIR,
+                                                   INTEGRATIONS_DIR,
                                                    LAYOUTS_DIR, MAPPERS_DIR,
-                                                   REPORTS_DIR, SCRIPTS_DIR,
+                                                   PLAYBOOKS_DIR, REPORTS_DIR,
+                                                   SCRIPTS_DIR,
                                                    TEST_PLAYBOOKS_DIR,
                                                    WIDGETS_DIR, FileType)
-from demisto_sdk.commands.common.tools import (LOG_COLORS, find_type, get_json,
-                                               get_pack_name, get_yaml,
-                                               print_color, print_error,
-                                               print_warning)
+from demisto_sdk.commands.common.id_set_db import load_id_set, save_id_set
+from demisto_sdk.commands.common.playbook_graph import PlaybookTasksGraph
+from demisto_sdk.commands.common.tools import (
+    LOG_COLORS, atomic_write_json, find_type, get_json, get_pack_name,
+    get_sdk_version, get_yaml, print_color, print_error, print_warning,
+    wait_for_remote_release_version_refresh)
 from demisto_sdk.commands.unify.unifier import Unifier
 
 CONTENT_ENTITIES = ['Integrations', 'Scripts', 'Playbooks', 'TestPlaybooks', 'Classifiers',
@@ -76,103 +78,6 @@ BUILT_IN_FIELDS = [
 ]
 
 
-def build_tasks_graph(playbook_data):
-    """
-    Builds tasks flow graph.
-
-    Args:
-        playbook_data (dict): playbook yml data.
-
-    Returns:
-        DiGraph: all tasks of given playbook.
-    """
-    initial_task = playbook_data.get('starttaskid', '')
-    tasks = playbook_data.get('tasks', {})
-
-    graph = networkx.DiGraph()
-    graph.add_node(initial_task, mandatory=True)  # add starting task as root of the direct graph
-
-    found_new_tasks = True
-    while found_new_tasks:
-        current_number_of_nodes = graph.number_of_nodes()
-        leaf_nodes = {node for node in graph.nodes() if graph.out_degree(node) == 0}
-
-        for leaf in leaf_nodes:
-            leaf_task = tasks.get(leaf)
-            leaf_mandatory = graph.nodes[leaf]['mandatory']
-
-            # In this case the playbook is invalid, starttaskid contains invalid task id.
-            if not leaf_task:
-                print_warning(f'{playbook_data.get("id")}: No such task {leaf} in playbook')
-                continue
-
-            leaf_next_tasks = sum(leaf_task.get('nexttasks', {}).values(), [])
-
-            for task_id in leaf_next_tasks:
-                task = tasks.get(task_id)
-                if not task:
-                    print_warning(f'{playbook_data.get("id")}: No such task {leaf} in playbook')
-                    continue
-
-                # If task can't be skipped and predecessor task is mandatory - set as mandatory.
-                mandatory = leaf_mandatory and not task.get('skipunavailable', False)
-                if task_id not in graph.nodes():
-                    graph.add_node(task_id, mandatory=mandatory)
-                else:
-                    # If task already in graph, update mandatory field.
-                    # If one of the paths to the task is mandatory - set as mandatory.
-                    graph.nodes[task_id]['mandatory'] = graph.nodes[task_id]['mandatory'] or mandatory
-                graph.add_edge(leaf, task_id)
-
-        found_new_tasks = graph.number_of_nodes() > current_number_of_nodes
-
-    return graph
-
-
-def get_task_ids_from_playbook(param_to_enrich_by: str, data_dict: dict, graph: networkx.DiGraph) -> tuple:
-    implementing_ids = set()
-    implementing_ids_skippable = set()
-    tasks = data_dict.get('tasks', {})
-
-    for task_id, task in tasks.items():
-        task_details = task.get('task', {})
-
-        enriched_id = task_details.get(param_to_enrich_by)
-        try:
-            skippable = not graph.nodes[task_id]['mandatory']
-        except KeyError:
-            # if task id not in the graph - the task is unreachable.
-            print_error(f'{data_dict["id"]}: task {task_id} is not connected')
-            continue
-        if enriched_id:
-            implementing_ids.add(enriched_id)
-            if skippable:
-                implementing_ids_skippable.add(enriched_id)
-
-    return list(implementing_ids), list(implementing_ids_skippable)
-
-
-def get_commands_from_playbook(data_dict: dict) -> tuple:
-    command_to_integration = {}
-    command_to_integration_skippable = set()
-    tasks = data_dict.get('tasks', {})
-
-    for task in tasks.values():
-        task_details = task.get('task', {})
-
-        command = task_details.get('script')
-        skippable = task.get('skipunavailable', False)
-        if command:
-            splitted_cmd = command.split('|')
-
-            if 'Builtin' not in command:
-                command_to_integration[splitted_cmd[-1]] = splitted_cmd[0]
-                if skippable:
-                    command_to_integration_skippable.add(splitted_cmd[-1])
-
-    return command_to_integration, list(command_to_integration_skippable)
-
-
 def get_integration_api_modules(file_path, data_dictionary, is_unified_integration):
     unifier = Unifier(os.path.dirname(file_path))
     if is_unified_integration:
@@ -324,44 +229,101 @@ def get_incident_fields_by_playbook_input(playbook_input):
     return dependent_incident_fields
 
 
-def get_dependent_incident_and_indicator_fields(data_dictionary):
-    """Finds the incident fields and indicator fields dependent on this playbook
+class PlaybookDataExtractor:
+    """Extracts the id_set data of a playbook in a single pass over its tasks and inputs.
 
     Args:
-        data_dictionary (dict): The playbook data dict
-
-    Returns:
-        set. set of incident fields related to this playbook
+        data_dictionary (dict): The playbook data dict.
+        graph (PlaybookTasksGraph): The tasks flow graph of the playbook, required to collect implementing ids.
+        task_ids_params (tuple): The task fields to collect the implementing ids by, e.g. `scriptName`.
     """
-    dependent_incident_fields = set()
-    dependent_indicator_fields = set()
-    for task in data_dictionary.get('tasks', {}).values():
+
+    def __init__(self, data_dictionary: dict, graph: Optional[PlaybookTasksGraph] = None, task_ids_params: tuple = ()):
+        self.playbook_id = data_dictionary.get('id')
+        self.graph = graph
+        self.task_ids_params = task_ids_params
+
+        self.implementing_ids: Dict[str, set] = {param: set() for param in task_ids_params}
+        self.implementing_ids_skippable: Dict[str, set] = {param: set() for param in task_ids_params}
+        self.command_to_integration: Dict[str, str] = {}
+        self.command_to_integration_skippable: set = set()
+        self.incident_fields: set = set()
+        self.indicator_fields: set = set()
+
+        for task_id, task in data_dictionary.get('tasks', {}).items():
+            self.visit_task(task_id, task)
+
+        # incident fields by playbook inputs
+        for playbook_input in data_dictionary.get('inputs', []):
+            input_value_dict = playbook_input.get('value', {})
+            if input_value_dict and isinstance(input_value_dict, dict):  # deprecated playbooks bug
+                self.incident_fields.update(get_incident_fields_by_playbook_input(input_value_dict))
+
+    def visit_task(self, task_id: str, task: dict):
+        task_details = task.get('task', {})
+
+        if self.graph and not self.graph.is_reachable(task_id):
+            print_error(f'{self.playbook_id}: task {task_id} is not connected')
+        elif self.graph:
+            skippable = not self.graph.is_mandatory(task_id)
+            for param in self.task_ids_params:
+                enriched_id = task_details.get(param)
+                if enriched_id:
+                    self.implementing_ids[param].add(enriched_id)
+                    if skippable:
+                        self.implementing_ids_skippable[param].add(enriched_id)
+
+        command = task_details.get('script')
+        if command:
+            if 'Builtin' not in command:
+                splitted_cmd = command.split('|')
+                self.command_to_integration[splitted_cmd[-1]] = splitted_cmd[0]
+                if task.get('skipunavailable', False):
+                    self.command_to_integration_skippable.add(splitted_cmd[-1])
+
+            # incident and indicator fields dependent by scripts arguments
+            if 'setIncident' in command:
+                self.incident_fields.update(get_fields_by_script_argument(task))
+            if 'setIndicator' in command:
+                self.indicator_fields.update(get_fields_by_script_argument(task))
+
         # incident fields dependent by field mapping
         related_incident_fields = task.get('fieldMapping')
         if related_incident_fields:
             for incident_field in related_incident_fields:
                 if incident_field not in BUILT_IN_FIELDS:
-                    dependent_incident_fields.add(incident_field.get('incidentfield'))
+                    self.incident_fields.add(incident_field.get('incidentfield'))
 
-        # incident fields dependent by scripts arguments
-        if 'setIncident' in task.get('task', {}).get('script', ''):
-            dependent_incident_fields.update(get_fields_by_script_argument(task))
-            # incident fields dependent by scripts arguments
-        if 'setIndicator' in task.get('task', {}).get('script', ''):
-            dependent_indicator_fields.update(get_fields_by_script_argument(task))
+    def get_task_ids(self, param: str) -> tuple:
+        return list(self.implementing_ids[param]), list(self.implementing_ids_skippable[param])
 
-    # incident fields by playbook inputs
-    for playbook_input in data_dictionary.get('inputs', []):
-        input_value_dict = playbook_input.get('value', {})
-        if input_value_dict and isinstance(input_value_dict, dict):  # deprecated playbooks bug
-            dependent_incident_fields.update(get_incident_fields_by_playbook_input(input_value_dict))
 
-    return dependent_incident_fields, dependent_indicator_fields
+def get_task_ids_from_playbook(param_to_enrich_by: str, data_dict: dict, graph: PlaybookTasksGraph) -> tuple:
+    return PlaybookDataExtractor(data_dict, graph, task_ids_params=(param_to_enrich_by,)).get_task_ids(
+        param_to_enrich_by)
+
+
+def get_commands_from_playbook(data_dict: dict) -> tuple:
+    extractor = PlaybookDataExtractor(data_dict)
+    return extractor.command_to_integration, list(extractor.command_to_integration_skippable)
+
+
+def get_dependent_incident_and_indicator_fields(data_dictionary):
+    """Finds the incident fields and indicator fields dependent on this playbook
+
+    Args:
+        data_dictionary (dict): The playbook data dict
+
+    Returns:
+        set. set of incident fields related to this playbook
+    """
+    extractor = PlaybookDataExtractor(data_dictionary)
+    return extractor.incident_fields, extractor.indicator_fields
 
 
 def get_playbook_data(file_path: str) -> dict:
     data_dictionary = get_yaml(file_path)
-    graph = build_tasks_graph(data_dictionary)
+    graph = PlaybookTasksGraph(data_dictionary)
 
     id_ = data_dictionary.get('id', '-')
     name = data_dictionary.get('name', '-')
@@ -370,19 +332,14 @@ def get_playbook_data(file_path: str) -> dict:
     toversion = data_dictionary.get('toversion')
     fromversion = data_dictionary.get('fromversion')
 
-    implementing_scripts, implementing_scripts_skippable = get_task_ids_from_playbook('scriptName',
-                                                                                      data_dictionary,
-                                                                                      graph
-                                                                                      )
-    implementing_playbooks, implementing_playbooks_skippable = get_task_ids_from_playbook('playbookName',
-                                                                                          data_dictionary,
-                                                                                          graph
-                                                                                          )
-    command_to_integration, command_to_integration_skippable = get_commands_from_playbook(data_dictionary)
+    extractor = PlaybookDataExtractor(data_dictionary, graph, task_ids_params=('scriptName', 'playbookName'))
+    implementing_scripts, implementing_scripts_skippable = extractor.get_task_ids('scriptName')
+    implementing_playbooks, implementing_playbooks_skippable = extractor.get_task_ids('playbookName')
+    command_to_integration = extractor.command_to_integration
     skippable_tasks = (implementing_scripts_skippable + implementing_playbooks_skippable +
-                       command_to_integration_skippable)
+                       list(extractor.command_to_integration_skippable))
     pack = get_pack_name(file_path)
-    dependent_incident_fields, dependent_indicator_fields = get_dependent_incident_and_indicator_fields(data_dictionary)
+    dependent_incident_fields, dependent_indicator_fields = extractor.incident_fields, extractor.indicator_fields
 
     playbook_data = create_common_entity_data(path=file_path, name=name, to_version=toversion,
                                               from_version=fromversion, pack=pack)
@@ -475,22 +432,17 @@ def get_values_for_keys_recursively(json_object: dict, keys_to_search: list) ->
     values = {key: [] for key in keys_to_search}  # type: dict
 
     def get_values(current_object):
-        if not current_object or not isinstance(current_object, (dict, list)):
-            return
-
-        if current_object and isinstance(current_object, list):
-            if isinstance(current_object[0], dict):
-                for item in current_object:
-                    get_values(item)
-            return
-
-        for key, value in current_object.items():
-            if isinstance(value, (dict, list)):
-                get_values(value)
-            elif key in keys_to_search:
-                if isinstance(value, (str, int, float, bool)):
+        if isinstance(current_object, dict):
+            for key, value in current_object.items():
+                if isinstance(value, (dict, list)):
+                    get_values(value)
+                elif key in values and isinstance(value, (str, int, float, bool)):
                     values[key].append(value)
 
+        elif current_object and isinstance(current_object, list) and isinstance(current_object[0], dict):
+            for item in current_object:
+                get_values(item)
+
     get_values(json_object)
     return values
 
@@ -998,6 +950,200 @@ def get_general_paths(path):
     return files
 
 
+ENTITY_TO_SECTION = dict(zip(CONTENT_ENTITIES, ID_SET_ENTITIES))
+
+ENTITY_TO_DIR = {
+    'Integrations': INTEGRATIONS_DIR,
+    'Scripts': SCRIPTS_DIR,
+    'Playbooks': PLAYBOOKS_DIR,
+    'TestPlaybooks': TEST_PLAYBOOKS_DIR,
+    'Classifiers': CLASSIFIERS_DIR,
+    'Dashboards': DASHBOARDS_DIR,
+    'IncidentFields': INCIDENT_FIELDS_DIR,
+    'IncidentTypes': INCIDENT_TYPES_DIR,
+    'IndicatorFields': INDICATOR_FIELDS_DIR,
+    'IndicatorTypes': INDICATOR_TYPES_DIR,
+    'Layouts': LAYOUTS_DIR,
+    'Reports': REPORTS_DIR,
+    'Widgets': WIDGETS_DIR,
+    'Mappers': MAPPERS_DIR,
+}
+
+# Entities which can't be extracted before all the files of another entity were processed.
+ENTITY_DEPENDENCIES = {
+    'IncidentFields': 'IncidentTypes',
+    'IndicatorTypes': 'Integrations',
+}
+
+# The file types of the entities extracted by their type alone, and the function extracting each of them.
+ENTITY_FILE_TYPES = {
+    'Playbooks': {FileType.PLAYBOOK: get_playbook_data},
+    'Classifiers': {FileType.CLASSIFIER: get_classifier_data, FileType.OLD_CLASSIFIER: get_classifier_data},
+    'Dashboards': {FileType.DASHBOARD: get_dashboard_data},
+    'IncidentTypes': {FileType.INCIDENT_TYPE: get_incident_type_data},
+    'IndicatorFields': {FileType.INDICATOR_FIELD: get_general_data},
+    'Layouts': {FileType.LAYOUT: get_layout_data, FileType.LAYOUTS_CONTAINER: get_layoutscontainer_data},
+    'Reports': {FileType.REPORT: get_report_data},
+    'Widgets': {FileType.WIDGET: get_widget_data},
+    'Mappers': {FileType.MAPPER: get_mapper_data},
+}
+
+
+def get_entity_paths(entity: str) -> list:
+    if entity == 'Integrations':
+        return get_integrations_paths()
+    if entity == 'Playbooks':
+        return get_playbooks_paths()
+    return get_general_paths(ENTITY_TO_DIR[entity])
+
+
+def get_id_set_manifest(objects_to_create: list) -> list:
+    """
+    Collects the files to process into the id_set, walking every content directory once.
+    Entities other entities depend on are collected first, so that their files are processed first.
+
+    Args:
+        objects_to_create: The content entities to collect.
+
+    Returns:
+        list. (entities, path) tuples, where entities are all the requested entities the file may be.
+    """
+    entities_to_create = sorted((entity for entity in CONTENT_ENTITIES if entity in objects_to_create),
+                                key=lambda entity: entity not in ENTITY_DEPENDENCIES.values())
+    dir_to_entities = OrderedDict()  # type: OrderedDict
+    for entity in entities_to_create:
+        dir_to_entities.setdefault(ENTITY_TO_DIR[entity], []).append(entity)
+
+    manifest = []  # type: list
+    for entities in dir_to_entities.values():
+        manifest.extend((tuple(entities), path) for path in get_entity_paths(entities[0]))
+
+    return manifest
+
+
+def process_id_set_file(entities: tuple, file_path: str, print_logs: bool, dependencies: Optional[list] = None) -> dict:
+    """
+    Process a single file collected into the id_set manifest.
+
+    Args:
+        entities: The entities the file may be, as collected by get_id_set_manifest.
+        file_path: The file path.
+        print_logs: Whether to print logs to stdout.
+        dependencies: The id_set section the entity depends on, see ENTITY_DEPENDENCIES.
+
+    Returns:
+        dict. id_set section name to the list of items extracted from the file.
+    """
+    if 'Integrations' in entities:
+        return {'integrations': process_integration(file_path, print_logs)}
+    if 'Scripts' in entities:
+        return {'scripts': process_script(file_path, print_logs)}
+    if 'TestPlaybooks' in entities:
+        playbook, script = process_test_playbook_path(file_path, print_logs)
+        return {'TestPlaybooks': [playbook] if playbook else [], 'scripts': [script] if script else []}
+    if 'IncidentFields' in entities:
+        return {'IncidentFields': process_incident_fields(file_path, print_logs, dependencies or [])}
+    if 'IndicatorTypes' in entities:
+        return {'IndicatorTypes': process_indicator_types(file_path, print_logs, dependencies or [])}
+
+    sections = {}
+    try:
+        file_type = find_type(file_path)
+        for entity in entities:
+            data_extraction_func = ENTITY_FILE_TYPES[entity].get(file_type)
+            if data_extraction_func:
+                if print_logs:
+                    print(f'adding {file_path} to id_set')
+                sections[ENTITY_TO_SECTION[entity]] = [data_extraction_func(file_path)]
+    except Exception as exp:  # noqa
+        print_error(f'failed to process {file_path}, Error: {str(exp)}')
+        raise
+
+    return sections
+
+
+def process_manifest_job(job: tuple, print_logs: bool) -> tuple:
+    index, entities, file_path, dependencies = job
+    return index, process_id_set_file(entities, file_path, print_logs, dependencies)
+
+
+def process_id_set_manifest(pool, manifest: list, id_set_cache: 'IDSetCache', print_logs: bool,
+                            on_file_processed: Callable = lambda: None) -> list:
+    """
+    Streams all the manifest files through a single pool queue.
+    The files of an entity listed in ENTITY_DEPENDENCIES are queued as soon as all the files of the entity it depends
+    on were processed, and files found in the id_set cache are not queued at all.
+
+    Args:
+        pool: The process pool.
+        manifest: The manifest returned by get_id_set_manifest.
+        id_set_cache: The id_set cache.
+        print_logs: Whether to print logs to stdout.
+        on_file_processed: Called once per processed file.
+
+    Returns:
+        list. The id_set sections extracted from each of the manifest files, ordered as the manifest.
+    """
+    results = [None] * len(manifest)  # type: list
+    remaining = Counter(entity for entities, _ in manifest for entity in entities)
+    waiting = defaultdict(list)  # type: dict
+    keys = {}
+    dependent_jobs = []
+    process_job = partial(process_manifest_job, print_logs=print_logs)
+
+    def get_section(entity: str) -> list:
+        section = ENTITY_TO_SECTION[entity]
+        return [item for (entities, _), sections in zip(manifest, results) if entity in entities
+                for item in sections.get(section, [])]
+
+    def get_jobs(indices: list, dependencies: Optional[list] = None) -> list:
+        jobs = []
+        context = json.dumps(dependencies, sort_keys=True) if id_set_cache.cache_path and dependencies else ''
+        for index in indices:
+            entities, path = manifest[index]
+            keys[index] = id_set_cache.get_key(path, context)
+            cached_sections = id_set_cache.get_records(path, keys[index], entities)
+            if cached_sections is None:
+                jobs.append((index, entities, path, dependencies))
+            else:
+                set_result(index, cached_sections)
+        return jobs
+
+    def set_result(index: int, sections: dict):
+        results[index] = sections
+        on_file_processed()
+        for entity in manifest[index][0]:
+            remaining[entity] -= 1
+            if remaining[entity] == 0 and entity in waiting:
+                jobs = get_jobs(waiting.pop(entity), get_section(entity))
+                if jobs:
+                    dependent_jobs.append(pool.map_async(process_job, jobs))
+
+    independent_indices = []
+    ready_dependent_indices = []
+    for index, (entities, _) in enumerate(manifest):
+        dependency = next((ENTITY_DEPENDENCIES[entity] for entity in entities if entity in ENTITY_DEPENDENCIES), None)
+        if not dependency:
+            independent_indices.append(index)
+        elif remaining[dependency]:
+            waiting[dependency].append(index)
+        else:
+            # the entity it depends on was not requested or has no files
+            ready_dependent_indices.append(index)
+
+    jobs = get_jobs(independent_indices) + get_jobs(ready_dependent_indices, [])
+    for index, sections in pool.imap_unordered(process_job, jobs):
+        id_set_cache.set_records(manifest[index][1], keys[index], sections, manifest[index][0])
+        set_result(index, sections)
+
+    while dependent_jobs:
+        for index, sections in dependent_jobs.pop(0).get():
+            id_set_cache.set_records(manifest[index][1], keys[index], sections, manifest[index][0])
+            set_result(index, sections)
+
+    return results
+
+
 class IDSetType(Enum):
     PLAYBOOK = 'playbooks'
     INTEGRATION = 'integrations'
@@ -1019,53 +1165,282 @@ class IDSetType(Enum):
         return value in cls._value2member_map_
 
 
+class IDSetSection(list):
+    """A single section of the id_set (a list of `{id: data}` items) with lookup indexes.
+
+    The indexes (by id, name, pack and integration command) are built on the first lookup and kept up to date
+    on `append`/`extend`, any other mutation drops them so they are rebuilt on the next lookup.
+    Commands can add indexes of their own with `get_index`, those are dropped on any mutation.
+    The section is still a list, so it is serialized to the same id_set.json layout.
+    """
+    _indexes = None  # type: Optional[dict]
+    _custom_indexes = None  # type: Optional[dict]
+
+    @classmethod
+    def from_list(cls, items):
+        """Returns items as an IDSetSection, items which already are an IDSetSection are returned as is.
+
+        Args:
+            items (list): id_set section items.
+
+        Returns:
+            IDSetSection. The indexed section.
+        """
+        if isinstance(items, cls):
+            return items
+        return cls(items or [])
+
+    def _index_item(self, item):
+        item_id, item_data = next(iter(item.items()))
+        self._indexes['id'].setdefault(item_id, []).append(item)
+        if not isinstance(item_data, dict):
+            return
+        if item_data.get('name'):
+            self._indexes['name'].setdefault(item_data['name'], []).append(item)
+        if item_data.get('pack'):
+            self._indexes['pack'].setdefault(item_data['pack'], []).append(item)
+        for command in item_data.get('commands', []):
+            self._indexes['command'].setdefault(command, []).append(item)
+
+    def _lookup(self, index_name, key):
+        if self._indexes is None:
+            self._indexes = {'id': {}, 'name': {}, 'pack': {}, 'command': {}}
+            for item in self:
+                self._index_item(item)
+        return self._indexes[index_name].get(key, [])
+
+    def get_by_id(self, item_id):
+        """Returns the items with the given id."""
+        return self._lookup('id', item_id)
+
+    def get_by_name(self, name):
+        """Returns the items with the given name."""
+        return self._lookup('name', name)
+
+    def get_by_pack(self, pack):
+        """Returns the items which belong to the given pack."""
+        return self._lookup('pack', pack)
+
+    def get_by_command(self, command):
+        """Returns the items (integrations) which implement the given command."""
+        return self._lookup('command', command)
+
+    def get_packs_by_name(self, name):
+        """Returns the packs of the items with the given name."""
+        return {next(iter(item.values()))['pack'] for item in self.get_by_name(name)
+                if next(iter(item.values())).get('pack')}
+
+    def get_index(self, build_index: Callable):
+        """Returns the index built by `build_index(section)`, building it only on the first call.
+
+        Args:
+            build_index (Callable): builds an index of the given section.
+
+        Returns:
+            The index.
+        """
+        if self._custom_indexes is None:
+            self._custom_indexes = {}
+        if build_index not in self._custom_indexes:
+            self._custom_indexes[build_index] = build_index(self)
+        return self._custom_indexes[build_index]
+
+    def append(self, item):
+        super().append(item)
+        self._custom_indexes = None
+        if self._indexes is not None:
+            self._index_item(item)
+
+    def extend(self, items):
+        items = list(items)
+        super().extend(items)
+        self._custom_indexes = None
+        if self._indexes is not None:
+            for item in items:
+                self._index_item(item)
+
+    def __add__(self, other):
+        return IDSetSection(list.__add__(self, list(other)))
+
+    def _invalidate(method: Callable) -> Callable:  # type: ignore[misc]
+        def wrapper(self, *args, **kwargs):
+            self._indexes = None
+            self._custom_indexes = None
+            return method(self, *args, **kwargs)
+        return wrapper
+
+    insert = _invalidate(list.insert)
+    remove = _invalidate(list.remove)
+    pop = _invalidate(list.pop)
+    clear = _invalidate(list.clear)
+    sort = _invalidate(list.sort)
+    reverse = _invalidate(list.reverse)
+    __setitem__ = _invalidate(list.__setitem__)
+    __delitem__ = _invalidate(list.__delitem__)
+    __iadd__ = _invalidate(list.__iadd__)
+    __imul__ = _invalidate(list.__imul__)
+    del _invalidate
+
+
 class IDSet:
     def __init__(self, id_set_dict=None):
-        self._id_set_dict = id_set_dict if id_set_dict else {}
+        self._id_set_dict = OrderedDict()  # type: OrderedDict
+        for object_type, items in (id_set_dict or {}).items():
+            self._id_set_dict[object_type] = IDSetSection.from_list(items)
 
     def get_dict(self):
         return self._id_set_dict
 
     def get_list(self, item_type):
-        return self._id_set_dict.get(item_type, [])
+        return self._id_set_dict.get(item_type, IDSetSection())
 
     def add_to_list(self, object_type: IDSetType, obj):
         if not IDSetType.has_value(object_type):
             raise ValueError(f'Invalid IDSetType {object_type}')
 
-        self._id_set_dict.setdefault(object_type, []).append(obj)
+        self._id_set_dict.setdefault(object_type, IDSetSection()).append(obj)
+
+    def get_by_id(self, item_type, item_id):
+        """Returns the items of the given section with the given id."""
+        return self.get_list(item_type).get_by_id(item_id)
+
+    def get_by_name(self, item_type, name):
+        """Returns the items of the given section with the given name."""
+        return self.get_list(item_type).get_by_name(name)
+
+    def get_pack_items(self, item_type, pack):
+        """Returns the items of the given section which belong to the given pack."""
+        return self.get_list(item_type).get_by_pack(pack)
+
+    def get_packs_by_command(self, command):
+        """Returns the packs of the integrations which implement the given command."""
+        return {next(iter(item.values()))['pack'] for item in self.get_list('integrations').get_by_command(command)
+                if next(iter(item.values())).get('pack')}
+
+    def get_packs_by_name(self, item_type, name):
+        """Returns the packs of the items of the given section (e.g. scripts or playbooks) with the given name."""
+        return self.get_list(item_type).get_packs_by_name(name)
+
+
+class IDSetCache:
+    """Persistent cache of the records extracted from each content file during id_set creation.
+
+    Every entry is keyed by the processed path and the entities the path was processed as (e.g. a file of the
+    Classifiers dir is processed both as a classifier and as a mapper), and is valid only as long as the content
+    hash of the path, the extraction context (e.g. the incident types an incident field record was built with) and
+    the demisto-sdk version are unchanged.
+    """
+    CACHE_VERSION = 3
+
+    def __init__(self, cache_path: Optional[str] = None):
+        self.cache_path = cache_path
+        self.sdk_version = get_sdk_version()
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}  # type: dict
+        if cache_path and os.path.isfile(cache_path):
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, 'r') as cache_file:  # type: ignore[arg-type]
+                cache = json.load(cache_file)
+        except (OSError, ValueError) as exc:
+            print_warning(f'Could not load the id_set cache from {self.cache_path}, ignoring it. Error: {exc}')
+            return
+
+        if cache.get('cache_version') == self.CACHE_VERSION and cache.get('sdk_version') == self.sdk_version:
+            self._entries = cache.get('entries', {})
+
+    @staticmethod
+    def get_content_hash(path: str) -> str:
+        """Hashes the content of a file, or of the top level files of a package directory."""
+        content_hash = hashlib.sha1()
+        if os.path.isdir(path):
+            file_paths = sorted(os.path.join(path, name) for name in os.listdir(path))
+        else:
+            file_paths = [path]
+
+        for file_path in file_paths:
+            if not os.path.isfile(file_path):
+                continue
+            content_hash.update(os.path.basename(file_path).encode())
+            with open(file_path, 'rb') as f:
+                content_hash.update(f.read())
+
+        return content_hash.hexdigest()
+
+    def get_key(self, path: str, context: str = '') -> str:
+        """Returns the cache key of a path.
+
+        Args:
+            path: The processed path.
+            context: Any data besides the path content that the records depend on.
+        """
+        if not self.cache_path:
+            return ''
+        return hashlib.sha1(f'{self.get_content_hash(path)}:{context}'.encode()).hexdigest()
+
+    def get_records(self, path: str, key: str, entities: tuple = ()):
+        """Returns the records cached for the path processed as the given entities under the given key,
+        or None if there are none."""
+        if not self.cache_path:
+            return None
+
+        entry = self._entries.get(path, {}).get(','.join(entities))
+        if entry and entry.get('key') == key:
+            self.hits += 1
+            return entry['records']
+
+        self.misses += 1
+        return None
+
+    def set_records(self, path: str, key: str, records, entities: tuple = ()):
+        if self.cache_path:
+            self._entries.setdefault(path, {})[','.join(entities)] = {'key': key, 'records': records}
+
+    def save(self):
+        """Writes the cache, dropping the entries of deleted files."""
+        if not self.cache_path:
+            return
+
+        entries = {path: entry for path, entry in self._entries.items() if os.path.exists(path)}
+        cache = {
+            'cache_version': self.CACHE_VERSION,
+            'sdk_version': self.sdk_version,
+            'entries': entries
+        }
+        atomic_write_json(self.cache_path, cache)
 
 
 def merge_id_sets_from_files(first_id_set_path, second_id_set_path, output_id_set_path, print_logs: bool = True):
     """
     Merges two id sets. Loads them from files and saves the merged unified id_set into output_id_set_path.
     """
-    with open(first_id_set_path, mode='r') as f1:
-        first_id_set = json.load(f1)
-
-    with open(second_id_set_path, mode='r') as f2:
-        second_id_set = json.load(f2)
+    first_id_set = load_id_set(first_id_set_path)
+    second_id_set = load_id_set(second_id_set_path)
 
     unified_id_set, duplicates = merge_id_sets(first_id_set, second_id_set, print_logs)
 
     if unified_id_set:
-        with open(output_id_set_path, mode='w', encoding='utf-8') as f:
-            json.dump(unified_id_set.get_dict(), f, indent=4)
+        save_id_set(unified_id_set.get_dict(), output_id_set_path)
 
     return unified_id_set, duplicates
 
 
-def merge_id_sets(first_id_set_dict: dict, second_id_set_dict: dict, print_logs: bool = True):
+def merge_id_sets(first_id_set_dict: Mapping, second_id_set_dict: Mapping, print_logs: bool = True):
     """
     Merged two id_set dictionaries into single id_set. Returns the unified id_set dict.
+
+    The unified id_set shares the items of both id_sets instead of copying them, only the section lists are new.
     """
     duplicates = []
-    united_id_set = IDSet(copy.deepcopy(first_id_set_dict))
+    united_id_set = IDSet({object_type: IDSetSection(object_list)
+                           for object_type, object_list in first_id_set_dict.items()})
 
     first_id_set = IDSet(first_id_set_dict)
-    second_id_set = IDSet(second_id_set_dict)
 
-    for object_type, object_list in second_id_set.get_dict().items():
+    for object_type, object_list in second_id_set_dict.items():
         subset = first_id_set.get_list(object_type)
 
         for obj in object_list:
@@ -1087,13 +1462,15 @@ DEFAULT_ID_SET_PATH = "./Tests/id_set.json"
 
 
 def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, objects_to_create: list = None,  # noqa: C901
-                     print_logs: bool = True):
+                     print_logs: bool = True, cache_path: Optional[str] = None):
     """Re create the id set
 
     Args:
         id_set_path (str, optional): If passed an empty string will use default path. Pass in None to avoid saving the id set.
             Defaults to DEFAULT_ID_SET_PATH.
         objects_to_create (list, optional): [description]. Defaults to None.
+        cache_path (str, optional): Path of the id_set cache. Only files which changed since the cache was written
+            will be re-parsed. Defaults to the DEMISTO_SDK_ID_SET_CACHE_PATH env var, no cache is used if not set.
 
     Returns: id set object
     """
@@ -1121,8 +1498,7 @@ def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, objects_t
                     "doesn't require a refresh. Will use current id set. "
                     "If you want to force an id set referesh unset DEMISTO_SDK_ID_SET_REFRESH_INTERVAL or set to -1.",
                     LOG_COLORS.GREEN)
-                with open(id_set_path, mode="r") as f:
-                    return json.load(f)
+                return load_id_set(id_set_path)
             else:
                 print_color(f"DEMISTO_SDK_ID_SET_REFRESH_INTERVAL env var is set but current id_set: {id_set_path} "
                             f"modify time: {mtime_dt} is older than refresh interval. "
@@ -1138,220 +1514,37 @@ def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, objects_t
         objects_to_create = CONTENT_ENTITIES
 
     start_time = time.time()
-    scripts_list = []
-    playbooks_list = []
-    integration_list = []
-    testplaybooks_list = []
-
-    classifiers_list = []
-    dashboards_list = []
-    incident_fields_list = []
-    incident_type_list = []
-    indicator_fields_list = []
-    indicator_types_list = []
-    layouts_list = []
-    reports_list = []
-    widgets_list = []
-    mappers_list = []
-
-    pool = Pool(processes=int(cpu_count() * 1.5))
+    id_set_cache = IDSetCache(cache_path or os.getenv('DEMISTO_SDK_ID_SET_CACHE_PATH'))
 
     print_color("Starting the creation of the id_set", LOG_COLORS.GREEN)
 
-    with click.progressbar(length=len(objects_to_create), label="Progress of id set creation") as progress_bar:
-        if 'Integrations' in objects_to_create:
-            print_color("\nStarting iteration over Integrations", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_integration,
-                                        print_logs=print_logs
-                                        ),
-                                get_integrations_paths()):
-                integration_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'Playbooks' in objects_to_create:
-            print_color("\nStarting iteration over Playbooks", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.PLAYBOOK,),
-                                        data_extraction_func=get_playbook_data,
-                                        ),
-                                get_playbooks_paths()):
-                playbooks_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'Scripts' in objects_to_create:
-            print_color("\nStarting iteration over Scripts", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_script,
-                                        print_logs=print_logs
-                                        ),
-                                get_general_paths(SCRIPTS_DIR)):
-                scripts_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'TestPlaybooks' in objects_to_create:
-            print_color("\nStarting iteration over TestPlaybooks", LOG_COLORS.GREEN)
-            for pair in pool.map(partial(process_test_playbook_path,
-                                         print_logs=print_logs
-                                         ),
-                                 get_general_paths(TEST_PLAYBOOKS_DIR)):
-                if pair[0]:
-                    testplaybooks_list.append(pair[0])
-                if pair[1]:
-                    scripts_list.append(pair[1])
-
-        progress_bar.update(1)
-
-        if 'Classifiers' in objects_to_create:
-            print_color("\nStarting iteration over Classifiers", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.CLASSIFIER, FileType.OLD_CLASSIFIER),
-                                        data_extraction_func=get_classifier_data,
-                                        ),
-                                get_general_paths(CLASSIFIERS_DIR)):
-                classifiers_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'Dashboards' in objects_to_create:
-            print_color("\nStarting iteration over Dashboards", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.DASHBOARD,),
-                                        data_extraction_func=get_dashboard_data,
-                                        ),
-                                get_general_paths(DASHBOARDS_DIR)):
-                dashboards_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'IncidentTypes' in objects_to_create:
-            print_color("\nStarting iteration over Incident Types", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.INCIDENT_TYPE,),
-                                        data_extraction_func=get_incident_type_data,
-                                        ),
-                                get_general_paths(INCIDENT_TYPES_DIR)):
-                incident_type_list.extend(arr)
-
-        progress_bar.update(1)
-
-        # Has to be called after 'IncidentTypes' is called
-        if 'IncidentFields' in objects_to_create:
-            print_color("\nStarting iteration over Incident Fields", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_incident_fields,
-                                        print_logs=print_logs,
-                                        incidents_types_list=incident_type_list
-                                        ),
-                                get_general_paths(INCIDENT_FIELDS_DIR)):
-                incident_fields_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'IndicatorFields' in objects_to_create:
-            print_color("\nStarting iteration over Indicator Fields", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.INDICATOR_FIELD,),
-                                        data_extraction_func=get_general_data,
-                                        ),
-                                get_general_paths(INDICATOR_FIELDS_DIR)):
-                indicator_fields_list.extend(arr)
-
-        progress_bar.update(1)
-
-        # Has to be called after 'Integrations' is called
-        if 'IndicatorTypes' in objects_to_create:
-            print_color("\nStarting iteration over Indicator Types", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_indicator_types,
-                                        print_logs=print_logs,
-                                        all_integrations=integration_list
-                                        ),
-                                get_general_paths(INDICATOR_TYPES_DIR)):
-                indicator_types_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'Layouts' in objects_to_create:
-            print_color("\nStarting iteration over Layouts", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.LAYOUT,),
-                                        data_extraction_func=get_layout_data,
-                                        ),
-                                get_general_paths(LAYOUTS_DIR)):
-                layouts_list.extend(arr)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.LAYOUTS_CONTAINER,),
-                                        data_extraction_func=get_layoutscontainer_data,
-                                        ),
-                                get_general_paths(LAYOUTS_DIR)):
-                layouts_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'Reports' in objects_to_create:
-            print_color("\nStarting iteration over Reports", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.REPORT,),
-                                        data_extraction_func=get_report_data,
-                                        ),
-                                get_general_paths(REPORTS_DIR)):
-                reports_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'Widgets' in objects_to_create:
-            print_color("\nStarting iteration over Widgets", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.WIDGET,),
-                                        data_extraction_func=get_widget_data,
-                                        ),
-                                get_general_paths(WIDGETS_DIR)):
-                widgets_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'Mappers' in objects_to_create:
-            print_color("\nStarting iteration over Mappers", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.MAPPER,),
-                                        data_extraction_func=get_mapper_data,
-                                        ),
-                                get_general_paths(MAPPERS_DIR)):
-                mappers_list.extend(arr)
-
-        progress_bar.update(1)
+    manifest = get_id_set_manifest(objects_to_create)
+    wait_for_remote_release_version_refresh()
+    with Pool(processes=int(cpu_count() * 1.5)) as pool, \
+            click.progressbar(length=len(manifest), label="Progress of id set creation") as progress_bar:
+        results = process_id_set_manifest(pool, manifest, id_set_cache, print_logs,
+                                          on_file_processed=lambda: progress_bar.update(1))
+
+    if id_set_cache.cache_path:
+        id_set_cache.save()
+        print_color(f'Re-parsed {id_set_cache.misses} changed files, reused {id_set_cache.hits} cached entries '
+                    f'from {id_set_cache.cache_path}', LOG_COLORS.GREEN)
+
+    sections = defaultdict(list)  # type: dict
+    for file_sections in results:
+        for section, items in file_sections.items():
+            sections[section].extend(items)
 
     new_ids_dict = OrderedDict()
     # we sort each time the whole set in case someone manually changed something
     # it shouldn't take too much time
-    new_ids_dict['scripts'] = sort(scripts_list)
-    new_ids_dict['playbooks'] = sort(playbooks_list)
-    new_ids_dict['integrations'] = sort(integration_list)
-    new_ids_dict['TestPlaybooks'] = sort(testplaybooks_list)
-    new_ids_dict['Classifiers'] = sort(classifiers_list)
-    new_ids_dict['Dashboards'] = sort(dashboards_list)
-    new_ids_dict['IncidentFields'] = sort(incident_fields_list)
-    new_ids_dict['IncidentTypes'] = sort(incident_type_list)
-    new_ids_dict['IndicatorFields'] = sort(indicator_fields_list)
-    new_ids_dict['IndicatorTypes'] = sort(indicator_types_list)
-    new_ids_dict['Layouts'] = sort(layouts_list)
-    new_ids_dict['Reports'] = sort(reports_list)
-    new_ids_dict['Widgets'] = sort(widgets_list)
-    new_ids_dict['Mappers'] = sort(mappers_list)
+    for section in ['scripts', 'playbooks', 'integrations', 'TestPlaybooks', 'Classifiers', 'Dashboards',
+                    'IncidentFields', 'IncidentTypes', 'IndicatorFields', 'IndicatorTypes', 'Layouts', 'Reports',
+                    'Widgets', 'Mappers']:
+        new_ids_dict[section] = sort(sections[section])
 
     if id_set_path:
-        with open(id_set_path, 'w+') as id_set_file:
-            json.dump(new_ids_dict, id_set_file, indent=4)
+        save_id_set(new_ids_dict, id_set_path)
     exec_time = time.time() - start_time
     print_color("Finished the creation of the id_set. Total time: {} seconds".format(exec_time), LOG_COLORS.GREEN)
 
@@ -1371,76 +1564,104 @@ def find_duplicates(id_set, print_logs):
         if print_logs:
             print_color("Checking diff for {}".format(object_type), LOG_COLORS.GREEN)
         objects = id_set.get(object_type)
-        ids = {list(specific_item.keys())[0] for specific_item in objects}
-
-        dup_list = []
-        for id_to_check in ids:
-            if has_duplicate(objects, id_to_check, object_type, print_logs):
-                dup_list.append(id_to_check)
-        lists_to_return.append(dup_list)
+        lists_to_return.append(get_duplicate_ids(objects, object_type, print_logs))
 
     if print_logs:
         print_color("Checking diff for Incident and Indicator Fields", LOG_COLORS.GREEN)
 
     fields = id_set['IncidentFields'] + id_set['IndicatorFields']
-    field_ids = {list(field.keys())[0] for field in fields}
-
-    field_list = []
-    for field_to_check in field_ids:
-        if has_duplicate(fields, field_to_check, 'Indicator and Incident Fields', print_logs):
-            field_list.append(field_to_check)
-    lists_to_return.append(field_list)
+    lists_to_return.append(get_duplicate_ids(fields, 'Indicator and Incident Fields', print_logs))
 
     return lists_to_return
 
 
+def get_duplicate_ids(id_set_subset_list, object_type=None, print_logs=True):
+    """
+    Finds the ids of id_set_subset_list which belong to 2 or more items with overlapping versions.
+    The items are grouped by id in a single pass, so the check is linear in the number of items.
+
+    Args:
+        id_set_subset_list (list): id_set section items.
+        object_type (str): the section name.
+        print_logs (bool): whether to print warnings on items with the same id but different names.
+
+    Returns:
+        list. The duplicate ids, in the order of their first appearance.
+    """
+    items_by_id = OrderedDict()  # type: OrderedDict
+    for item in id_set_subset_list:
+        item_id, item_data = next(iter(item.items()))
+        if item_data:
+            items_by_id.setdefault(item_id, []).append(item_data)
+
+    return [item_id for item_id, items_data in items_by_id.items()
+            if len(items_data) > 1 and has_overlapping_versions(items_data, item_id, object_type, print_logs)]
+
+
 def has_duplicate(id_set_subset_list, id_to_check, object_type=None, print_logs=True, external_object=None):
     """
     Finds if id_set_subset_list contains a duplicate items with the same id_to_check.
 
     Pass `external_object` to check if it exists in `id_set_subset_list`.
     Otherwise the function will check if `id_set_subset_list` contains 2 or more items with the id of `id_to_check`
+    Pass an `IDSetSection` as `id_set_subset_list` to avoid re-indexing it on every call.
 
     """
-    duplicates = [duplicate for duplicate in id_set_subset_list if duplicate.get(id_to_check)]
+    duplicates = [duplicate[id_to_check] for duplicate in
+                  IDSetSection.from_list(id_set_subset_list).get_by_id(id_to_check) if duplicate.get(id_to_check)]
 
-    if external_object and len(duplicates) == 0:
-        return False
+    if external_object:
+        duplicates.append(list(external_object.values())[0])
 
-    if not external_object and len(duplicates) == 1:
+    if len(duplicates) < 2:
         return False
 
-    if external_object:
-        duplicates.append(external_object)
-
-    for dup1, dup2 in itertools.combinations(duplicates, 2):
-        dict1 = list(dup1.values())[0]
-        dict2 = list(dup2.values())[0]
-        dict1_from_version = LooseVersion(dict1.get('fromversion', '0.0.0'))
-        dict2_from_version = LooseVersion(dict2.get('fromversion', '0.0.0'))
-        dict1_to_version = LooseVersion(dict1.get('toversion', '99.99.99'))
-        dict2_to_version = LooseVersion(dict2.get('toversion', '99.99.99'))
-
-        if print_logs and dict1.get('name') != dict2.get('name'):
-            print_warning('The following {} have the same ID ({}) but different names: '
-                          '"{}", "{}".'.format(object_type, id_to_check, dict1.get('name'), dict2.get('name')))
-
-        # Checks if the Layouts kind is different then they are not duplicates
-        if object_type == 'Layouts':
-            if dict1.get('kind', '') != dict2.get('kind', ''):
-                return False
-
-        # A: 3.0.0 - 3.6.0
-        # B: 3.5.0 - 4.5.0
-        # C: 3.5.2 - 3.5.4
-        # D: 4.5.0 - 99.99.99
-        if any([
-            dict1_from_version <= dict2_from_version < dict1_to_version,  # will catch (B, C), (A, B), (A, C)
-            dict1_from_version < dict2_to_version <= dict1_to_version,  # will catch (B, C), (A, C)
-            dict2_from_version <= dict1_from_version < dict2_to_version,  # will catch (C, B), (B, A), (C, A)
-            dict2_from_version < dict1_to_version <= dict2_to_version,  # will catch (C, B), (C, A)
-        ]):
-            return True
+    return has_overlapping_versions(duplicates, id_to_check, object_type, print_logs)
+
+
+@lru_cache(maxsize=None)
+def parse_version(version: str) -> tuple:
+    """Parses the version once, the result compares the same as the LooseVersion of it."""
+    return tuple(LooseVersion(version).version)
+
+
+def has_overlapping_versions(items_data, id_to_check, object_type=None, print_logs=True):
+    """
+    Checks whether the version ranges (fromversion - toversion) of items with the same id overlap.
+
+    Layouts of different kinds never overlap. The ranges are sorted by fromversion and swept once, so that
+    every range only needs to be compared to the furthest toversion seen so far:
+    A: 3.0.0 - 3.6.0
+    B: 3.5.0 - 4.5.0 <- overlaps A
+    C: 4.5.0 - 99.99.99 <- doesn't overlap A or B
+
+    Args:
+        items_data (list): the data of the items with the same id.
+        id_to_check (str): the id of the items.
+        object_type (str): the section name.
+        print_logs (bool): whether to print a warning if the items have different names.
+
+    Returns:
+        bool. Whether any two of the items versions overlap.
+    """
+    names = list(OrderedDict.fromkeys(item_data.get('name') for item_data in items_data))
+    if print_logs and len(names) > 1:
+        print_warning('The following {} have the same ID ({}) but different names: {}.'.format(
+            object_type, id_to_check, ', '.join(f'"{name}"' for name in names)))
+
+    items_by_kind = defaultdict(list)  # type: dict
+    for item_data in items_data:
+        # Layouts of different kinds are not duplicates
+        kind = item_data.get('kind', '') if object_type == 'Layouts' else ''
+        items_by_kind[kind].append((parse_version(item_data.get('fromversion', '0.0.0')),
+                                    parse_version(item_data.get('toversion', '99.99.99'))))
+
+    for version_ranges in items_by_kind.values():
+        max_to_version = None
+        for from_version, to_version in sorted(version_ranges):
+            if max_to_version is not None and from_version < max_to_version:
+                return True
+            max_to_version = to_version if max_to_version is None else max(max_to_version, to_version)
 
     return False
 
@@ -1,17 +1,22 @@
+from typing import Optional
+
 from demisto_sdk.commands.common.update_id_set import re_create_id_set
 
 
 class IDSetCreator:
-    def __init__(self, output: str = '', print_logs: bool = True):
+    def __init__(self, output: str = '', print_logs: bool = True, cache_path: Optional[str] = None):
         """IDSetCreator
 
         Args:
             output (str, optional): The output path. Set to None to avoid creation of a file. '' means the default path.
              Defaults to 'Tests/id_set.json'.
             print_logs (bool, optional): Print log output. Defaults to True.
+            cache_path (str, optional): The id_set cache path. Only files which changed since the last run will be
+             re-parsed. Defaults to None.
         """
         self.output = output
         self.print_logs = print_logs
+        self.cache_path = cache_path
 
     def create_id_set(self):
-        return re_create_id_set(id_set_path=self.output, print_logs=self.print_logs)
+        return re_create_id_set(id_set_path=self.output, print_logs=self.print_logs, cache_path=self.cache_path)
@@ -1,25 +1,34 @@
+import copy
 import json
 import logging
 import os
 import shutil
 import sys
 import tempfile
+import timeit
 import unittest
 from tempfile import mkdtemp
 
 import pytest
+import yaml
 from demisto_sdk.commands.common.constants import FileType
 from demisto_sdk.commands.common.git_tools import git_path
+from demisto_sdk.commands.common.playbook_graph import PlaybookTasksGraph
 from demisto_sdk.commands.common.update_id_set import (
-    find_duplicates, get_classifier_data, get_dashboard_data,
-    get_fields_by_script_argument, get_general_data,
+    CONTENT_ENTITIES, ID_SET_ENTITIES, IDSet, IDSetCache, IDSetSection,
+    PlaybookDataExtractor, find_duplicates, get_classifier_data,
+    get_commands_from_playbook, get_dashboard_data,
+    get_dependent_incident_and_indicator_fields, get_fields_by_script_argument,
+    get_general_data, get_id_set_manifest,
     get_incident_fields_by_playbook_input, get_incident_type_data,
     get_indicator_type_data, get_layout_data, get_layoutscontainer_data,
     get_mapper_data, get_playbook_data, get_report_data, get_script_data,
-    get_values_for_keys_recursively, get_widget_data, has_duplicate,
-    merge_id_sets, process_general_items, process_incident_fields,
-    process_integration, process_script, re_create_id_set)
+    get_task_ids_from_playbook, get_values_for_keys_recursively,
+    get_widget_data, has_duplicate, merge_id_sets, process_general_items,
+    process_incident_fields, process_integration, process_script,
+    re_create_id_set)
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
+from TestSuite.test_tools import ChangeCWD
 from TestSuite.utils import IsEqualFunctions
 
 TESTS_DIR = f'{git_path()}/demisto_sdk/tests'
@@ -1323,6 +1332,106 @@ class TestGenericFunctions:
         result = get_fields_by_script_argument(task)
         assert "field_name" in result
 
+    @staticmethod
+    def test_playbook_data_extractor():
+        """
+        Given
+            - A playbook with script, sub-playbook, command and setIncident tasks, an unconnected task
+              and an incident field input.
+
+        When
+            - Extracting the playbook data in a single pass over its tasks.
+
+        Then
+            - Ensure the implementing ids of the connected tasks are extracted with their skippable ones.
+            - Ensure the commands and the incident fields are extracted.
+            - Ensure the single purpose helpers extract the same data.
+        """
+        playbook = {
+            'id': 'Playbook',
+            'starttaskid': '0',
+            'tasks': {
+                '0': {'task': {'scriptName': 'Script'}, 'nexttasks': {'#none#': ['1', '2']}},
+                '1': {'task': {'playbookName': 'SubPlaybook'}, 'skipunavailable': True,
+                      'nexttasks': {'#none#': ['3']}},
+                '2': {'task': {'script': 'Builtin|||setIncident'}, 'scriptarguments': {'field_name': {'simple': 'a'}},
+                      'nexttasks': {'#none#': ['3']}},
+                '3': {'task': {'script': 'Integration|||command'}, 'skipunavailable': True},
+                '4': {'task': {'scriptName': 'UnconnectedScript'}},
+            },
+            'inputs': [{'value': {'simple': '${incident.input_field}'}}],
+        }
+
+        extractor = PlaybookDataExtractor(playbook, PlaybookTasksGraph(playbook), ('scriptName', 'playbookName'))
+
+        assert extractor.get_task_ids('scriptName') == (['Script'], [])
+        assert extractor.get_task_ids('playbookName') == (['SubPlaybook'], ['SubPlaybook'])
+        assert extractor.command_to_integration == {'command': 'Integration'}
+        assert extractor.command_to_integration_skippable == {'command'}
+        assert extractor.incident_fields == {'field_name', 'input_field'}
+        assert extractor.indicator_fields == set()
+
+        assert get_task_ids_from_playbook('playbookName', playbook, PlaybookTasksGraph(playbook)) == \
+            (['SubPlaybook'], ['SubPlaybook'])
+        assert get_commands_from_playbook(playbook) == ({'command': 'Integration'}, ['command'])
+        assert get_dependent_incident_and_indicator_fields(playbook) == ({'field_name', 'input_field'}, set())
+
+
+PLAYBOOK_BENCHMARK_COPIES = int(os.getenv('DEMISTO_SDK_PLAYBOOK_BENCHMARK_COPIES', 0))
+
+
+def replicate_playbook_tasks(playbook: dict, copies: int) -> dict:
+    """Returns the playbook with its tasks replicated, every copy connected to the original start task."""
+    playbook = copy.deepcopy(playbook)
+    tasks = playbook['tasks']
+    offset = max(int(task_id) for task_id in tasks) + 1
+    original_tasks = list(tasks.items())
+    start_task = tasks[playbook['starttaskid']]
+    for copy_index in range(1, copies):
+        def copy_id(task_id):
+            return str(int(task_id) + copy_index * offset)
+
+        for task_id, task in original_tasks:
+            task_copy = copy.deepcopy(task)
+            task_copy['id'] = copy_id(task_id)
+            task_copy['nexttasks'] = {label: [copy_id(next_id) for next_id in next_ids]
+                                      for label, next_ids in (task.get('nexttasks') or {}).items()}
+            tasks[copy_id(task_id)] = task_copy
+        start_task.setdefault('nexttasks', {}).setdefault('#none#', []).append(copy_id(playbook['starttaskid']))
+    return playbook
+
+
+@pytest.mark.skipif(not PLAYBOOK_BENCHMARK_COPIES,
+                    reason='Set DEMISTO_SDK_PLAYBOOK_BENCHMARK_COPIES to run the playbook data extraction benchmark')
+def test_playbook_data_extraction_benchmark(capsys):
+    """
+    Given
+    - a playbook whose tasks are replicated DEMISTO_SDK_PLAYBOOK_BENCHMARK_COPIES times, and a layoutscontainer
+
+    When
+    - extracting their id_set data, the parsing of the files excluded
+
+    Then
+    - report the best time of 5 rounds of 50 extractions of each
+    """
+    with open(os.path.join(TESTS_DIR, 'test_files', 'playbook-valid-id-test.yml')) as playbook_file:
+        playbook = replicate_playbook_tasks(yaml.safe_load(playbook_file), PLAYBOOK_BENCHMARK_COPIES)
+    with open(os.path.join(git_path(), 'demisto_sdk', 'commands', 'create_id_set', 'tests', 'test_data',
+                           'layoutscontainer-to-test.json')) as layout_file:
+        layoutscontainer = json.load(layout_file)
+
+    def extract_playbook():
+        PlaybookDataExtractor(playbook, PlaybookTasksGraph(playbook), task_ids_params=('scriptName', 'playbookName'))
+
+    def extract_layoutscontainer():
+        get_values_for_keys_recursively(layoutscontainer, ['fieldId'])
+
+    with capsys.disabled():
+        for name, extract in ((f'playbook of {len(playbook["tasks"])} tasks', extract_playbook),
+                              ('layoutscontainer', extract_layoutscontainer)):
+            best_time = min(timeit.repeat(extract, number=50, repeat=5)) / 50
+            print(f'\n{name} data extraction: {best_time * 1000:.3f} ms')
+
 
 class TestFlow(unittest.TestCase):
     WIDGET_DATA = {
@@ -1631,3 +1740,332 @@ def test_merged_id_sets_with_duplicates(caplog):
 
     assert output_id_set is None
     assert duplicates == ['ScriptFoo']
+
+
+def test_merge_id_sets__shares_items():
+    """
+    Given
+    - two id_sets without duplicate items
+
+    When
+    - merged
+
+    Then
+    - ensure the unified id_set shares the items of both id_sets instead of copying them
+    - ensure the first id_set is not modified
+    """
+    first_id_set = {'scripts': [{'ScriptFoo': {'name': 'ScriptFoo'}}]}
+    second_id_set = {'scripts': [{'ScriptBar': {'name': 'ScriptBar'}}], 'playbooks': [{'Foo': {'name': 'Foo'}}]}
+
+    output_id_set, duplicates = merge_id_sets(first_id_set, second_id_set)
+
+    assert not duplicates
+    assert output_id_set.get_list('scripts')[0] is first_id_set['scripts'][0]
+    assert output_id_set.get_list('scripts')[1] is second_id_set['scripts'][0]
+    assert output_id_set.get_list('playbooks')[0] is second_id_set['playbooks'][0]
+    assert first_id_set == {'scripts': [{'ScriptFoo': {'name': 'ScriptFoo'}}]}
+
+
+@pytest.mark.parametrize('versions, is_duplicate', [
+    ([('3.0.0', '3.6.0'), ('4.5.0', '99.99.99'), ('3.6.0', '4.5.0')], False),
+    ([('3.0.0', '3.6.0'), ('4.5.0', '99.99.99'), ('3.5.0', '4.5.0')], True),
+    ([('3.0.0', '99.99.99'), ('3.5.2', '3.5.4')], True),
+    ([('5.0.0', '5.5.0'), ('5.5.0', '6.0.0'), ('6.0.0', '99.99.99'), ('5.9.9', '6.0.0')], True),
+    ([('6.0.0', '99.99.99'), ('6.0.0', '99.99.99')], True),
+    ([('5.10.0', '99.99.99'), ('5.9.0', '5.10.0')], False),
+])
+def test_find_duplicates__version_ranges(versions, is_duplicate):
+    """
+    Given
+    - an id_set with scripts of the same id and the given version ranges
+
+    When
+    - finding duplicates
+
+    Then
+    - ensure the id is a duplicate only if any two of the version ranges overlap
+    """
+    id_set = {section: [] for section in ID_SET_ENTITIES}
+    id_set['scripts'] = [{'ScriptFoo': {'name': 'ScriptFoo', 'fromversion': from_version, 'toversion': to_version}}
+                         for from_version, to_version in versions]
+    id_set['scripts'].append({'ScriptBar': {'name': 'ScriptBar'}})
+
+    duplicates = find_duplicates(id_set, print_logs=False)
+
+    assert duplicates[ID_SET_ENTITIES.index('scripts')] == (['ScriptFoo'] if is_duplicate else [])
+    assert has_duplicate(id_set['scripts'], 'ScriptFoo', 'scripts', False) is is_duplicate
+
+
+class TestIDSetCache:
+    @staticmethod
+    def get_cached_records(id_set_cache, path, context=''):
+        return id_set_cache.get_records(path, id_set_cache.get_key(path, context))
+
+    @staticmethod
+    def cache_file(id_set_cache, path, context=''):
+        with open(path) as f:
+            id_set_cache.set_records(path, id_set_cache.get_key(path, context), [{path: {'content': f.read()}}])
+
+    def test_get_records__only_changed_files_missing(self, tmp_path):
+        """
+        Given
+        - an id_set cache written after processing two files
+
+        When
+        - one of the files is changed
+
+        Then
+        - ensure the cached records are returned only for the unchanged file
+        """
+        first_path, second_path = str(tmp_path / 'first.json'), str(tmp_path / 'second.json')
+        open(first_path, 'w').write('first')
+        open(second_path, 'w').write('second')
+        cache_path = str(tmp_path / 'id_set_cache.json')
+
+        id_set_cache = IDSetCache(cache_path)
+        self.cache_file(id_set_cache, first_path)
+        self.cache_file(id_set_cache, second_path)
+        id_set_cache.save()
+
+        open(second_path, 'w').write('changed')
+        id_set_cache = IDSetCache(cache_path)
+
+        assert self.get_cached_records(id_set_cache, first_path) == [{first_path: {'content': 'first'}}]
+        assert self.get_cached_records(id_set_cache, second_path) is None
+        assert (id_set_cache.hits, id_set_cache.misses) == (1, 1)
+
+    def test_get_records__context_changed(self, tmp_path):
+        """
+        Given
+        - an id_set cache of a file processed with a given context
+
+        When
+        - getting the file records with a different context
+
+        Then
+        - ensure no records are returned
+        """
+        path = str(tmp_path / 'incidentfield.json')
+        open(path, 'w').write('field')
+
+        id_set_cache = IDSetCache(str(tmp_path / 'id_set_cache.json'))
+        self.cache_file(id_set_cache, path, context='type1')
+
+        assert self.get_cached_records(id_set_cache, path, context='type1')
+        assert self.get_cached_records(id_set_cache, path, context='type2') is None
+
+    def test_save__drops_deleted_files_and_sdk_version_change(self, tmp_path, mocker):
+        """
+        Given
+        - an id_set cache of two files
+
+        When
+        - one of the files is deleted
+        - the cache is loaded by another demisto-sdk version
+
+        Then
+        - ensure the deleted file is dropped from the saved cache
+        - ensure the cache is ignored by the other version
+        """
+        import demisto_sdk.commands.common.update_id_set as uis
+        first_path, second_path = str(tmp_path / 'first.json'), str(tmp_path / 'second.json')
+        open(first_path, 'w').write('first')
+        open(second_path, 'w').write('second')
+        cache_path = str(tmp_path / 'id_set_cache.json')
+        mocker.patch.object(uis, 'get_sdk_version', return_value='1.0.0')
+
+        id_set_cache = IDSetCache(cache_path)
+        self.cache_file(id_set_cache, first_path)
+        self.cache_file(id_set_cache, second_path)
+        os.remove(second_path)
+        id_set_cache.save()
+        with open(cache_path) as cache_file:
+            assert list(json.load(cache_file)['entries']) == [first_path]
+
+        mocker.patch.object(uis, 'get_sdk_version', return_value='1.0.1')
+        assert self.get_cached_records(IDSetCache(cache_path), first_path) is None
+
+
+class TestIDSetManifest:
+    INTEGRATION = {
+        'commonfields': {'id': 'Whois'},
+        'name': 'Whois',
+        'category': 'Data Enrichment & Threat Intelligence',
+        'script': {'script': '', 'type': 'python', 'commands': [{'name': 'whois'}]}
+    }
+    INCIDENT_TYPE = {'id': 'Phishing', 'name': 'Phishing', 'color': '#FFFFFF'}
+    INCIDENT_FIELD = {'id': 'incident_emailfrom', 'name': 'Email From', 'cliName': 'emailfrom',
+                      'associatedToAll': True, 'associatedTypes': ['all']}
+    INDICATOR_TYPE = {'id': 'Domain', 'details': 'Domain', 'regex': '', 'reputationCommand': 'whois'}
+    LAYOUT = {'typeId': 'Phishing', 'kind': 'details', 'layout': {'id': 'Phishing', 'name': 'Phishing'}}
+    LAYOUTS_CONTAINER = {'id': 'Phishing', 'name': 'Phishing', 'group': 'incident', 'detailsV2': {}}
+    CLASSIFIER = {'id': 'Whois - classifier', 'name': 'Whois', 'type': 'classification', 'transformer': {},
+                  'keyTypeMap': {'phish': 'Phishing'}}
+    MAPPER = {'id': 'Whois - mapper', 'name': 'Whois', 'type': 'mapping-incoming',
+              'mapping': {'Phishing': {'internalMapping': {'Email From': {}}}}}
+
+    def create_repo(self, repo_path):
+        pack_path = repo_path / 'Packs' / 'Whois'
+        for entity_dir in ['Integrations', 'IncidentTypes', 'IncidentFields', 'IndicatorTypes', 'Layouts',
+                           'Classifiers']:
+            (pack_path / entity_dir).mkdir(parents=True)
+        with open(pack_path / 'Integrations' / 'integration-Whois.yml', 'w') as f:
+            yaml.safe_dump(self.INTEGRATION, f)
+        for file_path, data in [('IncidentTypes/incidenttype-Phishing.json', self.INCIDENT_TYPE),
+                                ('IncidentFields/incidentfield-emailfrom.json', self.INCIDENT_FIELD),
+                                ('IndicatorTypes/reputation-domain.json', self.INDICATOR_TYPE),
+                                ('Layouts/layout-details-Phishing.json', self.LAYOUT),
+                                ('Layouts/layoutscontainer-Phishing.json', self.LAYOUTS_CONTAINER),
+                                ('Classifiers/classifier-Whois.json', self.CLASSIFIER),
+                                ('Classifiers/classifier-mapper-Whois.json', self.MAPPER)]:
+            with open(pack_path / file_path, 'w') as f:
+                json.dump(data, f)
+
+    def test_get_id_set_manifest(self, tmp_path):
+        """
+        Given
+        - a pack with layouts and layoutscontainers sharing the Layouts dir, and classifiers and mappers sharing the
+         Classifiers dir
+
+        When
+        - collecting the id_set manifest
+
+        Then
+        - ensure every file is collected once, with all the entities it may be
+        - ensure the entities other entities depend on are collected first
+        """
+        self.create_repo(tmp_path)
+
+        with ChangeCWD(str(tmp_path)):
+            manifest = get_id_set_manifest(CONTENT_ENTITIES)
+
+        assert len(manifest) == 8
+        assert [entities for entities, _ in manifest[:2]] == [('Integrations',), ('IncidentTypes',)]
+        assert sorted(path for entities, path in manifest if entities == ('Layouts',)) == [
+            os.path.join('Packs', 'Whois', 'Layouts', 'layout-details-Phishing.json'),
+            os.path.join('Packs', 'Whois', 'Layouts', 'layoutscontainer-Phishing.json')
+        ]
+        assert len([path for entities, path in manifest if entities == ('Classifiers', 'Mappers')]) == 2
+
+    def test_re_create_id_set__dependent_entities(self, tmp_path, mocker):
+        """
+        Given
+        - an incident field associated to all incident types
+        - an indicator type whose reputation command is implemented by an integration
+
+        When
+        - creating the id_set
+
+        Then
+        - ensure the incident field is associated with the incident type
+        - ensure the indicator type is associated with the integration
+        - ensure layouts, layoutscontainers, classifiers and mappers are all extracted
+        """
+        import demisto_sdk.commands.common.update_id_set as uis
+        mocker.patch.object(uis, 'cpu_count', return_value=1)
+        self.create_repo(tmp_path)
+
+        with ChangeCWD(str(tmp_path)):
+            id_set = re_create_id_set(None, print_logs=False)
+
+        assert id_set['IncidentFields'][0]['incident_emailfrom']['incident_types'] == ['Phishing']
+        assert id_set['IndicatorTypes'][0]['Domain']['integrations'] == ['Whois']
+        assert sorted('kind' in layout['Phishing'] for layout in id_set['Layouts']) == [False, True]
+        assert list(id_set['Classifiers'][0]) == ['Whois - classifier']
+        assert list(id_set['Mappers'][0]) == ['Whois - mapper']
+
+    def test_re_create_id_set__cached(self, tmp_path, mocker):
+        """
+        Given
+        - an id_set cache written while creating the id_set of the classifiers only
+        - an id_set cache written while creating the full id_set
+
+        When
+        - creating the full id_set again with the caches
+
+        Then
+        - ensure files cached as other entities are re-processed, and mappers aren't dropped
+        - ensure all the files are taken from the full id_set cache
+        - ensure layouts, layoutscontainers, classifiers and mappers are all in the cached id_set
+        """
+        import demisto_sdk.commands.common.update_id_set as uis
+        mocker.patch.object(uis, 'cpu_count', return_value=1)
+        set_records = mocker.spy(uis.IDSetCache, 'set_records')
+        self.create_repo(tmp_path)
+        cache_path = str(tmp_path / 'id_set_cache.json')
+
+        with ChangeCWD(str(tmp_path)):
+            re_create_id_set(None, objects_to_create=['Classifiers'], print_logs=False, cache_path=cache_path)
+            id_set = re_create_id_set(None, print_logs=False, cache_path=cache_path)
+            assert set_records.call_count == 10
+            cached_id_set = re_create_id_set(None, print_logs=False, cache_path=cache_path)
+
+        assert set_records.call_count == 10
+        assert cached_id_set == id_set
+        assert sorted('kind' in layout['Phishing'] for layout in cached_id_set['Layouts']) == [False, True]
+        assert list(cached_id_set['Classifiers'][0]) == ['Whois - classifier']
+        assert list(cached_id_set['Mappers'][0]) == ['Whois - mapper']
+
+
+class TestIDSetSection:
+    ID_SET = {
+        'integrations': [
+            {'Whois': {'name': 'Whois', 'pack': 'Whois', 'commands': ['whois', 'domain']}},
+            {'Other': {'name': 'Other', 'pack': 'Other', 'commands': ['domain']}},
+        ],
+        'scripts': [
+            {'script1': {'name': 'Script One', 'pack': 'Pack1'}},
+            {'script2': {'name': 'Script Two', 'pack': 'Pack1'}},
+            {'script1': {'name': 'Script One', 'pack': 'Pack2', 'fromversion': '6.0.0'}},
+        ],
+    }
+
+    def test_lookups(self):
+        """
+        Given
+        - an id_set with scripts and integrations
+
+        When
+        - looking up items by id, name, pack and command
+
+        Then
+        - ensure all the matching items are returned
+        - ensure the id_set is serialized to the same layout
+        """
+        id_set = IDSet(copy.deepcopy(self.ID_SET))
+
+        assert len(id_set.get_by_id('scripts', 'script1')) == 2
+        assert id_set.get_by_name('scripts', 'Script Two') == [self.ID_SET['scripts'][1]]
+        assert len(id_set.get_pack_items('scripts', 'Pack1')) == 2
+        assert id_set.get_packs_by_name('scripts', 'Script One') == {'Pack1', 'Pack2'}
+        assert id_set.get_packs_by_command('domain') == {'Whois', 'Other'}
+        assert id_set.get_packs_by_command('whois') == {'Whois'}
+        assert id_set.get_by_id('playbooks', 'playbook') == []
+        assert json.loads(json.dumps(id_set.get_dict())) == self.ID_SET
+
+    def test_mutations(self):
+        """
+        Given
+        - an indexed id_set section
+
+        When
+        - appending, extending, removing and concatenating items
+
+        Then
+        - ensure the lookups reflect the changes
+        """
+        section = IDSetSection.from_list(copy.deepcopy(self.ID_SET['scripts']))
+        assert IDSetSection.from_list(section) is section
+        assert len(section.get_by_id('script1')) == 2
+
+        section.append({'script3': {'name': 'Script Three', 'pack': 'Pack3'}})
+        section.extend([{'script1': {'name': 'Script One', 'pack': 'Pack3'}}])
+        assert section.get_packs_by_name('Script One') == {'Pack1', 'Pack2', 'Pack3'}
+        assert len(section.get_by_pack('Pack3')) == 2
+
+        section.remove(section[0])
+        assert section.get_packs_by_name('Script One') == {'Pack2', 'Pack3'}
+
+        combined = section + [{'script4': {'name': 'Script Four'}}]
+        assert isinstance(combined, IDSetSection)
+        assert combined.get_by_id('script4') == [{'script4': {'name': 'Script Four'}}]
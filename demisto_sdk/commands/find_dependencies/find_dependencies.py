@@ -1,19 +1,36 @@
 import glob
+import hashlib
+import io
 import json
 import os
 import sys
-from copy import deepcopy
+from copy import copy
 from distutils.version import LooseVersion
-from typing import Union
+from multiprocessing import Pool, cpu_count
+from typing import Dict, Optional, Union
 
 import click
 import networkx as nx
 from demisto_sdk.commands.common import constants
-from demisto_sdk.commands.common.tools import print_error, print_warning
+from demisto_sdk.commands.common.id_set_db import (SQLiteIDSet, get_item_hash,
+                                                   load_id_set)
+from demisto_sdk.commands.common.tools import (
+    atomic_write_json, get_sdk_version, print_error, print_warning,
+    wait_for_remote_release_version_refresh)
+from demisto_sdk.commands.common.update_id_set import (IDSet, IDSetSection,
+                                                       parse_version)
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
 
 MINIMUM_DEPENDENCY_VERSION = LooseVersion('6.0.0')
 
+# The (key type, key) lookups made while searching the current pack dependencies, None when not recorded.
+DEPENDENCY_LOOKUPS = None  # type: Optional[set]
+
+# The id set sections the dependencies are searched in, the rest of the sections (e.g. TestPlaybooks) are not loaded.
+DEPENDENCIES_ID_SET_SECTIONS = ('scripts', 'playbooks', 'integrations', 'Layouts', 'IncidentFields', 'IndicatorFields',
+                                'IncidentTypes', 'IndicatorTypes', 'Classifiers', 'Mappers', 'Widgets', 'Dashboards',
+                                'Reports')
+
 
 class VerboseFile:
     def __init__(self, file_path=''):
@@ -35,6 +52,17 @@ class VerboseFile:
         self.fd = None
 
 
+class VerboseBuffer(VerboseFile):
+    """Collects the dependency explanations in memory, e.g. in a worker process."""
+
+    def __init__(self):
+        super().__init__()
+        self.fd = io.StringIO()
+
+    def getvalue(self) -> str:
+        return self.fd.getvalue()
+
+
 def parse_for_pack_metadata(dependency_graph: nx.DiGraph, graph_root: str) -> tuple:
     """
     Parses calculated dependency graph and returns first and all level parsed dependency.
@@ -50,10 +78,9 @@ def parse_for_pack_metadata(dependency_graph: nx.DiGraph, graph_root: str) -> tu
 
     """
     first_level_dependencies = {}
-    parsed_dependency_graph = [(k, v) for k, v in dependency_graph.nodes(data=True) if
-                               dependency_graph.has_edge(graph_root, k)]
 
-    for dependency_id, additional_data in parsed_dependency_graph:
+    for dependency_id in dependency_graph.successors(graph_root):
+        additional_data = dict(dependency_graph.nodes[dependency_id])
         additional_data['display_name'] = find_pack_display_name(dependency_id)
         first_level_dependencies[dependency_id] = additional_data
 
@@ -133,11 +160,180 @@ def update_pack_metadata_with_dependencies(pack_folder_name: str, first_level_de
         pack_metadata_file.truncate()
 
 
+def build_dependency_packs_index(items_list: list) -> dict:
+    """
+    Builds the reverse indexes of an id set section, from the names, ids and integration commands of its items
+    to the packs implementing them. Only items of a pack which can be dependencies (toversion >= 6.0.0) are indexed.
+
+    Args:
+        items_list (list): specific section of id set.
+
+    Returns:
+        dict: for all the packs ('all') and for the packs which are not ignored in the dependencies calculation
+        ('supported'), the packs by item name ('name'), item id ('id') and integration command ('command').
+    """
+    index: Dict[str, Dict[str, Dict[str, set]]] = {packs: {'name': {}, 'id': {}, 'command': {}}
+                                                   for packs in ('all', 'supported')}
+    minimum_version = parse_version(MINIMUM_DEPENDENCY_VERSION.vstring)
+
+    for item in items_list:
+        item_id, item_details = next(iter(item.items()))
+        pack = item_details.get('pack')
+        if not pack or parse_version(item_details.get('toversion', '99.99.99')) < minimum_version:
+            continue
+
+        keys = [('id', item_id)] + [('command', command) for command in item_details.get('commands', [])]
+        if item_details.get('name'):
+            keys.append(('name', item_details['name']))
+        for key_type, key in keys:
+            index['all'][key_type].setdefault(key, set()).add(pack)
+            if pack not in constants.IGNORED_DEPENDENCY_CALCULATION:
+                index['supported'][key_type].setdefault(key, set()).add(pack)
+
+    return index
+
+
+def get_pack_dependencies_cache_path(id_set_path: str) -> str:
+    """Returns the path of the pack dependencies cache of an id set, next to the id set file."""
+    return f'{os.path.splitext(id_set_path)[0]}_dependencies.json'
+
+
+class PackDependenciesCache:
+    """Persistent cache of the direct dependencies of packs, stored next to the id set.
+
+    Every pack entry holds the fingerprint of the pack items in the id set, the keys (item ids, names and
+    integration commands) the pack provides and the keys its dependencies were searched by.
+    An entry is valid as long as the pack items are unchanged and none of the keys it was searched by is provided
+    by a pack whose items changed. The cache is dropped when the demisto-sdk version changes.
+    """
+    CACHE_VERSION = 1
+
+    def __init__(self, id_set: dict, cache_path: Optional[str] = None, exclude_ignored_dependencies: bool = True,
+                 items_hashes: Optional[dict] = None):
+        self.cache_path = cache_path
+        self.sdk_version = get_sdk_version()
+        self.exclude_ignored_dependencies = exclude_ignored_dependencies
+        self.hits = 0
+        self.misses = 0
+        self._fingerprints, self._provided_keys = self.get_packs_fingerprints(id_set, items_hashes)
+        self._entries = {}  # type: dict
+        if cache_path and os.path.isfile(cache_path):
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, 'r') as cache_file:  # type: ignore[arg-type]
+                cache = json.load(cache_file)
+        except (OSError, ValueError) as exc:
+            print_warning(f'Could not load the dependencies cache from {self.cache_path}, ignoring it. Error: {exc}')
+            return
+
+        if cache.get('cache_version') != self.CACHE_VERSION or cache.get('sdk_version') != self.sdk_version or \
+                cache.get('exclude_ignored_dependencies') != self.exclude_ignored_dependencies:
+            return
+
+        entries = cache.get('entries', {})
+        changed_packs = {pack for pack in set(entries) | set(self._fingerprints)
+                         if entries.get(pack, {}).get('fingerprint') != self._fingerprints.get(pack, '')}
+        changed_keys = set()  # type: set
+        for pack in changed_packs:
+            changed_keys.update(tuple(key) for key in entries.get(pack, {}).get('keys', []))
+            changed_keys.update(self._provided_keys.get(pack, ()))
+
+        self._entries = {pack: entry for pack, entry in entries.items() if pack not in changed_packs and
+                         changed_keys.isdisjoint(tuple(lookup) for lookup in entry['lookups'])}
+
+    @staticmethod
+    def get_packs_fingerprints(id_set: dict, items_hashes: Optional[dict] = None) -> tuple:
+        """
+        Fingerprints the items of every pack in the id set, regardless of their order in the id set.
+
+        Args:
+            id_set (dict): the id set.
+            items_hashes (dict): the hash of every item of each section, in the items order, e.g. as stored in an
+                SQLite id set. The items are hashed when not given.
+
+        Returns:
+            dict, dict: the fingerprint and the provided (key type, key) set of every pack.
+        """
+        packs_hashes = {}  # type: dict
+        provided_keys = {}  # type: dict
+        for section, items in id_set.items():
+            section_hashes = items_hashes[section] if items_hashes else None
+            for position, item in enumerate(items):
+                item_id, item_details = next(iter(item.items()))
+                pack = item_details.get('pack') or ''
+                item_hash = section_hashes[position] if section_hashes else get_item_hash(section, item)
+                packs_hashes.setdefault(pack, []).append(item_hash)
+                keys = provided_keys.setdefault(pack, set())
+                keys.add(('id', item_id))
+                keys.update(('command', command) for command in item_details.get('commands', []))
+                if item_details.get('name'):
+                    keys.add(('name', item_details['name']))
+
+        fingerprints = {pack: hashlib.sha1(''.join(sorted(hashes)).encode()).hexdigest()
+                        for pack, hashes in packs_hashes.items()}
+        return fingerprints, provided_keys
+
+    def get_dependencies(self, pack_id: str) -> Optional[set]:
+        """Returns the cached direct dependencies of the pack, or None if they should be recomputed."""
+        entry = self._entries.get(pack_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return {(dependency, is_mandatory) for dependency, is_mandatory in entry['dependencies']}
+
+    def set_dependencies(self, pack_id: str, dependencies: set, lookups: set):
+        self._entries[pack_id] = {
+            'fingerprint': self._fingerprints.get(pack_id, ''),
+            'keys': sorted(self._provided_keys.get(pack_id, ())),
+            'lookups': sorted(lookups, key=str),
+            'dependencies': sorted(dependencies, key=str),
+        }
+
+    def save(self):
+        if not self.cache_path:
+            return
+
+        cache = {
+            'cache_version': self.CACHE_VERSION,
+            'sdk_version': self.sdk_version,
+            'exclude_ignored_dependencies': self.exclude_ignored_dependencies,
+            'entries': self._entries,
+        }
+        atomic_write_json(self.cache_path, cache)
+
+
 class PackDependencies:
     """
     Pack dependencies calculation class with relevant static methods.
     """
 
+    @staticmethod
+    def _search_packs_in_index(key_type: str, keys: list, items_list: list, exclude_ignored_dependencies: bool) -> set:
+        """
+        Searches for the packs implementing the given keys in the reverse index of the id set section.
+
+        Args:
+            key_type (str): the index to search in, one of 'name', 'id' and 'command'.
+            keys (list): the items names, ids or commands to search.
+            items_list (list): specific section of id set.
+            exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+
+        Returns:
+            set: found pack ids.
+        """
+        if DEPENDENCY_LOOKUPS is not None:
+            DEPENDENCY_LOOKUPS.update((key_type, key) for key in keys)
+        index = IDSetSection.from_list(items_list).get_index(build_dependency_packs_index)
+        packs_index = index['supported' if exclude_ignored_dependencies else 'all'][key_type]
+        packs = set()  # type: set
+        for key in keys:
+            packs.update(packs_index.get(key, ()))
+        return packs
+
     @staticmethod
     def _search_for_pack_items(pack_id: str, items_list: list) -> list:
         """
@@ -150,7 +346,7 @@ class PackDependencies:
         Returns:
             list: collection of content pack items.
         """
-        return list(filter(lambda s: next(iter(s.values())).get('pack') == pack_id, items_list))
+        return list(IDSetSection.from_list(items_list).get_by_pack(pack_id))
 
     @staticmethod
     def _search_packs_by_items_names(items_names: Union[str, list],
@@ -171,16 +367,7 @@ class PackDependencies:
         if not isinstance(items_names, list):
             items_names = [items_names]
 
-        pack_names = set()
-        for item in items_list:
-            item_details = list(item.values())[0]
-            if item_details.get('name', '') in items_names and 'pack' in item_details and \
-                    LooseVersion(item_details.get('toversion', '99.99.99')) >= MINIMUM_DEPENDENCY_VERSION:
-                pack_names.add(item_details.get('pack'))
-
-        if not exclude_ignored_dependencies:
-            return set(pack_names)
-        return {p for p in pack_names if p not in constants.IGNORED_DEPENDENCY_CALCULATION}
+        return PackDependencies._search_packs_in_index('name', items_names, items_list, exclude_ignored_dependencies)
 
     @staticmethod
     def _search_packs_by_items_names_or_ids(items_names: Union[str, list],
@@ -198,21 +385,13 @@ class PackDependencies:
             set: found pack ids.
 
         """
-        packs = set()
         if not isinstance(items_names, list):
             items_names = [items_names]
 
-        for item_name in items_names:
-            item_possible_names = [item_name, f'incident_{item_name}', f'indicator_{item_name}', f'{item_name}-mapper']
-            for item_from_id_set in items_list:
-                machine_name = list(item_from_id_set.keys())[0]
-                item_details = list(item_from_id_set.values())[0]
-                if (machine_name in item_possible_names or item_name == item_details.get('name')) \
-                        and item_details.get('pack') \
-                        and LooseVersion(item_details.get('toversion', '99.99.99')) >= MINIMUM_DEPENDENCY_VERSION \
-                        and (item_details['pack'] not in constants.IGNORED_DEPENDENCY_CALCULATION or
-                             not exclude_ignored_dependencies):
-                    packs.add(item_details.get('pack'))
+        items_ids = [item_id for item_name in items_names for item_id in
+                     (item_name, f'incident_{item_name}', f'indicator_{item_name}', f'{item_name}-mapper')]
+        packs = PackDependencies._search_packs_in_index('name', items_names, items_list, exclude_ignored_dependencies)
+        packs |= PackDependencies._search_packs_in_index('id', items_ids, items_list, exclude_ignored_dependencies)
         return packs
 
     @staticmethod
@@ -230,16 +409,8 @@ class PackDependencies:
         Returns:
             set: pack id without ignored packs.
         """
-        pack_names = set()
-        for item in id_set['integrations']:
-            item_details = list(item.values())[0]
-            if command in item_details.get('commands', []) and 'pack' in item_details and \
-                    LooseVersion(item_details.get('toversion', '99.99.99')) >= MINIMUM_DEPENDENCY_VERSION:
-                pack_names.add(item_details.get('pack'))
-
-        if not exclude_ignored_dependencies:
-            return set(pack_names)
-        return {p for p in pack_names if p not in constants.IGNORED_DEPENDENCY_CALCULATION}
+        return PackDependencies._search_packs_in_index('command', [command], id_set['integrations'],
+                                                       exclude_ignored_dependencies)
 
     @staticmethod
     def _detect_generic_commands_dependencies(pack_ids: set) -> list:
@@ -491,8 +662,9 @@ class PackDependencies:
 
             related_incident_and_indicator_types = layout_data.get('incident_and_indicator_types', [])
             packs_found_from_incident_indicator_types = PackDependencies._search_packs_by_items_names(
-                related_incident_and_indicator_types, id_set['IncidentTypes'] + id_set['IndicatorTypes'],
-                exclude_ignored_dependencies)
+                related_incident_and_indicator_types, id_set['IncidentTypes'], exclude_ignored_dependencies) | \
+                PackDependencies._search_packs_by_items_names(
+                    related_incident_and_indicator_types, id_set['IndicatorTypes'], exclude_ignored_dependencies)
 
             if packs_found_from_incident_indicator_types:
                 pack_dependencies_data = PackDependencies. \
@@ -501,8 +673,9 @@ class PackDependencies:
 
             related_incident_and_indicator_fields = layout_data.get('incident_and_indicator_fields', [])
             packs_found_from_incident_indicator_fields = PackDependencies._search_packs_by_items_names_or_ids(
-                related_incident_and_indicator_fields, id_set['IncidentFields'] + id_set['IndicatorFields'],
-                exclude_ignored_dependencies)
+                related_incident_and_indicator_fields, id_set['IncidentFields'], exclude_ignored_dependencies) | \
+                PackDependencies._search_packs_by_items_names_or_ids(
+                    related_incident_and_indicator_fields, id_set['IndicatorFields'], exclude_ignored_dependencies)
 
             if packs_found_from_incident_indicator_fields:
                 pack_dependencies_data = PackDependencies. \
@@ -899,7 +1072,7 @@ class PackDependencies:
         pack_items['dashboards'] = PackDependencies._search_for_pack_items(pack_id, id_set['Dashboards'])
         pack_items['reports'] = PackDependencies._search_for_pack_items(pack_id, id_set['Reports'])
 
-        if not sum(pack_items.values(), []):
+        if not any(pack_items.values()):
             print_warning(f"Couldn't find any items for pack '{pack_id}'. Please make sure:\n"
                           f"1 - The spelling is correct.\n"
                           f"2 - The id_set.json file is up to date. Delete the file by running: `rm -rf "
@@ -1013,7 +1186,9 @@ class PackDependencies:
     def build_all_dependencies_graph(pack_ids: list,
                                      id_set: dict,
                                      verbose_file: VerboseFile,
-                                     exclude_ignored_dependencies: bool = True) -> nx.DiGraph:
+                                     exclude_ignored_dependencies: bool = True,
+                                     workers: int = 1,
+                                     cache: Optional[PackDependenciesCache] = None) -> nx.DiGraph:
         """
         Builds all level of dependencies and returns dependency graph for all packs
 
@@ -1022,16 +1197,18 @@ class PackDependencies:
             id_set (dict): id set json.
             verbose_file (VerboseFile): path to dependency explanations file.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            workers (int): number of processes to find the packs dependencies with.
+            cache (PackDependenciesCache): cache of the packs direct dependencies.
 
         Returns:
             DiGraph: all dependencies of given packs.
         """
+        id_set = IDSet(id_set).get_dict()  # index the id set sections once for all the packs lookups
         dependency_graph = nx.DiGraph()
         for pack in pack_ids:
             dependency_graph.add_node(pack, mandatory_for_packs=[])
-        for pack in pack_ids:
-            dependencies = PackDependencies._find_pack_dependencies(
-                pack, id_set, verbose_file=verbose_file, exclude_ignored_dependencies=exclude_ignored_dependencies)
+        for pack, dependencies in zip(pack_ids, PackDependencies._find_packs_dependencies(
+                pack_ids, id_set, verbose_file, exclude_ignored_dependencies, workers, cache)):
             for dependency_name, is_mandatory in dependencies:
                 if dependency_name == pack:
                     continue
@@ -1042,6 +1219,78 @@ class PackDependencies:
                     dependency_graph.nodes()[dependency_name]['mandatory_for_packs'].append(pack)
         return dependency_graph
 
+    @staticmethod
+    def _find_pack_dependencies_and_lookups(pack_id: str, id_set: dict, verbose_file: VerboseFile,
+                                            exclude_ignored_dependencies: bool = True) -> tuple:
+        """
+        Searches for specific pack dependencies, recording the id set lookups made for them.
+
+        Returns:
+            set, set: the pack dependencies and the (key type, key) lookups they were found by.
+        """
+        global DEPENDENCY_LOOKUPS
+        DEPENDENCY_LOOKUPS = set()
+        try:
+            dependencies = PackDependencies._find_pack_dependencies(
+                pack_id, id_set, verbose_file=verbose_file, exclude_ignored_dependencies=exclude_ignored_dependencies)
+            return dependencies, DEPENDENCY_LOOKUPS
+        finally:
+            DEPENDENCY_LOOKUPS = None
+
+    @staticmethod
+    def _find_packs_dependencies(pack_ids: list,
+                                 id_set: dict,
+                                 verbose_file: VerboseFile,
+                                 exclude_ignored_dependencies: bool = True,
+                                 workers: int = 1,
+                                 cache: Optional[PackDependenciesCache] = None):
+        """
+        Searches for the dependencies of each of the given packs, in a process pool when running with more than
+        one worker. The dependency explanations of the workers are written in the packs order.
+        The dependencies of packs which are valid in the cache are not searched, unless explanations are written.
+
+        Returns:
+            Iterator[set]: the dependencies of each pack, in the packs order.
+        """
+        cached_dependencies = {}  # type: dict
+        if cache and not verbose_file.fd:
+            cached_dependencies = {pack: cache.get_dependencies(pack) for pack in pack_ids}
+        packs_to_search = [pack for pack in pack_ids if cached_dependencies.get(pack) is None]
+
+        if workers <= 1 or len(packs_to_search) <= 1:
+            found_dependencies = (PackDependencies._find_pack_dependencies_and_lookups(
+                pack, id_set, verbose_file, exclude_ignored_dependencies) + ('',) for pack in packs_to_search)
+            yield from PackDependencies._merge_packs_dependencies(
+                pack_ids, cached_dependencies, found_dependencies, verbose_file, cache)
+            return
+
+        # build the indexes before forking, so the workers share them instead of each building its own
+        for section in id_set.values():
+            section.get_by_pack(None)
+            section.get_index(build_dependency_packs_index)
+
+        wait_for_remote_release_version_refresh()
+        with Pool(processes=workers, initializer=init_dependencies_worker,
+                  initargs=(id_set, exclude_ignored_dependencies, bool(verbose_file.fd))) as pool:
+            found_dependencies = pool.imap(find_pack_dependencies_in_worker, packs_to_search, chunksize=8)
+            yield from PackDependencies._merge_packs_dependencies(
+                pack_ids, cached_dependencies, found_dependencies, verbose_file, cache)
+
+    @staticmethod
+    def _merge_packs_dependencies(pack_ids: list, cached_dependencies: dict, found_dependencies, verbose_file,
+                                  cache: Optional[PackDependenciesCache]):
+        """Yields the dependencies of each pack in the packs order, from the cache or from the found ones."""
+        for pack in pack_ids:
+            if cached_dependencies.get(pack) is not None:
+                yield cached_dependencies[pack]
+                continue
+
+            dependencies, lookups, explanations = next(found_dependencies)
+            verbose_file.write(explanations, ending='')
+            if cache:
+                cache.set_dependencies(pack, dependencies, lookups)
+            yield dependencies
+
     @staticmethod
     def get_dependencies_subgraph_by_dfs(dependencies_graph: nx.DiGraph, source_pack: str) -> nx.DiGraph:
         """
@@ -1053,16 +1302,19 @@ class PackDependencies:
         Returns:
             DiGraph: The DFS sub graph with source_pack as source
         """
-        dfs_edges = list(nx.edge_dfs(dependencies_graph, source_pack))
-        subgraph_from_edges = dependencies_graph.edge_subgraph(dfs_edges)
-        # We need to copy the graph so that we can modify it's content without any modifications to the original graph
-        return deepcopy(subgraph_from_edges)
+        subgraph = nx.DiGraph()
+        subgraph.add_edges_from(nx.edge_dfs(dependencies_graph, source_pack))
+        # copy the nodes data so that it can be modified without any modifications to the original graph
+        for node, data in subgraph.nodes(data=True):
+            data.update((key, copy(value)) for key, value in dependencies_graph.nodes[node].items())
+        return subgraph
 
     @staticmethod
     def build_dependency_graph(pack_id: str,
                                id_set: dict,
                                verbose_file: VerboseFile,
-                               exclude_ignored_dependencies: bool = True) -> nx.DiGraph:
+                               exclude_ignored_dependencies: bool = True,
+                               cache: Optional[PackDependenciesCache] = None) -> nx.DiGraph:
         """
         Builds all level of dependencies and returns dependency graph.
 
@@ -1071,22 +1323,24 @@ class PackDependencies:
             id_set (dict): id set json.
             verbose_file (VerboseFile): path to dependency explanations file.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            cache (PackDependenciesCache): cache of the packs direct dependencies.
 
         Returns:
             DiGraph: all level dependencies of given pack.
         """
+        id_set = IDSet(id_set).get_dict()  # index the id set sections once for all the packs lookups
         graph = nx.DiGraph()
         graph.add_node(pack_id)  # add pack id as root of the direct graph
         found_new_dependencies = True
+        searched_packs = set()  # type: set
 
         while found_new_dependencies:
             current_number_of_nodes = graph.number_of_nodes()
-            leaf_nodes = [n for n in graph.nodes() if graph.out_degree(n) == 0]
-
-            for leaf in leaf_nodes:
-                leaf_dependencies = PackDependencies._find_pack_dependencies(
-                    leaf, id_set, verbose_file=verbose_file, exclude_ignored_dependencies=exclude_ignored_dependencies)
+            leaf_nodes = [n for n in graph.nodes() if graph.out_degree(n) == 0 and n not in searched_packs]
+            searched_packs.update(leaf_nodes)
 
+            for leaf, leaf_dependencies in zip(leaf_nodes, PackDependencies._find_packs_dependencies(
+                    leaf_nodes, id_set, verbose_file, exclude_ignored_dependencies, cache=cache)):
                 if leaf_dependencies:
                     for dependency_name, is_mandatory in leaf_dependencies:
                         if dependency_name not in graph.nodes():
@@ -1097,6 +1351,30 @@ class PackDependencies:
 
         return graph
 
+    @staticmethod
+    def _load_id_set_and_cache(id_set_path: str, exclude_ignored_dependencies: bool) -> tuple:
+        """
+        Loads the id set, or creates it if there is no id set file, with the packs dependencies cache stored next
+        to the id set file.
+
+        Returns:
+            dict, PackDependenciesCache: the indexed id set and its dependencies cache (None if it was created).
+        """
+        if not id_set_path or not os.path.isfile(id_set_path):
+            return IDSet(IDSetCreator(print_logs=False).create_id_set()).get_dict(), None
+
+        loaded_id_set = load_id_set(id_set_path)
+        sections = [section for section in DEPENDENCIES_ID_SET_SECTIONS if section in loaded_id_set]
+        id_set = IDSet({section: loaded_id_set[section] for section in sections}).get_dict()
+        items_hashes = None
+        if isinstance(loaded_id_set, SQLiteIDSet):
+            # the SQLite id set stores the items hashes, so the items are not serialized again to fingerprint them
+            items_hashes = {section: loaded_id_set.get_items_hashes(section) for section in sections}
+            loaded_id_set.close()
+        cache = PackDependenciesCache(id_set, get_pack_dependencies_cache_path(id_set_path),
+                                      exclude_ignored_dependencies, items_hashes)
+        return id_set, cache
+
     @staticmethod
     def find_dependencies(pack_name: str, id_set_path: str = '', exclude_ignored_dependencies: bool = True,
                           update_pack_metadata: bool = True,
@@ -1116,16 +1394,14 @@ class PackDependencies:
             Dict: first level dependencies of a given pack.
 
         """
-        if not id_set_path or not os.path.isfile(id_set_path):
-            id_set = IDSetCreator(print_logs=False).create_id_set()
-        else:
-            with open(id_set_path, 'r') as id_set_file:
-                id_set = json.load(id_set_file)
+        id_set, cache = PackDependencies._load_id_set_and_cache(id_set_path, exclude_ignored_dependencies)
 
         with VerboseFile(debug_file_path) as verbose_file:
             dependency_graph = PackDependencies.build_dependency_graph(
                 pack_id=pack_name, id_set=id_set, verbose_file=verbose_file,
-                exclude_ignored_dependencies=exclude_ignored_dependencies)
+                exclude_ignored_dependencies=exclude_ignored_dependencies, cache=cache)
+        if cache:
+            cache.save()
         first_level_dependencies, _ = parse_for_pack_metadata(dependency_graph, pack_name)
         if update_pack_metadata:
             update_pack_metadata_with_dependencies(pack_name, first_level_dependencies)
@@ -1135,3 +1411,79 @@ class PackDependencies:
             dependency_result = json.dumps(first_level_dependencies, indent=4)
             click.echo(click.style(dependency_result, bold=True))
         return first_level_dependencies
+
+    @staticmethod
+    def find_all_packs_dependencies(id_set_path: str = '', exclude_ignored_dependencies: bool = True,
+                                    update_pack_metadata: bool = True, silent_mode: bool = False,
+                                    debug_file_path: str = '', workers: int = 0) -> dict:
+        """
+        Finds the dependencies of all the packs in the repository at once and updates their pack metadata.
+
+        The direct dependencies of the packs are searched in parallel and assembled into a single graph,
+        the first level dependencies of every pack and their transitive closure are derived from that graph.
+
+        Args:
+            id_set_path (str): id set json.
+            exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            update_pack_metadata (bool): Determines whether to update to pack metadata or not.
+            silent_mode (bool): Determines whether to echo the dependencies or not.
+            debug_file_path (str): path to dependency explanations file.
+            workers (int): number of processes to search the dependencies with, defaults to the number of CPUs.
+
+        Returns:
+            Dict: the first level dependencies and all level dependencies of every pack.
+        """
+        id_set, cache = PackDependencies._load_id_set_and_cache(id_set_path, exclude_ignored_dependencies)
+
+        pack_ids = sorted(pack for pack in os.listdir(constants.PACKS_DIR) if find_pack_path(pack))
+        with VerboseFile(debug_file_path) as verbose_file:
+            dependency_graph = PackDependencies.build_all_dependencies_graph(
+                pack_ids, id_set, verbose_file, exclude_ignored_dependencies, workers=workers or cpu_count(),
+                cache=cache)
+        if cache:
+            cache.save()
+
+        display_names = {}  # type: dict
+        all_packs_dependencies = {}
+        for pack in pack_ids:
+            first_level_dependencies = {}
+            for dependency in sorted(dependency_graph.successors(pack)):
+                if dependency not in display_names:
+                    display_names[dependency] = find_pack_display_name(dependency)
+                first_level_dependencies[dependency] = {
+                    'mandatory': pack in dependency_graph.nodes[dependency]['mandatory_for_packs'],
+                    'display_name': display_names[dependency],
+                }
+            if update_pack_metadata:
+                update_pack_metadata_with_dependencies(pack, first_level_dependencies)
+            all_packs_dependencies[pack] = {
+                'dependencies': first_level_dependencies,
+                'all_level_dependencies': sorted(nx.descendants(dependency_graph, pack)),
+            }
+
+        if not silent_mode:
+            click.echo(click.style(f"Found dependencies result for {len(pack_ids)} packs:", bold=True))
+            click.echo(click.style(json.dumps(all_packs_dependencies, indent=4), bold=True))
+        return all_packs_dependencies
+
+
+# The id set and the arguments of a dependencies worker process, set by the pool initializer.
+DEPENDENCIES_WORKER = {}  # type: dict
+
+
+def init_dependencies_worker(id_set: dict, exclude_ignored_dependencies: bool, collect_explanations: bool):
+    DEPENDENCIES_WORKER.update(id_set=id_set, exclude_ignored_dependencies=exclude_ignored_dependencies,
+                               collect_explanations=collect_explanations)
+
+
+def find_pack_dependencies_in_worker(pack_id: str) -> tuple:
+    """
+    Searches for the pack dependencies in a dependencies worker process.
+
+    Returns:
+        tuple: the pack dependencies, the lookups they were found by and their explanations (empty unless collected).
+    """
+    verbose_file = VerboseBuffer() if DEPENDENCIES_WORKER['collect_explanations'] else VerboseFile()
+    dependencies, lookups = PackDependencies._find_pack_dependencies_and_lookups(
+        pack_id, DEPENDENCIES_WORKER['id_set'], verbose_file, DEPENDENCIES_WORKER['exclude_ignored_dependencies'])
+    return dependencies, lookups, verbose_file.getvalue() if isinstance(verbose_file, VerboseBuffer) else ''
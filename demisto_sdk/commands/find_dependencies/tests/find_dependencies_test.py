@@ -4,6 +4,8 @@ import os
 import networkx as nx
 import pytest
 from demisto_sdk.commands.common.git_tools import git_path
+from demisto_sdk.commands.common.update_id_set import IDSetSection
+from demisto_sdk.commands.find_dependencies import find_dependencies
 from demisto_sdk.commands.find_dependencies.find_dependencies import (
     PackDependencies, VerboseFile)
 from TestSuite.utils import IsEqualFunctions
@@ -19,6 +21,25 @@ def id_set():
         yield id_set
 
 
+@pytest.fixture
+def dependent_packs(tmp_path, monkeypatch):
+    """Packs where PackA depends on PackB, which depends on PackC, and their id set, in the working directory."""
+    for pack in ('PackA', 'PackB', 'PackC'):
+        (tmp_path / 'Packs' / pack).mkdir(parents=True)
+        (tmp_path / 'Packs' / pack / 'pack_metadata.json').write_text(json.dumps({'name': f'{pack} Name'}))
+    id_set = {'scripts': [
+        {'ScriptA': {'name': 'ScriptA', 'pack': 'PackA', 'depends_on': ['ScriptB']}},
+        {'ScriptB': {'name': 'ScriptB', 'pack': 'PackB', 'depends_on': ['ScriptC']}},
+        {'ScriptC': {'name': 'ScriptC', 'pack': 'PackC'}},
+    ]}
+    for section in ('playbooks', 'Layouts', 'IncidentFields', 'IndicatorFields', 'IndicatorTypes', 'integrations',
+                    'IncidentTypes', 'Classifiers', 'Mappers', 'Widgets', 'Dashboards', 'Reports'):
+        id_set[section] = []
+    (tmp_path / 'id_set.json').write_text(json.dumps(id_set))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
 class TestIdSetFilters:
     @pytest.mark.parametrize("item_section", ["scripts", "playbooks"])
     def test_search_for_pack_item_with_no_result(self, item_section, id_set):
@@ -1189,6 +1210,62 @@ def test_search_packs_by_items_names_or_ids(item_names, section_name, expected_r
     assert IsEqualFunctions.is_sets_equal(found_packs, expected_result)
 
 
+def test_search_packs__reverse_index(mocker):
+    """
+    Given
+        - a scripts section with a deprecated version of a script and a version of it in an ignored pack.
+
+    When
+        - searching the packs implementing the script several times, and after adding a script to the section.
+
+    Then
+        - ensure only the supported versions are found, and the ignored packs only when not excluded.
+        - ensure the section index is built once and is rebuilt once the section is modified.
+    """
+    build_index = mocker.spy(find_dependencies, 'build_dependency_packs_index')
+    scripts = IDSetSection([
+        {'Foo': {'name': 'Foo', 'pack': 'OldFoo', 'toversion': '5.9.9'}},
+        {'Foo': {'name': 'Foo', 'pack': 'Foo', 'fromversion': '6.0.0'}},
+        {'Foo': {'name': 'Foo', 'pack': 'Base'}},
+    ])
+
+    assert PackDependencies._search_packs_by_items_names('Foo', scripts) == {'Foo'}
+    assert PackDependencies._search_packs_by_items_names(['Foo', 'Bar'], scripts, False) == {'Foo', 'Base'}
+    assert PackDependencies._search_packs_by_items_names_or_ids(['Foo'], scripts) == {'Foo'}
+    assert build_index.call_count == 1
+
+    scripts.append({'Bar': {'name': 'Bar', 'pack': 'Bar'}})
+    assert PackDependencies._search_packs_by_items_names(['Foo', 'Bar'], scripts) == {'Foo', 'Bar'}
+    assert build_index.call_count == 2
+
+
+def test_search_packs__items_without_pack():
+    """
+    Given
+        - scripts and integrations sections with items which have no pack.
+
+    When
+        - searching the packs implementing the items by name, id and integration command.
+
+    Then
+        - ensure only the packs of the items which have a pack are found.
+    """
+    scripts = IDSetSection([
+        {'Foo': {'name': 'Foo'}},
+        {'Foo': {'name': 'Foo', 'pack': None}},
+        {'Bar': {'name': 'Bar', 'pack': 'Bar'}},
+    ])
+    integrations = IDSetSection([
+        {'Foo': {'name': 'Foo', 'commands': ['foo-get']}},
+        {'Bar': {'name': 'Bar', 'pack': 'Bar', 'commands': ['bar-get']}},
+    ])
+
+    assert PackDependencies._search_packs_by_items_names(['Foo', 'Bar'], scripts, False) == {'Bar'}
+    assert PackDependencies._search_packs_by_items_names_or_ids(['Foo', 'Bar'], scripts, False) == {'Bar'}
+    assert PackDependencies._search_packs_by_integration_command('foo-get', {'integrations': integrations}) == set()
+    assert PackDependencies._search_packs_by_integration_command('bar-get', {'integrations': integrations}) == {'Bar'}
+
+
 class TestDependencyGraph:
     @pytest.mark.parametrize('source_node, expected_nodes_in, expected_nodes_out',
                              [('pack1', ['pack1', 'pack2', 'pack3'], ['pack4']),
@@ -1255,6 +1332,100 @@ class TestDependencyGraph:
         assert nodes['pack3']['mandatory_for_packs'] == []
         assert nodes['pack4']['mandatory_for_packs'] == []
 
+    def test_find_all_packs_dependencies(self, dependent_packs):
+        """
+        Given
+            - Packs where PackA depends on PackB, which depends on PackC.
+        When
+            - Finding the dependencies of all the packs, serially and with several workers.
+        Then
+            - Ensure the first level dependencies are written to every pack metadata.
+            - Ensure the all level dependencies are derived from the dependencies graph.
+            - Ensure the results are the same with any number of workers.
+        """
+        results = []
+        for workers in (1, 2):
+            if os.path.exists('id_set_dependencies.json'):
+                os.remove('id_set_dependencies.json')
+            results.append(PackDependencies.find_all_packs_dependencies(id_set_path='id_set.json', silent_mode=True,
+                                                                        workers=workers))
+
+        assert results[0] == results[1]
+        assert results[0]['PackA'] == {
+            'dependencies': {'PackB': {'mandatory': True, 'display_name': 'PackB Name'}},
+            'all_level_dependencies': ['PackB', 'PackC'],
+        }
+        assert results[0]['PackC'] == {'dependencies': {}, 'all_level_dependencies': []}
+        with open(dependent_packs / 'Packs' / 'PackB' / 'pack_metadata.json') as pack_metadata_file:
+            assert json.load(pack_metadata_file) == {
+                'name': 'PackB Name',
+                'dependencies': {'PackC': {'mandatory': True, 'display_name': 'PackC Name'}},
+                'displayedImages': ['PackC'],
+            }
+
+    def test_find_dependencies__incremental(self, dependent_packs, mocker):
+        """
+        Given
+            - Packs where PackA depends on PackB, which depends on PackC, and their dependencies cache.
+        When
+            - Finding the dependencies again, before and after PackC script is modified in the id set.
+        Then
+            - Ensure the cache is written without leaving temporary files.
+            - Ensure nothing is recomputed while the id set is unchanged.
+            - Ensure only PackC, whose items changed, and PackB, which references them, are recomputed.
+        """
+        find_pack_dependencies = mocker.spy(PackDependencies, '_find_pack_dependencies')
+        expected_result = PackDependencies.find_all_packs_dependencies(id_set_path='id_set.json', silent_mode=True,
+                                                                       workers=1)
+        assert find_pack_dependencies.call_count == 3
+        assert os.path.isfile('id_set_dependencies.json')
+        assert [file_name for file_name in os.listdir('.') if file_name.endswith('.tmp')] == []
+
+        find_pack_dependencies.reset_mock()
+        assert PackDependencies.find_all_packs_dependencies(id_set_path='id_set.json', silent_mode=True,
+                                                            workers=1) == expected_result
+        assert PackDependencies.find_dependencies('PackA', id_set_path='id_set.json', silent_mode=True) == \
+            expected_result['PackA']['dependencies']
+        assert find_pack_dependencies.call_count == 0
+
+        with open('id_set.json') as id_set_file:
+            id_set = json.load(id_set_file)
+        id_set['scripts'][2]['ScriptC']['comment'] = 'modified'
+        with open('id_set.json', 'w') as id_set_file:
+            json.dump(id_set, id_set_file)
+
+        assert PackDependencies.find_all_packs_dependencies(id_set_path='id_set.json', silent_mode=True,
+                                                            workers=1) == expected_result
+        assert sorted(call[0][0] for call in find_pack_dependencies.call_args_list) == ['PackB', 'PackC']
+
+    def test_find_dependencies__sqlite_id_set(self, dependent_packs, mocker):
+        """
+        Given
+            - Packs where PackA depends on PackB, which depends on PackC, and their dependencies cache.
+        When
+            - Finding the dependencies again with the id set converted to SQLite.
+        Then
+            - Ensure the sections which are not searched (e.g. TestPlaybooks) are not read.
+            - Ensure the stored items hashes match the cache fingerprints, so nothing is recomputed.
+        """
+        from demisto_sdk.commands.common.id_set_db import (SQLiteIDSet,
+                                                           convert_id_set)
+        expected_result = PackDependencies.find_all_packs_dependencies(id_set_path='id_set.json', silent_mode=True,
+                                                                       workers=1)
+        with open('id_set.json') as id_set_file:
+            id_set = json.load(id_set_file)
+        id_set['TestPlaybooks'] = [{'TestPlaybookA': {'name': 'TestPlaybookA', 'pack': 'PackA'}}]
+        with open('id_set.json', 'w') as id_set_file:
+            json.dump(id_set, id_set_file)
+        convert_id_set('id_set.json', 'id_set.db')
+
+        find_pack_dependencies = mocker.spy(PackDependencies, '_find_pack_dependencies')
+        get_section = mocker.spy(SQLiteIDSet, '__getitem__')
+        assert PackDependencies.find_all_packs_dependencies(id_set_path='id_set.db', silent_mode=True,
+                                                            workers=1) == expected_result
+        assert 'TestPlaybooks' not in {call[0][1] for call in get_section.call_args_list}
+        assert find_pack_dependencies.call_count == 0
+
     def test_build_dependency_graph(self, id_set):
         pack_name = "ImpossibleTraveler"
         found_graph = PackDependencies.build_dependency_graph(pack_id=pack_name,
@@ -256,7 +256,7 @@ class BaseUpdate:
     def is_old_file(path: str, verbose: bool = False) -> dict:
         """Check whether the file is in git repo or new file.  """
         if path:
-            data = get_remote_file(path, suppress_print=not verbose)
+            data = get_remote_file(path, suppress_print=not verbose, old_version=True)
             if not data:
                 return {}
             else:
@@ -3,7 +3,7 @@ from distutils.version import LooseVersion
 import click
 import ujson
 import yaml
-from demisto_sdk.commands.common.tools import print_error
+from demisto_sdk.commands.common.tools import GIT_CHANGE_SET, print_error
 from demisto_sdk.commands.format.format_constants import (
     ARGUMENTS_DEFAULT_VALUES, TO_VERSION_5_9_9)
 from demisto_sdk.commands.format.update_generic import BaseUpdate
@@ -43,6 +43,7 @@ class BaseUpdateJSON(BaseUpdate):
         with open(self.output_file, 'w') as file:
             ujson.dump(self.data, file, indent=4, encode_html_chars=True, escape_forward_slashes=False,
                        ensure_ascii=False)
+        GIT_CHANGE_SET.invalidate_working_tree()
 
     def update_json(self):
         """Manager function for the generic JSON updates."""
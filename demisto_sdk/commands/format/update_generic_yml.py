@@ -4,7 +4,8 @@ from typing import Dict, List
 
 import click
 from demisto_sdk.commands.common.constants import TEST_PLAYBOOKS_DIR, FileType
-from demisto_sdk.commands.common.tools import (_get_file_id, find_type,
+from demisto_sdk.commands.common.tools import (GIT_CHANGE_SET, _get_file_id,
+                                               find_type,
                                                get_entity_id_by_entity_type,
                                                get_not_registered_tests,
                                                get_yaml)
@@ -78,6 +79,7 @@ class BaseUpdateYML(BaseUpdate):
             click.secho(f'Saving output YML file to {self.output_file} \n', fg='white')
         with open(self.output_file, 'w') as f:
             ryaml.dump(self.data, f)  # ruamel preservers multilines
+        GIT_CHANGE_SET.invalidate_working_tree()
 
     def copy_tests_from_old_file(self):
         """Copy the tests key from old file if exists.
@@ -178,6 +180,7 @@ class BaseUpdateYML(BaseUpdate):
         """Save formatted JSON data to destination file."""
         with open(self.CONF_PATH, 'w') as file:
             json.dump(conf_json_content, file, indent=4)
+        GIT_CHANGE_SET.invalidate_working_tree()
 
     @staticmethod
     def get_test_playbooks_configuration(test_playbooks: List, content_item_id: str, file_type: str) -> List[Dict]:
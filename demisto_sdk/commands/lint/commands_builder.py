@@ -1,7 +1,7 @@
 # STD python packages
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Sequence
 
 from demisto_sdk.commands.lint.resources.pylint_plugins.base_checker import \
     base_msg
@@ -41,11 +41,11 @@ def get_python_exec(py_num: float, is_py2: bool = False) -> str:
     return f"python{py_str}"
 
 
-def build_flake8_command(files: List[Path], py_num: float) -> str:
+def build_flake8_command(files: Sequence[Path], py_num: float) -> str:
     """ Build command for executing flake8 lint check
         https://flake8.pycqa.org/en/latest/user/invocation.html
     Args:
-        files(List[Path]): files to execute lint
+        files(Sequence[Path]): files to execute lint
         py_num(float): The python version in use
 
     Returns:
@@ -234,12 +234,13 @@ def build_pylint_command(files: List[Path]) -> str:
     return command
 
 
-def build_pytest_command(test_xml: str = "", json: bool = False) -> str:
+def build_pytest_command(test_xml: str = "", json: bool = False, work_dir: str = "/devwork") -> str:
     """ Build command to execute with pytest module
         https://docs.pytest.org/en/latest/usage.html
     Args:
         test_xml(str): path indicate if required or not
         json(bool): Define json creation after test
+        work_dir(str): The package dir in the container, where the reports are created
 
     Returns:
         str: pytest command
@@ -247,10 +248,10 @@ def build_pytest_command(test_xml: str = "", json: bool = False) -> str:
     command = "python -m pytest"
     # Generating junit-xml report - used in circle ci
     if test_xml:
-        command += " --junitxml=/devwork/report_pytest.xml"
+        command += f" --junitxml={work_dir}/report_pytest.xml"
     # Generating json report
     if json:
-        command += " --json=/devwork/report_pytest.json"
+        command += f" --json={work_dir}/report_pytest.json"
 
     return command
 
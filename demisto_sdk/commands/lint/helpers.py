@@ -1,16 +1,21 @@
 # STD python packages
+import hashlib
 import io
+import json
 import logging
 import os
 import re
 import shlex
 import shutil
+import socket
 import tarfile
 import textwrap
-from contextlib import contextmanager
-from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Union
+from threading import Lock
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 # Third party packages
 import docker
@@ -19,7 +24,11 @@ import git
 import requests
 # Local packages
 from demisto_sdk.commands.common.constants import TYPE_PWSH, TYPE_PYTHON
-from demisto_sdk.commands.common.tools import print_warning, run_command_os
+from demisto_sdk.commands.common.tools import (atomic_write_json,
+                                               get_sdk_cache_dir,
+                                               get_sdk_version,
+                                               load_json_cache, print_warning,
+                                               run_command_os)
 from docker.models.containers import Container
 
 # Python2 requirements
@@ -270,10 +279,350 @@ def add_tmp_lint_files(content_repo: git.Repo, pack_path: Path, lint_files: List
         pass
 
 
-@lru_cache(maxsize=100)
+class PythonVersionsCache:
+    """The python versions of the docker images by image id, kept for the run and on disk across runs.
+
+    The image id is the digest of the image config, so the python version of an image id never changes.
+    """
+    CACHE_FILE = 'docker_python_versions.json'
+
+    def __init__(self):
+        self._lock = Lock()
+        self._versions: Optional[Dict[str, float]] = None
+        self._image_locks: Dict[str, Lock] = {}
+
+    @property
+    def cache_path(self) -> str:
+        return os.path.join(get_sdk_cache_dir(), self.CACHE_FILE)
+
+    @property
+    def versions(self) -> Dict[str, float]:
+        """The python versions by image id, loaded from the cache file on first use."""
+        if self._versions is None:
+            self._versions = load_json_cache(self.cache_path)
+        return self._versions
+
+    def image_lock(self, image: str) -> Lock:
+        """A lock per docker image, so the packages which share an image find its python version once."""
+        with self._lock:
+            return self._image_locks.setdefault(image, Lock())
+
+    def get(self, image_id: str) -> Optional[float]:
+        with self._lock:
+            return self.versions.get(image_id)
+
+    def set(self, image_id: str, py_num: float):
+        """Keeps the python version of a docker image, and writes the cache file ignoring write errors.
+        The file is written under the lock, so a write never replaces a newer one of another thread."""
+        with self._lock:
+            self.versions[image_id] = py_num
+            with suppress(OSError):
+                atomic_write_json(self.cache_path, self.versions)
+
+    def clear(self):
+        with self._lock:
+            self._versions = None
+            self._image_locks = {}
+
+
+PYTHON_VERSIONS_CACHE = PythonVersionsCache()
+
+
+def get_dir_hash(dir_path: Path) -> str:
+    """ Get the hash of the files in a dir by their relative paths and content, without the cache dirs and compiled
+        files which the lint tools create.
+
+    Args:
+        dir_path(Path): The dir to hash.
+
+    Returns:
+        str: The sha256 hex digest.
+    """
+    dir_hash = hashlib.sha256()
+    for root, dirs, files in os.walk(dir_path):
+        dirs[:] = sorted(dir_name for dir_name in dirs if not dir_name.startswith('.') and dir_name != '__pycache__')
+        for file_name in sorted(files):
+            if file_name.endswith('.pyc') or file_name == '.Dockerfile':
+                continue
+            file_path = os.path.join(root, file_name)
+            dir_hash.update(os.path.relpath(file_path, dir_path).encode('utf-8') + b'\0')
+            with open(file_path, 'rb') as file:
+                dir_hash.update(hashlib.sha256(file.read()).digest())
+    return dir_hash.hexdigest()
+
+
+class LintResultsCache:
+    """The results of the lint checks which passed, kept for the run and on disk across runs.
+
+    The results are keyed by the hash of everything the check result depends on - the package files, the check
+    settings and the demisto-sdk version, so a result is replayed only if nothing it depends on changed.
+    The least recently used results are evicted when there are more than DEMISTO_SDK_LINT_CACHE_SIZE results (10000 by
+    default), setting it to 0 disables the cache.
+    """
+    CACHE_FILE = 'lint_results.json'
+    DEFAULT_SIZE = 10000
+
+    def __init__(self):
+        self._lock = Lock()
+        self._results: Optional[OrderedDict] = None
+        self._changed = False
+        self._sdk_version: Optional[str] = None
+
+    @property
+    def cache_path(self) -> str:
+        return os.path.join(get_sdk_cache_dir(), self.CACHE_FILE)
+
+    @property
+    def size(self) -> int:
+        try:
+            return int(os.getenv('DEMISTO_SDK_LINT_CACHE_SIZE', self.DEFAULT_SIZE))
+        except ValueError:
+            return self.DEFAULT_SIZE
+
+    @property
+    def results(self) -> OrderedDict:
+        """The results by key from the least to the most recently used, loaded from the cache file on first use."""
+        if self._results is None:
+            results = load_json_cache(self.cache_path, object_pairs_hook=OrderedDict)
+            self._results = results if isinstance(results, OrderedDict) else OrderedDict()
+        return self._results
+
+    def get_key(self, **key_parts) -> str:
+        """ The cache key of a check result
+
+        Args:
+            **key_parts: Everything the check result depends on, must be json serializable.
+
+        Returns:
+            str: The sha256 hex digest of the key parts and the demisto-sdk version.
+        """
+        if self._sdk_version is None:
+            self._sdk_version = get_sdk_version()
+        key_parts['sdk_version'] = self._sdk_version
+        return hashlib.sha256(json.dumps(key_parts, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[list]:
+        if not self.size:
+            return None
+        with self._lock:
+            result = self.results.get(key)
+            if result is not None:
+                self.results.move_to_end(key)
+                self._changed = True
+            return result
+
+    def set(self, key: str, result: list):
+        """Keeps a check result, and evicts the least recently used results over the cache size."""
+        if not self.size:
+            return
+        with self._lock:
+            self.results[key] = result
+            self.results.move_to_end(key)
+            while len(self.results) > self.size:
+                self.results.popitem(last=False)
+            self._changed = True
+
+    def save(self):
+        """Writes the cache file if it changed, ignoring write errors."""
+        with self._lock:
+            if not self._changed:
+                return
+            results = OrderedDict(self.results)
+            self._changed = False
+        with suppress(OSError):
+            atomic_write_json(self.cache_path, results)
+
+    def clear(self):
+        with self._lock:
+            self._results = None
+            self._changed = False
+
+
+LINT_RESULTS_CACHE = LintResultsCache()
+
+
+class DevImagesCoordinator:
+    """Creates every lint dev image once per run, for all the Linter threads.
+
+    The dev images are keyed by their name, which includes the hash of their dockerfile. The first thread which
+    requests a dev image pulls or builds it, and the other threads wait on a shared future for the outcome, which is
+    kept for the rest of the run - including the errors, so a failing build isn't retried by every package.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._futures: Dict[str, Future] = {}
+
+    def create_image(self, image_name: str, create: Callable[[], str]) -> str:
+        """ Create a dev image, or wait for the thread which creates it
+
+        Args:
+            image_name(str): The dev image name
+            create(Callable): Pulls or builds the dev image, returns the errors string
+
+        Returns:
+            str: The errors of creating the image, an empty string if it was created successfully
+        """
+        with self._lock:
+            future = self._futures.get(image_name)
+            is_creator = future is None
+            if future is None:
+                future = self._futures[image_name] = Future()
+        if is_creator:
+            try:
+                future.set_result(create())
+            except Exception as e:
+                future.set_exception(e)
+        return future.result()
+
+    def clear(self):
+        with self._lock:
+            self._futures = {}
+
+
+DEV_IMAGES_COORDINATOR = DevImagesCoordinator()
+
+
+def remove_container(container_obj: Container):
+    try:
+        container_obj.remove(force=True)
+    except (docker.errors.NotFound, docker.errors.APIError) as e:
+        logger.debug(f"Unable to remove container {container_obj.name} - {e}")
+
+
+def is_process_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # the process exists, and belongs to another user
+        return True
+    return True
+
+
+class DockerContainersPool:
+    """Long-lived lint worker containers of the test images, shared by the Linter threads.
+
+    Instead of creating a container for every lint check of every package, a package leases an idle worker of its test
+    image, copies itself into its own dir in the worker, runs its checks in it with exec and returns it to the pool.
+    The pool holds at most a worker per test image for every Linter thread, and the workers are removed at the end of
+    the run. The workers are labelled with the host and the process which started them, so the workers of a run which
+    was killed are removed by the next run on the same host.
+    """
+    # Keeps the worker running until it is removed, whatever the image entrypoint is
+    WORKER_ENTRYPOINT = ['tail', '-f', '/dev/null']
+    WORKER_LABEL = 'demisto-sdk-lint-worker'
+
+    def __init__(self):
+        self._lock = Lock()
+        self._idle_workers: Dict[str, List[Container]] = {}
+        self._workers: List[Container] = []
+
+    def acquire(self, docker_client: docker.DockerClient, image: str) -> Container:
+        """ Lease an idle worker of the image, or start a new one if all its workers are leased
+
+        Args:
+            docker_client(DockerClient): The docker client to start the worker with
+            image(str): The test image id/name
+
+        Returns:
+            Container: The running worker
+        """
+        with self._lock:
+            idle_workers = self._idle_workers.get(image)
+            if idle_workers:
+                return idle_workers.pop()
+        # The init process reaps the exec'd processes, and the worker has nothing to shut down gracefully
+        worker = docker_client.containers.create(image=image, entrypoint=self.WORKER_ENTRYPOINT,
+                                                 labels={self.WORKER_LABEL: f'{socket.gethostname()}:{os.getpid()}'},
+                                                 init=True, stop_signal='SIGKILL')
+        with self._lock:
+            self._workers.append(worker)
+        worker.start()
+        return worker
+
+    def release(self, image: str, worker: Container):
+        with self._lock:
+            self._idle_workers.setdefault(image, []).append(worker)
+
+    def discard(self, worker: Container):
+        """ Remove a worker which can't be reused """
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        remove_container(worker)
+
+    @staticmethod
+    def remove_stale_workers(docker_client: docker.DockerClient):
+        """ Remove the workers which were started on this host by processes which are no longer running
+
+        Args:
+            docker_client(DockerClient): The docker client to look up the workers with
+        """
+        try:
+            workers = docker_client.containers.list(all=True, filters={'label': DockerContainersPool.WORKER_LABEL})
+        except docker.errors.APIError as e:
+            logger.debug(f"Unable to list the lint workers - {e}")
+            return
+        for worker in workers:
+            host, _, pid = worker.labels.get(DockerContainersPool.WORKER_LABEL, '').rpartition(':')
+            if host == socket.gethostname() and pid.isdigit() and not is_process_running(int(pid)):
+                remove_container(worker)
+
+    def clear(self):
+        """ Remove all the workers """
+        with self._lock:
+            workers = self._workers
+            self._workers = []
+            self._idle_workers = {}
+        for worker in workers:
+            remove_container(worker)
+
+
+DOCKER_CONTAINERS_POOL = DockerContainersPool()
+
+
+def get_local_docker_image(docker_client: docker.DockerClient, image: str):
+    """ Get a docker image if it exists locally
+
+    Args:
+        docker_client(DockerClient): Docker client
+        image(str): Docker image id or name
+
+    Returns:
+        Image: The docker image, None if it doesn't exist locally
+    """
+    try:
+        return docker_client.images.get(image)
+    except (docker.errors.ImageNotFound, docker.errors.APIError):
+        return None
+
+
+def get_python_version_from_image_config(image_attrs: dict) -> Optional[float]:
+    """ Get python version from the PYTHON_VERSION environment variable of a docker image config, which is set by the
+    official python images the docker images are based on
+
+    Args:
+        image_attrs(dict): The docker image attributes, as returned by docker inspect
+
+    Returns:
+        float: Python version X.Y (3.7, 3.6, ..), None if the config doesn't include the python version
+    """
+    config = image_attrs.get('Config') if isinstance(image_attrs, dict) else None
+    for env_var in (config or {}).get('Env') or []:
+        match = re.match(r'PYTHON_VERSION=(\d+)\.(\d+)', env_var)
+        if match:
+            return float(f'{match.group(1)}.{match.group(2)}')
+    return None
+
+
 def get_python_version_from_image(image: str) -> float:
     """ Get python version from docker image
 
+    The version is taken from the python versions cache by the image id, then from the image config, and only if
+    both don't have it a container is started to run python in it.
+
     Args:
         image(str): Docker image id or name
 
@@ -281,8 +630,39 @@ def get_python_version_from_image(image: str) -> float:
         float: Python version X.Y (3.7, 3.6, ..)
     """
     docker_client = docker.from_env()
-    py_num = 2.7
-    # Run two times
+    with PYTHON_VERSIONS_CACHE.image_lock(image):
+        image_obj = get_local_docker_image(docker_client, image)
+        if image_obj:
+            py_num = PYTHON_VERSIONS_CACHE.get(image_obj.id)
+            if py_num:
+                return py_num
+            py_num = get_python_version_from_image_config(image_obj.attrs)
+            if py_num:
+                PYTHON_VERSIONS_CACHE.set(image_obj.id, py_num)
+                return py_num
+
+        py_num = get_python_version_from_container(docker_client, image)
+        if py_num:
+            # the image is pulled by the container run if it didn't exist locally
+            image_obj = image_obj or get_local_docker_image(docker_client, image)
+            if image_obj:
+                PYTHON_VERSIONS_CACHE.set(image_obj.id, py_num)
+            return py_num
+
+    return 2.7
+
+
+def get_python_version_from_container(docker_client: docker.DockerClient, image: str) -> Optional[float]:
+    """ Get python version by running python in a container of the docker image
+
+    Args:
+        docker_client(DockerClient): Docker client
+        image(str): Docker image id or name
+
+    Returns:
+        float: Python version X.Y (3.7, 3.6, ..), None if python failed running in the container
+    """
+    # Try two times
     for _ in range(2):
         try:
             command = "python -c \"import sys; print('{}.{}'.format(sys.version_info[0], sys.version_info[1]))\""
@@ -307,10 +687,11 @@ def get_python_version_from_image(image: str) -> float:
                     break
                 except docker.errors.APIError:
                     pass
+            return py_num
         except (docker.errors.APIError, docker.errors.ContainerError):
             continue
 
-    return py_num
+    return None
 
 
 def get_file_from_container(container_obj: Container, container_path: str, encoding: str = "") -> Union[str, bytes]:
@@ -363,15 +744,82 @@ def copy_dir_to_container(container_obj: Container, host_path: Path, container_p
             tarinfo if not re.search(excluded_regex, Path(tarinfo.name).name) else None))
         os.chdir(old_cwd)
 
+    put_archive_to_container(container_obj, file_like_object.getvalue(), container_path)
+
+
+def create_pack_archive(pack_dir: Path, arcname: str = '.') -> bytes:
+    """ Archive the package dir as the pack image dockerfile copies it - owned by the group 4000 with 775 permissions.
+
+    Args:
+        pack_dir(Path): The package dir.
+        arcname(str): The package dir name in the archive, '.' to extract its content into the destination dir.
+
+    Returns:
+        bytes: The tar.gz archive of the package dir.
+    """
+    def set_owner(tarinfo: tarfile.TarInfo) -> tarfile.TarInfo:
+        tarinfo.gid = 4000
+        tarinfo.gname = ''
+        tarinfo.mode = 0o775
+        return tarinfo
+
+    file_like_object = io.BytesIO()
+    with tarfile.open(fileobj=file_like_object, mode='w:gz') as archive:
+        archive.add(str(pack_dir), arcname=arcname, recursive=True, filter=set_owner)
+
+    return file_like_object.getvalue()
+
+
+def put_archive_to_container(container_obj: Container, archive: bytes, container_path: Union[Path, str]):
+    """ Extract an archive into a directory in the container.
+
+    Args:
+        container_obj(Container): Container to extract the archive in
+        archive(bytes): tar archive content
+        container_path(Path): Path in container (directory)
+
+    Raises:
+        APIError: Raise API error if unable to extract the archive in the container
+    """
     for trial in range(2):
-        status = container_obj.put_archive(path=container_path,
-                                           data=file_like_object.getvalue())
+        status = container_obj.put_archive(path=container_path, data=archive)
         if status:
             break
         elif trial == 1:
             raise docker.errors.APIError(message="unable to copy dir to container")
 
 
+def exec_in_container(container_obj: Container, command: List[str], user: str, environment: Optional[Dict] = None,
+                      workdir: Optional[str] = None) -> Tuple[int, str]:
+    """ Run a command in a running container, and stream its output to the log
+
+    Args:
+        container_obj(Container): The running container
+        command(list): The command to run
+        user(str): The user to run the command with
+        environment(dict): The command environment variables
+        workdir(str): The command working dir
+
+    Returns:
+        int: The command exit code
+        str: The command output
+    """
+    api_client = container_obj.client.api
+    exec_id = api_client.exec_create(container_obj.id, command, user=user, environment=environment,
+                                     workdir=workdir)['Id']
+    output: List[bytes] = []
+
+    def collect_output(streamer: Generator) -> Generator:
+        for chunk in streamer:
+            output.append(chunk)
+            yield chunk
+
+    stream_docker_container_output(collect_output(api_client.exec_start(exec_id, stream=True)))
+    exit_code = api_client.exec_inspect(exec_id).get('ExitCode')
+
+    return exit_code, b''.join(output).decode('utf-8')
+
+
 def stream_docker_container_output(streamer: Generator) -> None:
     """ Stream container logs
 
@@ -410,6 +858,32 @@ def pylint_plugin(dest: Path):
                 (dest / f'{file.name}').unlink()
 
 
+def split_output_by_files(output: str, owners: Dict[str, Any]) -> Optional[Dict[Any, str]]:
+    """ Split the output of a lint check which ran on the files of many packages to the output of every package.
+
+    Every message line starts with the path of the file it reports - 'path:line:...', lines which don't (e.g. the
+    source lines of flake8 --show-source) belong to the file of the previous message.
+
+    Args:
+        output(str): The lint check output.
+        owners(dict): The package of every file path which the check ran on.
+
+    Returns:
+        dict: The output of every package which has messages, None if a line can't be attributed to a file.
+    """
+    outputs: Dict[Any, List[str]] = {}
+    owner = None
+    for line in output.splitlines():
+        path_match = re.match(r'(.+?):\d+:', line)
+        if path_match and path_match.group(1) in owners:
+            owner = owners[path_match.group(1)]
+        elif owner is None:
+            return None
+        outputs.setdefault(owner, []).append(line)
+
+    return {owner: '\n'.join(lines) + '\n' for owner, lines in outputs.items()}
+
+
 def split_warnings_errors(output: str):
     """
         Function which splits the given string into warning messages and error using W or E in the beginning of string
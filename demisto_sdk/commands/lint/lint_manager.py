@@ -6,7 +6,7 @@ import os
 import re
 import sys
 import textwrap
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Set, Tuple
 
 # Third party packages
 import docker
@@ -20,16 +20,26 @@ from demisto_sdk.commands.common.constants import (PACKS_PACK_META_FILE_NAME,
 # Local packages
 from demisto_sdk.commands.common.logger import Colors, logging_setup
 from demisto_sdk.commands.common.tools import (print_error, print_v,
-                                               print_warning)
-from demisto_sdk.commands.lint.helpers import (EXIT_CODES, FAIL, PWSH_CHECKS,
-                                               PY_CHCEKS,
+                                               print_warning, run_command_os)
+from demisto_sdk.commands.lint.commands_builder import (build_flake8_command,
+                                                        get_python_exec)
+from demisto_sdk.commands.lint.helpers import (DOCKER_CONTAINERS_POOL,
+                                               EXIT_CODES, FAIL,
+                                               LINT_RESULTS_CACHE, PWSH_CHECKS,
+                                               PY_CHCEKS, SUCCESS,
                                                build_skipped_exit_code,
-                                               get_test_modules, validate_env)
+                                               get_test_modules,
+                                               split_output_by_files,
+                                               validate_env)
 from demisto_sdk.commands.lint.linter import Linter
 from wcmatch.pathlib import Path
 
 logger: logging.Logger
 
+# The max number of lint files lists (a package has up to 2 - the lint files and the unit test files) in a batched run
+# of a host check, which keeps its command line short
+HOST_LINT_BATCH_SIZE = 100
+
 
 class LintManager:
     """ LintManager used to activate lint command using Linters in a single or multi thread.
@@ -133,6 +143,8 @@ class LintManager:
         docker_client: docker.DockerClient = docker.from_env()
         try:
             docker_client.ping()
+            # Remove the lint workers which were left behind by killed runs
+            DOCKER_CONTAINERS_POOL.remove_stale_workers(docker_client)
         except (requests.exceptions.ConnectionError, urllib3.exceptions.ProtocolError, docker.errors.APIError) as ex:
             if os.getenv("CI") and os.getenv("CIRCLE_PROJECT_REPONAME") == "content":
                 # when running lint in content we fail if docker isn't available for some reason
@@ -288,18 +300,21 @@ class LintManager:
                                                no_pylint=no_pylint, no_test=no_test, no_pwsh_analyze=no_pwsh_analyze,
                                                no_pwsh_test=no_pwsh_test, docker_engine=self._facts["docker_engine"])
 
+        content_repo = "" if not self._facts["content_repo"] else Path(self._facts["content_repo"].working_dir)
         with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as executor:
             return_exit_code: int = 0
             return_warning_code: int = 0
             results = []
+            linters = [Linter(pack_dir=pack,
+                              content_repo=content_repo,
+                              req_2=self._facts["requirements_2"],
+                              req_3=self._facts["requirements_3"],
+                              docker_engine=self._facts["docker_engine"]) for pack in self._pkgs]
+            if not no_flake8:
+                self._run_batched_flake8(executor=executor, linters=linters, modules=self._facts["test_modules"],
+                                         content_repo=content_repo)
             # Executing lint checks in different threads
-            for pack in self._pkgs:
-                linter: Linter = Linter(pack_dir=pack,
-                                        content_repo="" if not self._facts["content_repo"] else
-                                        Path(self._facts["content_repo"].working_dir),
-                                        req_2=self._facts["requirements_2"],
-                                        req_3=self._facts["requirements_3"],
-                                        docker_engine=self._facts["docker_engine"])
+            for linter in linters:
                 results.append(executor.submit(linter.run_dev_packages,
                                                no_flake8=no_flake8,
                                                no_bandit=no_bandit,
@@ -345,6 +360,10 @@ class LintManager:
                 except Exception:
                     pass
                 return 1
+            finally:
+                # Remove the lint worker containers which the packages shared
+                DOCKER_CONTAINERS_POOL.clear()
+                LINT_RESULTS_CACHE.save()
 
         self._report_results(lint_status=lint_status,
                              pkgs_status=pkgs_status,
@@ -360,6 +379,64 @@ class LintManager:
             return_exit_code = FAIL
         return return_exit_code
 
+    @staticmethod
+    def _run_batched_flake8(executor: concurrent.futures.Executor, linters: List[Linter], modules: dict,
+                            content_repo: Any):
+        """ Runs flake8 once on the files of many packages instead of once per package, and keeps the result of every
+            package in its linter as if flake8 ran on the package alone.
+            The packages are batched by the python executable which runs flake8, a batch which flake8 fails to run on
+            is left for its packages to run flake8 on their own. The packages facts are gathered in parallel, and a
+            batch runs as soon as it is full, while the facts of the next packages are gathered. The files which
+            flake8 passed on and didn't change since are left out, as their result is replayed from the cache.
+
+        Args:
+            executor(Executor): The executor to gather the packages facts and run the batches in.
+            linters(list): The packages linters.
+            modules(dict): Mandatory modules to locate in pack path (CommonServerPython.py etc)
+            content_repo(Path): The content repo dir, which flake8 runs in.
+        """
+        def gather_facts(linter: Linter) -> List[List[Path]]:
+            try:
+                linter.gather_facts(modules)
+                return linter.get_flake8_lint_files(modules)
+            except Exception as e:
+                # The package fails again when it runs on its own
+                logger.debug(f"Unable to gather the package facts for the batched flake8 - {e}")
+                return []
+
+        def run_batch(batch: List[Tuple[Linter, List[Path]]]):
+            files = [lint_file for _, lint_files in batch for lint_file in lint_files]
+            try:
+                stdout, stderr, exit_code = run_command_os(command=build_flake8_command(files,
+                                                                                        batch[0][0].python_version),
+                                                           cwd=content_repo)
+            except Exception as e:
+                stdout, stderr, exit_code = '', str(e), FAIL
+            logger.debug(f"Batched flake8 on {len(batch)} packages - Finished exit-code: {exit_code}")
+            owners = {str(lint_file): index for index, (_, lint_files) in enumerate(batch) for lint_file in lint_files}
+            outputs = split_output_by_files(stdout, owners)
+            if stderr or outputs is None or (exit_code and not outputs):
+                logger.info(f"Unable to run batched flake8 on {len(batch)} packages, running it per package")
+                return
+            for index, (linter, lint_files) in enumerate(batch):
+                output = outputs.get(index)
+                linter.set_batched_result('flake8', lint_files, (FAIL, output) if output else (SUCCESS, ''))
+
+        batches: Dict[str, List[Tuple[Linter, List[Path]]]] = {}
+        batch_runs = []
+        gather_runs = {executor.submit(gather_facts, linter): linter for linter in linters}
+        for gather_run in concurrent.futures.as_completed(gather_runs):
+            linter = gather_runs[gather_run]
+            for lint_files in gather_run.result():
+                python_exec = get_python_exec(linter.python_version)
+                batch = batches.setdefault(python_exec, [])
+                batch.append((linter, lint_files))
+                if len(batch) == HOST_LINT_BATCH_SIZE:
+                    batch_runs.append(executor.submit(run_batch, batches.pop(python_exec)))
+        batch_runs.extend(executor.submit(run_batch, batch) for batch in batches.values())
+        for batch_run in concurrent.futures.as_completed(batch_runs):
+            batch_run.result()
+
     def _report_results(self, lint_status: dict, pkgs_status: dict, return_exit_code: int, return_warning_code: int,
                         skipped_code: int,
                         pkgs_type: list):
@@ -5,10 +5,13 @@ import json
 import logging
 import os
 import platform
+import shlex
 import time
 import traceback
+from contextlib import contextmanager
 from copy import deepcopy
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (Any, Callable, Dict, FrozenSet, Generator, List, Optional,
+                    Tuple)
 
 # 3-rd party packages
 import docker
@@ -26,12 +29,18 @@ from demisto_sdk.commands.lint.commands_builder import (
     build_bandit_command, build_flake8_command, build_mypy_command,
     build_pwsh_analyze_command, build_pwsh_test_command, build_pylint_command,
     build_pytest_command, build_vulture_command, build_xsoar_linter_command)
-from demisto_sdk.commands.lint.helpers import (EXIT_CODES, FAIL, RERUN, RL,
+from demisto_sdk.commands.lint.helpers import (DEV_IMAGES_COORDINATOR,
+                                               DOCKER_CONTAINERS_POOL,
+                                               EXIT_CODES, FAIL,
+                                               LINT_RESULTS_CACHE, RERUN, RL,
                                                SUCCESS, WARNING,
                                                add_tmp_lint_files,
                                                add_typing_module,
+                                               create_pack_archive,
+                                               exec_in_container, get_dir_hash,
                                                get_file_from_container,
                                                get_python_version_from_image,
+                                               put_archive_to_container,
                                                pylint_plugin,
                                                split_warnings_errors,
                                                stream_docker_container_output)
@@ -59,6 +68,19 @@ class Linter:
         self._content_repo = content_repo
         self._pack_abs_dir = pack_dir
         self._pack_name = None
+        # Whether to build an image per package, or copy the package into the lint containers of the dev image
+        self._build_pack_image = bool(os.getenv('DEMISTO_LINT_BUILD_PACK_IMAGE'))
+        self._pack_archives: Dict[str, bytes] = {}
+        # The pooled worker container which runs the package checks, and the package dir in the container
+        self._lint_worker: Optional[docker.models.containers.Container] = None
+        self._lint_worker_entrypoint: List[str] = []
+        self._lint_work_dir = "/devwork"
+        # The hash of the package files and the test modules added to it, for the lint results cache
+        self._pack_hash: Optional[str] = None
+        # Whether the package is skipped, once its facts are gathered
+        self._skip: Optional[bool] = None
+        # The results of the host checks which ran on the files of many packages, by check and lint files
+        self._batched_results: Dict[Tuple[str, FrozenSet[str]], Tuple[int, str]] = {}
         # Docker client init
         if docker_engine:
             self._docker_client: docker.DockerClient = docker.from_env()
@@ -122,7 +144,7 @@ class Linter:
             dict: lint and test all status, pkg status)
         """
         # Gather information for lint check information
-        skip = self._gather_facts(modules)
+        skip = self.gather_facts(modules)
         # If not python pack - skip pack
         if skip:
             return self._pkg_lint_status
@@ -156,6 +178,59 @@ class Linter:
             self._pkg_lint_status['exit_code'] += FAIL
         return self._pkg_lint_status
 
+    def gather_facts(self, modules: dict) -> bool:
+        """ Gathering facts about the package once, before running the batched host checks or the package checks
+
+        Args:
+            modules(dict): Test mandatory modules to be ignore in lint check
+
+        Returns:
+            bool: Indicating if to continue further or not, if False exit Thread, Else continue.
+        """
+        if self._skip is None:
+            self._skip = self._gather_facts(modules)
+        return self._skip
+
+    @property
+    def python_version(self) -> float:
+        return self._facts["python_version"]
+
+    def get_flake8_lint_files(self, modules: dict) -> List[List[Path]]:
+        """ The lists of files which flake8 runs on in the package - the lint files and the unit test files, without
+            the ones which flake8 passed on and didn't change since, as their result is replayed from the cache
+
+        Args:
+            modules(dict): Mandatory modules to locate in pack path (CommonServerPython.py etc)
+
+        Returns:
+            list: The lists of files to run flake8 on.
+        """
+        if self._skip is not False or self._pkg_lint_status["pack_type"] != TYPE_PYTHON:
+            return []
+        flake8_lint_files = [lint_files for lint_files in (self._facts["lint_files"], self._facts["lint_unittest_files"])
+                             if lint_files]
+        if not LINT_RESULTS_CACHE.size:
+            return flake8_lint_files
+        # The package is hashed with the mandatory modules, as it is when its checks run
+        with add_tmp_lint_files(content_repo=self._content_repo,  # type: ignore
+                                pack_path=self._pack_abs_dir,
+                                lint_files=self._facts["lint_files"],
+                                modules=modules,
+                                pack_type=self._pkg_lint_status["pack_type"]):
+            return [lint_files for lint_files in flake8_lint_files
+                    if LINT_RESULTS_CACHE.get(self._get_check_key('flake8', self._host_check_settings(lint_files)))
+                    is None]
+
+    def set_batched_result(self, check: str, lint_files: List[Path], result: Tuple[int, str]):
+        """ Keep the result of a host check on lint files of the package, from a run of the check on many packages
+
+        Args:
+            check(str): The check name.
+            lint_files(list): The package files which the check ran on.
+            result(tuple): The check exit code and the package output, as if the check ran on the package alone.
+        """
+        self._batched_results[(check, frozenset(str(lint_file) for lint_file in lint_files))] = result
+
     def _gather_facts(self, modules: dict) -> bool:
         """ Gathering facts about the package - python version, docker images, valid docker image, yml parsing
         Args:
@@ -297,23 +372,29 @@ class Linter:
         other = []
         if self._facts["lint_files"]:
             exit_code: int = 0
+            check_settings = self._host_check_settings(lint_files=self._facts["lint_files"])
             for lint_check in ["flake8", "XSOAR_linter", "bandit", "mypy", "vulture"]:
                 exit_code = SUCCESS
                 output = ""
                 if lint_check == "flake8" and not no_flake8:
-                    exit_code, output = self._run_flake8(py_num=self._facts["python_version"],
-                                                         lint_files=self._facts["lint_files"])
+                    exit_code, output = self._cached_check(
+                        lint_check, check_settings, lambda: self._run_flake8(py_num=self._facts["python_version"],
+                                                                             lint_files=self._facts["lint_files"]))
                 elif lint_check == "XSOAR_linter" and not no_xsoar_linter:
-                    exit_code, output = self._run_xsoar_linter(py_num=self._facts["python_version"],
-                                                               lint_files=self._facts["lint_files"])
+                    exit_code, output = self._cached_check(
+                        lint_check, check_settings, lambda: self._run_xsoar_linter(py_num=self._facts["python_version"],
+                                                                                   lint_files=self._facts["lint_files"]))
                 elif lint_check == "bandit" and not no_bandit:
-                    exit_code, output = self._run_bandit(lint_files=self._facts["lint_files"])
+                    exit_code, output = self._cached_check(
+                        lint_check, check_settings, lambda: self._run_bandit(lint_files=self._facts["lint_files"]))
                 elif lint_check == "mypy" and not no_mypy:
-                    exit_code, output = self._run_mypy(py_num=self._facts["python_version"],
-                                                       lint_files=self._facts["lint_files"])
+                    exit_code, output = self._cached_check(
+                        lint_check, check_settings, lambda: self._run_mypy(py_num=self._facts["python_version"],
+                                                                           lint_files=self._facts["lint_files"]))
                 elif lint_check == "vulture" and not no_vulture:
-                    exit_code, output = self._run_vulture(py_num=self._facts["python_version"],
-                                                          lint_files=self._facts["lint_files"])
+                    exit_code, output = self._cached_check(
+                        lint_check, check_settings, lambda: self._run_vulture(py_num=self._facts["python_version"],
+                                                                              lint_files=self._facts["lint_files"]))
 
                 # check for any exit code other than 0
                 if exit_code:
@@ -335,8 +416,10 @@ class Linter:
                 exit_code = SUCCESS
                 output = ""
                 if lint_check == "flake8" and not no_flake8:
-                    exit_code, output = self._run_flake8(py_num=self._facts["python_version"],
-                                                         lint_files=self._facts["lint_unittest_files"])
+                    exit_code, output = self._cached_check(
+                        lint_check, self._host_check_settings(lint_files=self._facts["lint_unittest_files"]),
+                        lambda: self._run_flake8(py_num=self._facts["python_version"],
+                                                 lint_files=self._facts["lint_unittest_files"]))
                 if exit_code:
                     error, warning, other = split_warnings_errors(output)
                 if exit_code & FAIL:
@@ -350,6 +433,68 @@ class Linter:
                     self._pkg_lint_status["warning_code"] |= EXIT_CODES[lint_check]
                     self._pkg_lint_status[f"{lint_check}_warnings"] = "\n".join(warning)
 
+    def _cached_check(self, check: str, check_settings: Optional[Dict], run_check: Callable[[], Tuple]) -> Tuple:
+        """ Replay the result of a lint check from the lint results cache, or run it and cache its result if it passed
+
+        Args:
+            check(str): The check name.
+            check_settings(dict): Everything the check result depends on other than the package files, None to always
+                run the check.
+            run_check(Callable): Runs the check and returns its result, starting with its exit code.
+
+        Returns:
+            tuple: The check result.
+        """
+        if check_settings is None:
+            return run_check()
+        key = self._get_check_key(check, check_settings)
+        result = LINT_RESULTS_CACHE.get(key)
+        if result is not None:
+            logger.info(f"{self._pack_name} - {check} - Unchanged since it passed, skipping")
+            return tuple(result)
+        result = run_check()
+        if result[0] == SUCCESS:
+            LINT_RESULTS_CACHE.set(key, list(result))
+        return result
+
+    def _get_check_key(self, check: str, check_settings: Dict) -> str:
+        """ The lint results cache key of a check on the package, the package is hashed on the first call """
+        if self._pack_hash is None:
+            self._pack_hash = get_dir_hash(self._pack_abs_dir)
+        return LINT_RESULTS_CACHE.get_key(check=check, pack=str(self._pack_abs_dir), pack_hash=self._pack_hash,
+                                          **check_settings)
+
+    def _host_check_settings(self, lint_files: List[Path]) -> Dict:
+        """ The settings which the result of a lint check on host depends on, for the lint results cache """
+        py_num = self._facts["python_version"]
+        return {
+            "lint_files": [str(lint_file) for lint_file in lint_files],
+            "python_version": py_num,
+            "requirements": self._req_3 if py_num >= 3 else self._req_2,
+            "support_level": self._facts["support_level"],
+            "is_long_running": self._facts["is_long_running"],
+        }
+
+    def _docker_check_settings(self, test_image: str) -> Optional[Dict]:
+        """ The settings which the result of a lint check in the test image depends on, for the lint results cache
+
+        Args:
+            test_image(str): test image id/name
+
+        Returns:
+            dict: The check settings, None if the image id can't be found.
+        """
+        try:
+            image_id = self._docker_client.images.get(test_image).id
+        except (docker.errors.ImageNotFound, docker.errors.APIError) as e:
+            logger.info(f"{self._pack_name} - Unable to get the id of image {test_image}, not caching its checks - {e}")
+            return None
+        return {
+            "image_id": image_id,
+            "lint_files": [str(lint_file) for lint_file in self._facts["lint_files"]],
+            "env_vars": self._facts["env_vars"],
+        }
+
     def _run_flake8(self, py_num: float, lint_files: List[Path]) -> Tuple[int, str]:
         """ Runs flake8 in pack dir
 
@@ -362,6 +507,10 @@ class Linter:
            str: Bandit errors
         """
         log_prompt = f"{self._pack_name} - Flake8"
+        batched_result = self._batched_results.get(("flake8", frozenset(str(lint_file) for lint_file in lint_files)))
+        if batched_result:
+            logger.info(f"{log_prompt} - Finished in a batched run, exit-code: {batched_result[0]}")
+            return batched_result
         logger.info(f"{log_prompt} - Start")
         stdout, stderr, exit_code = run_command_os(command=build_flake8_command(lint_files, py_num),
                                                    cwd=self._content_repo)
@@ -554,48 +703,61 @@ class Linter:
                     break
 
             if image_id and not errors:
-                # Set image creation status
-                for check in ["pylint", "pytest", "pwsh_analyze", "pwsh_test"]:
-                    exit_code = SUCCESS
-                    output = ""
-                    for trial in range(2):
-                        if self._pkg_lint_status["pack_type"] == TYPE_PYTHON:
-                            # Perform pylint
-                            if not no_pylint and check == "pylint" and self._facts["lint_files"]:
-                                exit_code, output = self._docker_run_pylint(test_image=image_id,
-                                                                            keep_container=keep_container)
-                            # Perform pytest
-                            elif not no_test and self._facts["test"] and check == "pytest":
-                                exit_code, output, test_json = self._docker_run_pytest(test_image=image_id,
-                                                                                       keep_container=keep_container,
-                                                                                       test_xml=test_xml)
-                                status["pytest_json"] = test_json
-                        elif self._pkg_lint_status["pack_type"] == TYPE_PWSH:
-                            # Perform powershell analyze
-                            if not no_pwsh_analyze and check == "pwsh_analyze" and self._facts["lint_files"]:
-                                exit_code, output = self._docker_run_pwsh_analyze(test_image=image_id,
-                                                                                  keep_container=keep_container)
-                            # Perform powershell test
-                            elif not no_pwsh_test and check == "pwsh_test":
-                                exit_code, output = self._docker_run_pwsh_test(test_image=image_id,
-                                                                               keep_container=keep_container)
-                        # If lint check perfrom and failed on reason related to enviorment will run twice,
-                        # But it failing in second time it will count as test failure.
-                        if (exit_code == RERUN and trial == 1) or exit_code == FAIL or exit_code == SUCCESS:
-                            if exit_code in [RERUN, FAIL]:
-                                self._pkg_lint_status["exit_code"] |= EXIT_CODES[check]
-                                status[f"{check}_errors"] = output
-                            break
+                # The kept containers are for debugging the checks, so they always run
+                check_settings = None if keep_container else self._docker_check_settings(test_image=image_id)
+                with self._docker_lint_worker(test_image=image_id, keep_container=keep_container):
+                    for check in ["pylint", "pytest", "pwsh_analyze", "pwsh_test"]:
+                        exit_code = SUCCESS
+                        output = ""
+                        for trial in range(2):
+                            if self._pkg_lint_status["pack_type"] == TYPE_PYTHON:
+                                # Perform pylint
+                                if not no_pylint and check == "pylint" and self._facts["lint_files"]:
+                                    exit_code, output = self._cached_check(
+                                        check, check_settings,
+                                        lambda: self._docker_run_pylint(test_image=image_id,
+                                                                        keep_container=keep_container))
+                                # Perform pytest
+                                elif not no_test and self._facts["test"] and check == "pytest":
+                                    # The pytest xml results are written by the check, so it always runs when requested
+                                    exit_code, output, test_json = self._cached_check(
+                                        check, None if test_xml else check_settings,
+                                        lambda: self._docker_run_pytest(test_image=image_id,
+                                                                        keep_container=keep_container,
+                                                                        test_xml=test_xml))
+                                    status["pytest_json"] = test_json
+                            elif self._pkg_lint_status["pack_type"] == TYPE_PWSH:
+                                # Perform powershell analyze
+                                if not no_pwsh_analyze and check == "pwsh_analyze" and self._facts["lint_files"]:
+                                    exit_code, output = self._cached_check(
+                                        check, check_settings,
+                                        lambda: self._docker_run_pwsh_analyze(test_image=image_id,
+                                                                              keep_container=keep_container))
+                                # Perform powershell test
+                                elif not no_pwsh_test and check == "pwsh_test":
+                                    exit_code, output = self._cached_check(
+                                        check, check_settings,
+                                        lambda: self._docker_run_pwsh_test(test_image=image_id,
+                                                                           keep_container=keep_container))
+                            # If lint check perfrom and failed on reason related to enviorment will run twice,
+                            # But it failing in second time it will count as test failure.
+                            if (exit_code == RERUN and trial == 1) or exit_code == FAIL or exit_code == SUCCESS:
+                                if exit_code in [RERUN, FAIL]:
+                                    self._pkg_lint_status["exit_code"] |= EXIT_CODES[check]
+                                    status[f"{check}_errors"] = output
+                                break
             else:
                 status["image_errors"] = str(errors)
                 self._pkg_lint_status["exit_code"] += EXIT_CODES["image"]
 
             # Add image status to images
             self._pkg_lint_status["images"].append(status)
-            try:
-                self._docker_client.images.remove(image_id)
-            except (docker.errors.ImageNotFound, docker.errors.APIError):
-                pass
+            # The shared dev image is kept for the next packages and runs
+            if self._build_pack_image:
+                try:
+                    self._docker_client.images.remove(image_id)
+                except (docker.errors.ImageNotFound, docker.errors.APIError):
+                    pass
 
     def _docker_login(self) -> bool:
         """ Login to docker-hub using environment variables:
@@ -623,6 +785,9 @@ class Linter:
                installed, packages which being install can be found in path demisto_sdk/commands/lint/dev_envs
             3. The docker image build done by Dockerfile template located in
                 demisto_sdk/commands/lint/templates/dockerfile.jinja2
+            4. If DEMISTO_LINT_BUILD_PACK_IMAGE is set, building an image which contains the package on top of the
+               dev image. Otherwise building an image which updates the CA certificates on top of the dev image, once
+               per run for all its packages, and the package is copied into the lint containers of this image.
 
         Args:
             docker_base_image(list): docker image to use as base for installing dev deps and python version.
@@ -650,9 +815,64 @@ class Linter:
         except exceptions.TemplateError as e:
             logger.debug(f"{log_prompt} - Error when build image - {e.message()}")
             return test_image_id, str(e)
-        # Trying to pull image based on dockerfile hash, will check if something changed
-        errors = ""
+        # The dev image name is based on dockerfile hash, will check if something changed
         test_image_name = f'devtest{docker_base_image[0]}-{hashlib.md5(dockerfile.encode("utf-8")).hexdigest()}'
+        # Packages which share the dev image wait for the first one to pull or build it
+        errors = DEV_IMAGES_COORDINATOR.create_image(
+            test_image_name, lambda: self._docker_dev_image_create(test_image_name, docker_base_image[0], dockerfile))
+        if not self._build_pack_image:
+            if errors:
+                return test_image_name, errors
+            # The same steps as the package image, without copying the package
+            certs_image_name = f'{test_image_name}-certs'
+            dockerfile = template.render(image=test_image_name,
+                                         update_certs=True)
+            errors = DEV_IMAGES_COORDINATOR.create_image(
+                certs_image_name, lambda: self._docker_certs_image_create(certs_image_name, dockerfile))
+            return certs_image_name, errors
+        dockerfile_path = Path(self._pack_abs_dir / ".Dockerfile")
+        dockerfile = template.render(image=test_image_name,
+                                     copy_pack=True)
+        with open(file=dockerfile_path, mode="+x") as file:
+            file.write(str(dockerfile))
+        # we only do retries in CI env where docker build is sometimes flacky
+        build_tries = int(os.getenv('DEMISTO_SDK_DOCKER_BUILD_TRIES', 3)) if os.getenv('CI') else 1
+        for trial in range(build_tries):
+            try:
+                logger.info(f"{log_prompt} - Copy pack dir to image {test_image_name}")
+                docker_image_final = self._docker_client.images.build(path=str(dockerfile_path.parent),
+                                                                      dockerfile=dockerfile_path.stem,
+                                                                      forcerm=True)
+                test_image_name = docker_image_final[0].short_id
+                break
+            except Exception as e:
+                logger.exception(f"{log_prompt} - errors occurred when building image in dir {e}")
+                if trial >= build_tries:
+                    errors = str(e)
+                else:
+                    logger.info(f"{log_prompt} - sleeping 2 seconds and will retry build after")
+                    time.sleep(2)
+        if dockerfile_path.exists():
+            dockerfile_path.unlink()
+
+        if test_image_id:
+            logger.info(f"{log_prompt} - Image {test_image_id} created successfully")
+
+        return test_image_name, errors
+
+    def _docker_dev_image_create(self, test_image_name: str, docker_base_image_name: str, dockerfile: str) -> str:
+        """ Pull the dev image, or build it from its dockerfile if it doesn't exist in the repository
+
+        Args:
+            test_image_name(str): The dev image name.
+            docker_base_image_name(str): The docker image the dev image is based on.
+            dockerfile(str): The dev image dockerfile.
+
+        Returns:
+            str. errors string.
+        """
+        log_prompt = f"{self._pack_name} - Image create"
+        errors = ""
         test_image = None
         try:
             logger.info(f"{log_prompt} - Trying to pull existing image {test_image_name}")
@@ -662,7 +882,7 @@ class Linter:
         # Creatng new image if existing image isn't found
         if not test_image:
             logger.info(
-                f"{log_prompt} - Creating image based on {docker_base_image[0]} - Could take 2-3 minutes at first "
+                f"{log_prompt} - Creating image based on {docker_base_image_name} - Could take 2-3 minutes at first "
                 f"time")
             try:
                 with io.BytesIO() as f:
@@ -686,35 +906,138 @@ class Linter:
                 errors = str(e)
         else:
             logger.info(f"{log_prompt} - Found existing image {test_image_name}")
-        dockerfile_path = Path(self._pack_abs_dir / ".Dockerfile")
-        dockerfile = template.render(image=test_image_name,
-                                     copy_pack=True)
-        with open(file=dockerfile_path, mode="+x") as file:
-            file.write(str(dockerfile))
-        # we only do retries in CI env where docker build is sometimes flacky
-        build_tries = int(os.getenv('DEMISTO_SDK_DOCKER_BUILD_TRIES', 3)) if os.getenv('CI') else 1
-        for trial in range(build_tries):
+
+        return errors
+
+    def _docker_certs_image_create(self, certs_image_name: str, dockerfile: str) -> str:
+        """ Build the image which updates the CA certificates on top of the dev image
+
+        Args:
+            certs_image_name(str): The certificates image name.
+            dockerfile(str): The certificates image dockerfile.
+
+        Returns:
+            str. errors string.
+        """
+        log_prompt = f"{self._pack_name} - Image create"
+        errors = ""
+        try:
+            logger.info(f"{log_prompt} - Updating the certificates of image {certs_image_name}")
+            with io.BytesIO() as f:
+                f.write(dockerfile.encode('utf-8'))
+                f.seek(0)
+                self._docker_client.images.build(fileobj=f,
+                                                 tag=certs_image_name,
+                                                 forcerm=True)
+        except (docker.errors.BuildError, docker.errors.APIError, Exception) as e:
+            logger.critical(f"{log_prompt} - Build errors occurred {e}")
+            errors = str(e)
+
+        return errors
+
+    @contextmanager
+    def _docker_lint_worker(self, test_image: str, keep_container: bool) -> Generator[None, None, None]:
+        """ Lease a worker container of the test image from the containers pool, and copy the package into its own dir
+            in the worker, for the package lint checks to run in it with exec.
+            Every check runs in a new container instead if the containers are kept, the package is built into the test
+            image or a worker can't be leased.
+
+        Args:
+            test_image(str): test image id/name
+            keep_container(bool): True if to keep the containers after execution finished
+        """
+        log_prompt = f'{self._pack_name} - Lint worker - Image {test_image}'
+        worker = None
+        if not keep_container and not self._build_pack_image:
             try:
-                logger.info(f"{log_prompt} - Copy pack dir to image {test_image_name}")
-                docker_image_final = self._docker_client.images.build(path=str(dockerfile_path.parent),
-                                                                      dockerfile=dockerfile_path.stem,
-                                                                      forcerm=True)
-                test_image_name = docker_image_final[0].short_id
-                break
-            except Exception as e:
-                logger.exception(f"{log_prompt} - errors occurred when building image in dir {e}")
-                if trial >= build_tries:
-                    errors = str(e)
+                worker = DOCKER_CONTAINERS_POOL.acquire(self._docker_client, test_image)
+                put_archive_to_container(worker, self._get_pack_archive(arcname=str(self._pack_name)), '/devwork')
+                self._lint_worker_entrypoint = worker.image.attrs['Config'].get('Entrypoint') or []
+                self._lint_work_dir = f'/devwork/{self._pack_name}'
+                self._lint_worker = worker
+            except (docker.errors.ImageNotFound, docker.errors.APIError) as e:
+                logger.info(f"{log_prompt} - Unable to use a worker container, running every check in a new container"
+                            f" - {e}")
+                if worker:
+                    DOCKER_CONTAINERS_POOL.discard(worker)
+                    worker = None
+        try:
+            yield
+        finally:
+            self._lint_worker = None
+            self._lint_work_dir = "/devwork"
+            if worker:
+                # Remove the package from the worker before the next package leases it
+                try:
+                    exit_code, _ = exec_in_container(worker, command=['rm', '-rf', f'/devwork/{self._pack_name}'],
+                                                     user=f"{os.getuid()}:4000")
+                except docker.errors.APIError:
+                    exit_code = FAIL
+                if exit_code:
+                    logger.info(f"{log_prompt} - Unable to clean the worker container, removing it")
+                    DOCKER_CONTAINERS_POOL.discard(worker)
                 else:
-                    logger.info(f"{log_prompt} - sleeping 2 seconds and will retry build after")
-                    time.sleep(2)
-        if dockerfile_path.exists():
-            dockerfile_path.unlink()
+                    DOCKER_CONTAINERS_POOL.release(test_image, worker)
 
-        if test_image_id:
-            logger.info(f"{log_prompt} - Image {test_image_id} created successfully")
+    def _get_pack_archive(self, arcname: str) -> bytes:
+        """ The archive is created once and copied into all the package containers """
+        if arcname not in self._pack_archives:
+            self._pack_archives[arcname] = create_pack_archive(self._pack_abs_dir, arcname=arcname)
+        return self._pack_archives[arcname]
 
-        return test_image_name, errors
+    def _docker_run_check(self, container_name: str, test_image: str,
+                          command: Any) -> Tuple[docker.models.containers.Container, int, str]:
+        """ Run a lint check in the package worker container, or in a new container of the test image
+
+        Args:
+            container_name(str): The new container name.
+            test_image(str): test image id/name
+            command(Any): The check command, a string is split as the container command is.
+
+        Returns:
+            Container: The container which the check ran in.
+            int: The check exit code.
+            str: The check output.
+        """
+        if self._lint_worker:
+            command = self._lint_worker_entrypoint + (shlex.split(command) if isinstance(command, str) else command)
+            exit_code, output = exec_in_container(self._lint_worker, command=command, user=f"{os.getuid()}:4000",
+                                                  environment=self._facts["env_vars"], workdir=self._lint_work_dir)
+            return self._lint_worker, exit_code, output
+
+        # Check if previous run left container a live if it do, we remove it
+        self._docker_remove_container(container_name)
+        container_obj = self._docker_run_container(container_name=container_name, test_image=test_image,
+                                                   command=command)
+        stream_docker_container_output(container_obj.logs(stream=True))
+        # wait for container to finish
+        container_status = container_obj.wait(condition="exited")
+
+        return container_obj, container_status.get("StatusCode"), container_obj.logs().decode("utf-8")
+
+    def _docker_run_container(self, container_name: str, test_image: str,
+                              command: Any) -> docker.models.containers.Container:
+        """ Create a lint container and start it, the package is copied into the /devwork dir of the container before
+            it starts if the package isn't built into the test image.
+
+        Args:
+            container_name(str): The container name.
+            test_image(str): test image id/name
+            command(Any): The container command.
+
+        Returns:
+            Container: The started container.
+        """
+        container_obj = self._docker_client.containers.create(name=container_name,
+                                                              image=test_image,
+                                                              command=command,
+                                                              user=f"{os.getuid()}:4000",
+                                                              environment=self._facts["env_vars"])
+        if not self._build_pack_image:
+            put_archive_to_container(container_obj, self._get_pack_archive(arcname='.'), '/devwork')
+        container_obj.start()
+
+        return container_obj
 
     def _docker_remove_container(self, container_name: str):
         try:
@@ -741,27 +1064,15 @@ class Linter:
         log_prompt = f'{self._pack_name} - Pylint - Image {test_image}'
         logger.info(f"{log_prompt} - Start")
         container_name = f"{self._pack_name}-pylint"
-        # Check if previous run left container a live if it do, we remove it
-        self._docker_remove_container(container_name)
 
         # Run container
         exit_code = SUCCESS
         output = ""
         try:
-            container_obj: docker.models.containers.Container = self._docker_client.containers.run(name=container_name,
-                                                                                                   image=test_image,
-                                                                                                   command=[
-                                                                                                       build_pylint_command(self._facts["lint_files"])],
-                                                                                                   user=f"{os.getuid()}:4000",
-                                                                                                   detach=True,
-                                                                                                   environment=self._facts["env_vars"])
-            stream_docker_container_output(container_obj.logs(stream=True))
-            # wait for container to finish
-            container_status = container_obj.wait(condition="exited")
-            # Get container exit code
-            container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
-            container_log = container_obj.logs().decode("utf-8")
+            container_obj, container_exit_code, container_log = self._docker_run_check(
+                container_name=container_name,
+                test_image=test_image,
+                command=[build_pylint_command(self._facts["lint_files"])])
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code in [1, 2]:
                 # 1-fatal message issued
@@ -784,7 +1095,7 @@ class Linter:
             # Keeping container if needed or remove it
             if keep_container:
                 print(f"{log_prompt} - container name {container_name}")
-            else:
+            elif not self._lint_worker:
                 try:
                     container_obj.remove(force=True)
                 except docker.errors.NotFound as e:
@@ -811,27 +1122,16 @@ class Linter:
         log_prompt = f'{self._pack_name} - Pytest - Image {test_image}'
         logger.info(f"{log_prompt} - Start")
         container_name = f"{self._pack_name}-pytest"
-        # Check if previous run left container a live if it does, Remove it
-        self._docker_remove_container(container_name)
         # Collect tests
         exit_code = SUCCESS
         output = ''
         test_json = {}
         try:
             # Running pytest container
-            container_obj: docker.models.containers.Container = self._docker_client.containers.run(name=container_name,
-                                                                                                   image=test_image,
-                                                                                                   command=[
-                                                                                                       build_pytest_command(test_xml=test_xml, json=True)],
-                                                                                                   user=f"{os.getuid()}:4000",
-                                                                                                   detach=True,
-                                                                                                   environment=self._facts["env_vars"])
-            stream_docker_container_output(container_obj.logs(stream=True))
-            # Waiting for container to be finished
-            container_status: dict = container_obj.wait(condition="exited")
-            # Getting container exit code
-            container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
+            container_obj, container_exit_code, container_log = self._docker_run_check(
+                container_name=container_name,
+                test_image=test_image,
+                command=[build_pytest_command(test_xml=test_xml, json=True, work_dir=self._lint_work_dir)])
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code in [0, 1, 2, 5]:
                 # 0-All tests passed
@@ -840,13 +1140,13 @@ class Linter:
                 # 5-No tests were collected
                 if test_xml:
                     test_data_xml = get_file_from_container(container_obj=container_obj,
-                                                            container_path="/devwork/report_pytest.xml")
+                                                            container_path=f"{self._lint_work_dir}/report_pytest.xml")
                     xml_apth = Path(test_xml) / f'{self._pack_name}_pytest.xml'
                     with open(file=xml_apth, mode='bw') as f:
                         f.write(test_data_xml)  # type: ignore
 
                 test_json = json.loads(get_file_from_container(container_obj=container_obj,
-                                                               container_path="/devwork/report_pytest.json",
+                                                               container_path=f"{self._lint_work_dir}/report_pytest.json",
                                                                encoding="utf-8"))
                 for test in test_json.get('report', {}).get("tests"):
                     if test.get("call", {}).get("longrepr"):
@@ -855,7 +1155,7 @@ class Linter:
                     logger.info(f"{log_prompt} - Successfully finished")
                     exit_code = SUCCESS
                 elif container_exit_code in [2]:
-                    output = container_obj.logs().decode('utf-8')
+                    output = container_log
                     exit_code = FAIL
                 else:
                     logger.info(f"{log_prompt} - Finished errors found")
@@ -865,11 +1165,11 @@ class Linter:
                 # 4-pytest command line usage error
                 logger.critical(f"{log_prompt} - Usage error")
                 exit_code = RERUN
-                output = container_obj.logs().decode('utf-8')
+                output = container_log
             # Remove container if not needed
             if keep_container:
                 print(f"{log_prompt} - Container name {container_name}")
-            else:
+            elif not self._lint_worker:
                 try:
                     container_obj.remove(force=True)
                 except docker.errors.NotFound as e:
@@ -894,32 +1194,15 @@ class Linter:
         log_prompt = f'{self._pack_name} - Powershell analyze - Image {test_image}'
         logger.info(f"{log_prompt} - Start")
         container_name = f"{self._pack_name}-pwsh-analyze"
-        # Check if previous run left container a live if it do, we remove it
-        container_obj: docker.models.containers.Container
-        try:
-            container_obj = self._docker_client.containers.get(container_name)
-            container_obj.remove(force=True)
-        except docker.errors.NotFound:
-            pass
 
         # Run container
         exit_code = SUCCESS
         output = ""
         try:
-            container_obj = self._docker_client.containers.run(name=container_name,
-                                                               image=test_image,
-                                                               command=build_pwsh_analyze_command(
-                                                                   self._facts["lint_files"][0]),
-                                                               user=f"{os.getuid()}:4000",
-                                                               detach=True,
-                                                               environment=self._facts["env_vars"])
-            stream_docker_container_output(container_obj.logs(stream=True))
-            # wait for container to finish
-            container_status = container_obj.wait(condition="exited")
-            # Get container exit code
-            container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
-            container_log = container_obj.logs().decode("utf-8")
+            container_obj, container_exit_code, container_log = self._docker_run_check(
+                container_name=container_name,
+                test_image=test_image,
+                command=build_pwsh_analyze_command(self._facts["lint_files"][0]))
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code:
                 # 1-fatal message issued
@@ -932,7 +1215,7 @@ class Linter:
             # Keeping container if needed or remove it
             if keep_container:
                 print(f"{log_prompt} - container name {container_name}")
-            else:
+            elif not self._lint_worker:
                 try:
                     container_obj.remove(force=True)
                 except docker.errors.NotFound as e:
@@ -965,26 +1248,15 @@ class Linter:
         log_prompt = f'{self._pack_name} - Powershell test - Image {test_image}'
         logger.info(f"{log_prompt} - Start")
         container_name = f"{self._pack_name}-pwsh-test"
-        # Check if previous run left container a live if it do, we remove it
-        self._docker_remove_container(container_name)
 
         # Run container
         exit_code = SUCCESS
         output = ""
         try:
-            container_obj: docker.models.containers.Container = self._docker_client.containers.run(name=container_name,
-                                                                                                   image=test_image,
-                                                                                                   command=build_pwsh_test_command(),
-                                                                                                   user=f"{os.getuid()}:4000",
-                                                                                                   detach=True,
-                                                                                                   environment=self._facts["env_vars"])
-            stream_docker_container_output(container_obj.logs(stream=True))
-            # wait for container to finish
-            container_status = container_obj.wait(condition="exited")
-            # Get container exit code
-            container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
-            container_log = container_obj.logs().decode("utf-8")
+            container_obj, container_exit_code, container_log = self._docker_run_check(
+                container_name=container_name,
+                test_image=test_image,
+                command=build_pwsh_test_command())
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code:
                 # 1-fatal message issued
@@ -997,7 +1269,7 @@ class Linter:
             # Keeping container if needed or remove it
             if keep_container:
                 print(f"{log_prompt} - container name {container_name}")
-            else:
+            elif not self._lint_worker:
                 try:
                     container_obj.remove(force=True)
                 except docker.errors.NotFound as e:
@@ -1,4 +1,7 @@
+import io
 import os
+import socket
+import tarfile
 
 import pytest
 from demisto_sdk.commands.lint.helpers import split_warnings_errors
@@ -56,10 +59,47 @@ def test_build_skipped_exit_code(no_flake8: bool, no_xsoar_linter: bool, no_band
 def test_get_python_version_from_image(image: str, output: bytes, expected: float, mocker):
     from demisto_sdk.commands.lint import helpers
     mocker.patch.object(helpers, 'docker')
+    helpers.docker.from_env().images.get.return_value.id = f'sha256:{image}'
+    helpers.docker.from_env().images.get.return_value.attrs = {'Config': {'Env': []}}
     helpers.docker.from_env().containers.run().logs.return_value = output
     assert expected == helpers.get_python_version_from_image(image)
 
 
+def test_get_python_version_from_image_cache(mocker):
+    """
+    Given
+        - A docker image which its config has the python version, and a docker image which its config doesn't.
+
+    When
+        - Getting the python version of the images twice, and then in a new run.
+
+    Then
+        - Ensure the version is taken from the image config without starting a container.
+        - Ensure a container is started once for the image without the version in its config.
+        - Ensure the versions are cached by the image id for the next runs.
+    """
+    from demisto_sdk.commands.lint import helpers
+    mocker.patch.object(helpers, 'docker')
+    docker_client = helpers.docker.from_env()
+    images = {
+        'demisto/python3:3.8.6.1': mocker.Mock(id='sha256:1', attrs={'Config': {'Env': ['PYTHON_VERSION=3.8.6']}}),
+        'demisto/custom:1.0': mocker.Mock(id='sha256:2', attrs={'Config': {'Env': ['PATH=/usr/bin']}}),
+    }
+    docker_client.images.get.side_effect = images.get
+    docker_client.containers.run.return_value.logs.return_value = b'2.7\n'
+
+    for _ in range(2):
+        assert helpers.get_python_version_from_image('demisto/python3:3.8.6.1') == 3.8
+        assert helpers.get_python_version_from_image('demisto/custom:1.0') == 2.7
+    assert docker_client.containers.run.call_count == 1
+
+    helpers.PYTHON_VERSIONS_CACHE.clear()
+    images['demisto/python3:3.8.6.1'].attrs = {}
+    assert helpers.get_python_version_from_image('demisto/python3:3.8.6.1') == 3.8
+    assert helpers.get_python_version_from_image('demisto/custom:1.0') == 2.7
+    assert docker_client.containers.run.call_count == 1
+
+
 @pytest.mark.parametrize(argnames="archive_response, expected_count, expected_exception",
                          argvalues=[
                              ([False, True], 2, False),
@@ -84,6 +124,30 @@ def test_copy_dir_to_container(mocker, archive_response: bool, expected_count: i
     assert mock_container.put_archive.call_count == expected_count
 
 
+def test_create_pack_archive(tmp_path):
+    """
+    Given
+        - A package dir with a file and a sub dir.
+
+    When
+        - Archiving the package dir to copy it into the lint containers.
+
+    Then
+        - Ensure the package dir content is archived relative to the package dir.
+        - Ensure all the archived files are owned by the group 4000 with 775 permissions.
+    """
+    from demisto_sdk.commands.lint import helpers
+    (tmp_path / 'test_data').mkdir()
+    (tmp_path / 'test_data' / 'data.json').write_text('{}')
+    (tmp_path / 'Sample.py').write_text('')
+
+    with tarfile.open(fileobj=io.BytesIO(helpers.create_pack_archive(tmp_path)), mode='r:gz') as archive:
+        members = archive.getmembers()
+
+    assert sorted(member.name for member in members) == ['.', './Sample.py', './test_data', './test_data/data.json']
+    assert all(member.gid == 4000 and member.mode == 0o775 for member in members)
+
+
 MSG = [('flake8',
         "/Users/test_user/dev/demisto/content/Packs/Maltiverse/Integrations/Maltiverse/Maltiverse.py:6:1: F401 "
         "'typing.Tuple' imported but unused\n/Users/test_user/dev/demisto/content/Packs/Maltiverse/Integrations"
@@ -146,3 +210,232 @@ def test_split_warnings_errors(linter_name, input_msg, output_error, output_warn
     assert error == output_error
     assert warning == output_warning
     assert other == output_other
+
+
+def test_dev_images_coordinator():
+    """
+    Given
+        - 8 threads which request 2 dev images at the same time, the build of one of them fails.
+
+    When
+        - Creating the dev images with the dev images coordinator, and requesting them again.
+
+    Then
+        - Ensure every dev image is created once, and all the threads get the outcome of its creation.
+    """
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from demisto_sdk.commands.lint.helpers import DevImagesCoordinator
+
+    coordinator = DevImagesCoordinator()
+    created_images = []
+    lock = threading.Lock()
+
+    def create(image_name):
+        with lock:
+            created_images.append(image_name)
+        time.sleep(0.1)
+        return 'build failed' if image_name == 'devtest-broken' else ''
+
+    image_names = ['devtest-valid', 'devtest-broken'] * 4
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        errors = list(executor.map(lambda name: coordinator.create_image(name, lambda: create(name)), image_names))
+
+    assert errors == ['', 'build failed'] * 4
+    assert sorted(created_images) == ['devtest-broken', 'devtest-valid']
+    assert coordinator.create_image('devtest-broken', lambda: create('devtest-broken')) == 'build failed'
+    assert len(created_images) == 2
+
+
+def test_docker_containers_pool(mocker):
+    """
+    Given
+        - A containers pool, and a docker client.
+
+    When
+        - Leasing two workers of an image at the same time, returning them and leasing a worker again.
+        - Leasing a worker of another image.
+        - Clearing the pool.
+
+    Then
+        - Ensure a worker is started for every concurrent lease of an image, and an idle worker is reused.
+        - Ensure the workers run until they are removed, whatever the image entrypoint is, and are labelled with the
+          host and the process which started them.
+        - Ensure all the workers are removed when the pool is cleared.
+    """
+    from demisto_sdk.commands.lint.helpers import DockerContainersPool
+
+    pool = DockerContainersPool()
+    docker_client = mocker.MagicMock()
+    docker_client.containers.create.side_effect = lambda **kwargs: mocker.MagicMock()
+
+    first_worker = pool.acquire(docker_client, 'devtest-image')
+    second_worker = pool.acquire(docker_client, 'devtest-image')
+    pool.release('devtest-image', first_worker)
+    pool.release('devtest-image', second_worker)
+    assert pool.acquire(docker_client, 'devtest-image') is second_worker
+    other_image_worker = pool.acquire(docker_client, 'devtest-other-image')
+
+    assert first_worker is not second_worker and other_image_worker not in (first_worker, second_worker)
+    assert docker_client.containers.create.call_count == 3
+    docker_client.containers.create.assert_called_with(
+        image='devtest-other-image', entrypoint=['tail', '-f', '/dev/null'],
+        labels={'demisto-sdk-lint-worker': f'{socket.gethostname()}:{os.getpid()}'}, init=True, stop_signal='SIGKILL')
+    assert all(worker.start.call_count == 1 for worker in (first_worker, second_worker, other_image_worker))
+
+    pool.clear()
+    assert all(worker.remove.call_count == 1 for worker in (first_worker, second_worker, other_image_worker))
+    assert pool.acquire(docker_client, 'devtest-image') not in (first_worker, second_worker)
+
+
+def test_remove_stale_workers(mocker):
+    """
+    Given
+        - Lint workers of a running process and of a killed process on this host, and of a process on another host.
+
+    When
+        - Removing the stale lint workers.
+
+    Then
+        - Ensure only the worker of the killed process is removed.
+    """
+    from demisto_sdk.commands.lint import helpers
+
+    host = socket.gethostname()
+    workers = {label: mocker.MagicMock(labels={'demisto-sdk-lint-worker': label})
+               for label in (f'{host}:100', f'{host}:200', 'other-host:200')}
+    docker_client = mocker.MagicMock()
+    docker_client.containers.list.return_value = list(workers.values())
+    mocker.patch.object(helpers, 'is_process_running', side_effect=lambda pid: pid == 100)
+
+    helpers.DockerContainersPool.remove_stale_workers(docker_client)
+
+    docker_client.containers.list.assert_called_once_with(all=True, filters={'label': 'demisto-sdk-lint-worker'})
+    assert [label for label, worker in workers.items() if worker.remove.called] == [f'{host}:200']
+
+
+def test_exec_in_container(mocker):
+    """
+    Given
+        - A running container.
+
+    When
+        - Running a command in the container.
+
+    Then
+        - Ensure the command runs with the given user, environment and working dir.
+        - Ensure the command exit code and its whole output are returned.
+    """
+    from demisto_sdk.commands.lint.helpers import exec_in_container
+
+    container = mocker.MagicMock(id='container-id')
+    api_client = container.client.api
+    api_client.exec_create.return_value = {'Id': 'exec-id'}
+    api_client.exec_start.return_value = iter([b'first line\n', b'second line\n'])
+    api_client.exec_inspect.return_value = {'ExitCode': 2}
+
+    assert exec_in_container(container, command=['python', '-m', 'pytest'], user='1000:4000',
+                             environment={'CI': True}, workdir='/devwork/Sample') == \
+        (2, 'first line\nsecond line\n')
+    api_client.exec_create.assert_called_once_with('container-id', ['python', '-m', 'pytest'], user='1000:4000',
+                                                   environment={'CI': True}, workdir='/devwork/Sample')
+    api_client.exec_start.assert_called_once_with('exec-id', stream=True)
+
+
+def test_get_dir_hash(tmp_path):
+    """
+    Given
+        - A package dir with the cache dirs and compiled files of the lint tools.
+
+    When
+        - Hashing the package dir, before and after the lint tools update their caches, and after a file is changed.
+
+    Then
+        - Ensure the hash changes only when the package files change.
+    """
+    from demisto_sdk.commands.lint.helpers import get_dir_hash
+    (tmp_path / 'Sample.py').write_text('import os')
+    (tmp_path / 'test_data').mkdir()
+    (tmp_path / 'test_data' / 'data.json').write_text('{}')
+    dir_hash = get_dir_hash(tmp_path)
+
+    for cache_dir in ['__pycache__', '.mypy_cache', '.pytest_cache']:
+        (tmp_path / cache_dir).mkdir()
+        (tmp_path / cache_dir / 'Sample.cpython-38.pyc').write_bytes(b'compiled')
+    assert get_dir_hash(tmp_path) == dir_hash
+
+    (tmp_path / 'test_data' / 'data.json').write_text('{"changed": true}')
+    assert get_dir_hash(tmp_path) != dir_hash
+
+
+def test_lint_results_cache(monkeypatch):
+    """
+    Given
+        - A lint results cache capped at 3 results.
+
+    When
+        - Keeping results from concurrent threads, and getting a result before keeping more results.
+        - Saving the cache and loading it again.
+        - Disabling the cache.
+
+    Then
+        - Ensure the least recently used results are evicted, and the cache is kept in their order across runs.
+        - Ensure the key depends on all the key parts.
+        - Ensure nothing is kept when the cache is disabled.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from demisto_sdk.commands.lint.helpers import LintResultsCache
+    monkeypatch.setenv('DEMISTO_SDK_LINT_CACHE_SIZE', '3')
+    cache = LintResultsCache()
+    keys = [cache.get_key(check='flake8', pack_hash=str(index)) for index in range(5)]
+    assert len(set(keys)) == 5
+    assert cache.get_key(check='flake8', pack_hash='0') == keys[0]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(lambda key: cache.set(key, [0, '']), keys[:3]))
+    assert cache.get(keys[0]) == [0, '']
+    cache.set(keys[3], [0, ''])
+    cache.set(keys[4], [0, ''])
+    assert list(cache.results) == [keys[0], keys[3], keys[4]]
+
+    cache.save()
+    cache.clear()
+    assert list(cache.results) == [keys[0], keys[3], keys[4]]
+
+    monkeypatch.setenv('DEMISTO_SDK_LINT_CACHE_SIZE', '0')
+    cache.set(keys[1], [0, ''])
+    assert cache.get(keys[0]) is None and keys[1] not in cache.results
+
+
+def test_split_output_by_files():
+    """
+    Given
+        - The output of flake8 which ran on the files of two packages, with the source lines of the messages.
+        - An output line which doesn't follow a message of any of the files.
+
+    When
+        - Splitting the output to the packages.
+
+    Then
+        - Ensure every package gets the messages of its files with their source lines, in the output order.
+        - Ensure the output isn't split if a line can't be attributed to a file.
+    """
+    from demisto_sdk.commands.lint.helpers import split_output_by_files
+    owners = {'/Packs/A/First.py': 'A', '/Packs/A/First_test.py': 'A', '/Packs/B/Second.py': 'B',
+              '/Packs/C/Clean.py': 'C'}
+    output = '/Packs/A/First.py:1:1: F401 \'os\' imported but unused\n' \
+             'import os\n' \
+             '^\n' \
+             '/Packs/B/Second.py:3:80: E501 line too long (130 > 79 characters)\n' \
+             '/Packs/A/First_test.py:2:1: E302 expected 2 blank lines, found 0\n'
+
+    assert split_output_by_files(output, owners) == {
+        'A': '/Packs/A/First.py:1:1: F401 \'os\' imported but unused\nimport os\n^\n'
+             '/Packs/A/First_test.py:2:1: E302 expected 2 blank lines, found 0\n',
+        'B': '/Packs/B/Second.py:3:80: E501 line too long (130 > 79 characters)\n'
+    }
+    assert split_output_by_files('', owners) == {}
+    assert split_output_by_files(f'There are 3 errors\n{output}', owners) is None
@@ -344,3 +344,56 @@ def test_report_summary_no_warnings(capsys):
     assert "Packages PASS: \x1b[32m1\x1b[0m" in captured.out
     assert "Packages WARNING (can either PASS or FAIL): \x1b[33m0\x1b[0m" in captured.out
     assert "Packages FAIL: [31m0[0m" in captured.out
+
+
+def test_run_batched_flake8(mocker):
+    """
+    Given
+        - Two python 3 packages, one of them with unit test files, and a python 2 package.
+
+    When
+        - Running the batched flake8 on the packages.
+
+    Then
+        - Ensure flake8 runs once per python executable, on the files of all the packages which use it.
+        - Ensure every package gets its own flake8 result, as if flake8 ran on the package alone.
+        - Ensure a batch which flake8 fails to run on leaves its packages to run flake8 on their own.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from demisto_sdk.commands.lint import lint_manager
+
+    def create_linter(python_version, *lint_files):
+        linter = MagicMock(python_version=python_version)
+        linter.get_flake8_lint_files.return_value = list(lint_files)
+        return linter
+
+    first = create_linter(3.8, [PosixPath('/Packs/A/First.py')], [PosixPath('/Packs/A/First_test.py')])
+    second = create_linter(3.7, [PosixPath('/Packs/B/Second.py')])
+    python2 = create_linter(2.7, [PosixPath('/Packs/C/Python2.py')])
+
+    def run_command_os(command, cwd):
+        if command.startswith('python3'):
+            return ('/Packs/A/First_test.py:1:1: F401 \'os\' imported but unused\n'
+                    '/Packs/A/First_test.py:2:1: E302 expected 2 blank lines, found 0\n', '', 1)
+        return '', 'Traceback (most recent call last)', 1
+
+    mocker.patch.object(lint_manager, 'logger', create=True)
+    mocker.patch.object(lint_manager, 'run_command_os', side_effect=run_command_os)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        lint_manager.LintManager._run_batched_flake8(executor=executor, linters=[first, second, python2], modules={},
+                                                     content_repo=PosixPath('/content'))
+
+    # the packages join their batch in the order their facts are gathered
+    commands = dict(call[1]['command'].split(' -m flake8 ') for call in lint_manager.run_command_os.call_args_list)
+    assert {python_exec: sorted(files.split()) for python_exec, files in commands.items()} == {
+        'python': ['/Packs/C/Python2.py'],
+        'python3': ['/Packs/A/First.py', '/Packs/A/First_test.py', '/Packs/B/Second.py']}
+    assert all(linter.gather_facts.call_count == 1 for linter in (first, second, python2))
+    assert first.set_batched_result.call_args_list == [
+        (('flake8', [PosixPath('/Packs/A/First.py')], (0, '')),),
+        (('flake8', [PosixPath('/Packs/A/First_test.py')],
+          (1, '/Packs/A/First_test.py:1:1: F401 \'os\' imported but unused\n'
+              '/Packs/A/First_test.py:2:1: E302 expected 2 blank lines, found 0\n')),)]
+    second.set_batched_result.assert_called_once_with('flake8', [PosixPath('/Packs/B/Second.py')], (0, ''))
+    python2.set_batched_result.assert_not_called()
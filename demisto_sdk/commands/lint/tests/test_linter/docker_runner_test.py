@@ -29,6 +29,7 @@ class TestCreateImage:
             }
         })
         mocker.patch.object(linter, 'io')
+        mocker.patch.object(linter_obj, '_build_pack_image', True)
         # Docker client mocking
         mocker.patch.object(linter_obj, '_docker_client')
         docker_build_response = mocker.MagicMock()
@@ -41,6 +42,75 @@ class TestCreateImage:
         assert act_test_image_id == exp_test_image_id
         assert act_errors == exp_errors
 
+    def test_build_shared_image_once(self, linter_obj: Linter, mocker):
+        """
+        Given
+            - Two packages which use the same base docker image and requirements.
+
+        When
+            - Creating the test images of both packages.
+
+        Then
+            - Ensure the shared dev image is pulled and built once, and only the package images are built twice.
+        """
+        mocker.patch.dict(linter_obj._facts, {"additional_requirements": []})
+        mocker.patch.object(linter, 'io')
+        mocker.patch.object(linter_obj, '_build_pack_image', True)
+        mocker.patch.object(linter_obj, '_docker_client')
+        linter_obj._docker_client.images.pull.return_value = None
+        linter_obj._docker_client.images.build.return_value = [mocker.MagicMock(short_id='test-image')]
+        mocker.patch.object(linter, 'open')
+        mocker.patch.object(linter.Path, 'exists', return_value=False)
+
+        for _ in range(2):
+            assert linter_obj._docker_image_create(docker_base_image=['demisto/python3:3.8.6.1', 3.8]) == \
+                ('test-image', '')
+
+        assert linter_obj._docker_client.images.pull.call_count == 1
+        dev_image_builds = [build for build in linter_obj._docker_client.images.build.call_args_list
+                            if 'fileobj' in build[1]]
+        assert len(dev_image_builds) == 1
+        assert linter_obj._docker_client.images.build.call_count == 3
+
+    def test_copy_pack_into_containers(self, linter_obj: Linter, mocker):
+        """
+        Given
+            - A package which isn't built into its own image.
+
+        When
+            - Creating the test image of the package, and running pylint and pytest on it.
+
+        Then
+            - Ensure only the shared dev image and the image which updates its CA certificates are built, and the
+              certificates image is used by the lint containers.
+            - Ensure the package is archived once and copied into every lint container before it starts.
+        """
+        mocker.patch.dict(linter_obj._facts, {"additional_requirements": [], "lint_files": []})
+        mocker.patch.object(linter, 'io')
+        mocker.patch.object(linter, 'json')
+        mocker.patch.object(linter, 'get_file_from_container')
+        mocker.patch.object(linter, 'create_pack_archive', return_value=b'pack')
+        mocker.patch.object(linter_obj, '_docker_client')
+        linter_obj._docker_client.images.pull.return_value = None
+        container = linter_obj._docker_client.containers.create.return_value
+        container.wait.return_value = {"StatusCode": 0}
+
+        test_image, errors = linter_obj._docker_image_create(docker_base_image=['demisto/python3:3.8.6.1', 3.8])
+        linter_obj._docker_run_pylint(test_image=test_image, keep_container=False)
+        linter_obj._docker_run_pytest(test_image=test_image, keep_container=False, test_xml="")
+
+        assert not errors
+        assert test_image.startswith('devtestdemisto/python3:3.8.6.1-') and test_image.endswith('-certs')
+        assert linter_obj._docker_client.images.build.call_count == 2
+        assert linter_obj._docker_client.images.build.call_args[1]['tag'] == test_image
+        assert 'RUN update-ca-certificates' in linter.io.BytesIO().__enter__().write.call_args[0][0].decode('utf-8')
+        assert all(create[1]['image'] == test_image
+                   for create in linter_obj._docker_client.containers.create.call_args_list)
+        linter.create_pack_archive.assert_called_once()
+        assert container.put_archive.call_count == 2
+        container.put_archive.assert_called_with(path='/devwork', data=b'pack')
+        assert container.start.call_count == 2
+
 
 class TestPylint:
     def test_run_pylint_no_errors(self, mocker, linter_obj: Linter):
@@ -50,8 +120,9 @@ class TestPylint:
 
         # Docker client mocking
         mocker.patch.object(linter_obj, '_docker_client')
-        linter_obj._docker_client.containers.run().wait.return_value = {"StatusCode": exp_container_exit_code}
-        linter_obj._docker_client.containers.run().logs.return_value = exp_container_log.encode('utf-8')
+        mocker.patch.object(linter, 'create_pack_archive')
+        linter_obj._docker_client.containers.create().wait.return_value = {"StatusCode": exp_container_exit_code}
+        linter_obj._docker_client.containers.create().logs.return_value = exp_container_log.encode('utf-8')
         act_container_exit_code, act_container_log = linter_obj._docker_run_pylint(test_image='test-image',
                                                                                    keep_container=False)
 
@@ -69,8 +140,9 @@ class TestPylint:
                                     exp_exit_code: int, exp_output: str):
         # Docker client mocking
         mocker.patch.object(linter_obj, '_docker_client')
-        linter_obj._docker_client.containers.run().wait.return_value = {"StatusCode": exp_container_exit_code}
-        linter_obj._docker_client.containers.run().logs.return_value = exp_container_log.encode('utf-8')
+        mocker.patch.object(linter, 'create_pack_archive')
+        linter_obj._docker_client.containers.create().wait.return_value = {"StatusCode": exp_container_exit_code}
+        linter_obj._docker_client.containers.create().logs.return_value = exp_container_log.encode('utf-8')
         act_exit_code, act_output = linter_obj._docker_run_pylint(test_image='test-image',
                                                                   keep_container=False)
 
@@ -89,7 +161,8 @@ class TestPytest:
 
         # Docker client mocking
         mocker.patch.object(linter_obj, '_docker_client')
-        linter_obj._docker_client.containers.run().wait.return_value = {"StatusCode": exp_container_exit_code}
+        mocker.patch.object(linter, 'create_pack_archive')
+        linter_obj._docker_client.containers.create().wait.return_value = {"StatusCode": exp_container_exit_code}
 
         # Docker related mocking
         mocker.patch.object(linter, 'json')
@@ -104,6 +177,65 @@ class TestPytest:
         assert exp_test_json == act_test_json
 
 
+class TestLintWorker:
+    def test_run_checks_in_worker(self, mocker, monkeypatch, linter_obj: Linter):
+        """
+        Given
+            - Two packages which use the same test image.
+
+        When
+            - Running pylint and pytest of the packages one after the other.
+
+        Then
+            - Ensure a single worker container is started, and both packages are copied into their own dir in it.
+            - Ensure the checks run in the worker with the image entrypoint, and the package dir is removed after them.
+            - Ensure the pytest reports are read from the package dir, and the worker is removed only with the pool.
+        """
+        # Both packages run their checks, and don't replay the results of the first one
+        monkeypatch.setenv('DEMISTO_SDK_LINT_CACHE_SIZE', '0')
+        mocker.patch.object(linter, 'json')
+        mocker.patch.object(linter, 'get_file_from_container')
+        mocker.patch.object(linter, 'create_pack_archive', side_effect=lambda pack_dir, arcname: arcname.encode())
+        client = linter.docker.from_env()
+        worker = client.containers.create.return_value
+        worker.image.attrs = {'Config': {'Entrypoint': ['/bin/sh', '-c']}}
+        worker.client.api.exec_create.return_value = {'Id': 'exec-id'}
+        worker.client.api.exec_start.side_effect = lambda exec_id, stream: iter([b'output'])
+        worker.client.api.exec_inspect.return_value = {'ExitCode': 0}
+
+        for pack_name in ['First', 'Second']:
+            pack_linter = Linter(pack_dir=linter_obj._pack_abs_dir, content_repo=linter_obj._content_repo,
+                                 req_3=[], req_2=[], docker_engine=True)
+            mocker.patch.object(pack_linter, '_pack_name', pack_name)
+            mocker.patch.object(pack_linter, '_docker_image_create', return_value=("test-image", ""))
+            mocker.patch.dict(pack_linter._facts, {"images": [["image", 3.7]], "test": True,
+                                                   "lint_files": [linter.Path('Sample.py')], "env_vars": {}})
+            mocker.patch.dict(pack_linter._pkg_lint_status, {"pack_type": TYPE_PYTHON})
+            pack_linter._run_lint_on_docker_image(no_pylint=False, no_test=False, no_pwsh_analyze=True,
+                                                  no_pwsh_test=True, keep_container=False, test_xml="")
+            assert pack_linter._pkg_lint_status["exit_code"] == 0
+
+        client.containers.create.assert_called_once()
+        assert client.containers.create.call_args[1]['image'] == 'test-image'
+        assert [put[1] for put in worker.put_archive.call_args_list] == [{'path': '/devwork', 'data': b'First'},
+                                                                         {'path': '/devwork', 'data': b'Second'}]
+        execs = [(create[0][1], create[1]['workdir']) for create in worker.client.api.exec_create.call_args_list]
+        assert len(execs) == 6
+        assert execs[0] == (['/bin/sh', '-c', linter.build_pylint_command([linter.Path('Sample.py')])],
+                            '/devwork/First')
+        assert execs[1] == (['/bin/sh', '-c', 'python -m pytest --json=/devwork/First/report_pytest.json'],
+                            '/devwork/First')
+        assert execs[2] == (['rm', '-rf', '/devwork/First'], None)
+        assert execs[5] == (['rm', '-rf', '/devwork/Second'], None)
+        linter.get_file_from_container.assert_called_with(container_obj=worker,
+                                                          container_path='/devwork/Second/report_pytest.json',
+                                                          encoding='utf-8')
+        worker.remove.assert_not_called()
+
+        linter.DOCKER_CONTAINERS_POOL.clear()
+        worker.remove.assert_called_once_with(force=True)
+
+
 class TestRunLintInContainer:
     """Pylint/Pytest"""
 
@@ -126,6 +258,7 @@ class TestRunLintInContainer:
         })
         mocker.patch.object(linter_obj, '_docker_image_create')
         linter_obj._docker_image_create.return_value = ("test-image", "")
+        mocker.patch.object(linter_obj, '_docker_lint_worker')
         mocker.patch.object(linter_obj, '_docker_run_pytest')
         linter_obj._docker_run_pytest.return_value = (0b0, '', {})
         mocker.patch.object(linter_obj, '_docker_run_pylint')
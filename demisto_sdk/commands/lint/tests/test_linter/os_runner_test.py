@@ -41,6 +41,29 @@ class TestFlake8:
         assert exit_code == 0b1, "Exit code should be 1"
         assert output == expected_output, "Output should be empty"
 
+    def test_run_flake8_batched(self, linter_obj: Linter, lint_files: List[Path], mocker):
+        """
+        Given
+            - The flake8 result of the package lint files from a batched run on many packages.
+
+        When
+            - Running flake8 on the package lint files, and on other files of the package.
+
+        Then
+            - Ensure the batched result is returned without running flake8 on the lint files again.
+            - Ensure flake8 runs on the other files.
+        """
+        from demisto_sdk.commands.lint import linter
+
+        mocker.patch.object(linter, 'run_command_os', return_value=('', '', 0))
+        expected_output = f'{lint_files[0]}:1:1: F401 \'os\' imported but unused\n'
+        linter_obj.set_batched_result('flake8', lint_files, (0b1, expected_output))
+
+        assert linter_obj._run_flake8(lint_files=list(lint_files), py_num=3.7) == (0b1, expected_output)
+        linter.run_command_os.assert_not_called()
+        assert linter_obj._run_flake8(lint_files=[Path('Sample_test.py')], py_num=3.7) == (0b0, '')
+        linter.run_command_os.assert_called_once()
+
 
 class TestBandit:
     def test_run_bandit_success(self, linter_obj: Linter, lint_files: List[Path], mocker):
@@ -429,3 +452,83 @@ class TestRunLintInHost:
         linter_obj._run_vulture.assert_called_once()
         assert linter_obj._pkg_lint_status.get("exit_code") == EXIT_CODES['flake8'] + EXIT_CODES['bandit'] + \
             EXIT_CODES['mypy'] + EXIT_CODES['vulture'] + EXIT_CODES['XSOAR_linter']
+
+
+class TestLintResultsCache:
+    def test_replay_passed_checks(self, mocker, linter_obj, tmp_path):
+        """
+        Given
+            - A package which flake8 passes on and bandit fails on.
+
+        When
+            - Running the lint checks on host again, in the same run and in the next run.
+            - Changing the package and running the lint checks on host again.
+
+        Then
+            - Ensure flake8 is replayed while the package is unchanged, and runs again once it changed.
+            - Ensure the failing bandit check always runs.
+        """
+        from demisto_sdk.commands.lint.helpers import LINT_RESULTS_CACHE
+        lint_file = tmp_path / 'Sample.py'
+        lint_file.write_text('import os')
+        mocker.patch.object(linter_obj, '_pack_abs_dir', tmp_path)
+        mocker.patch.dict(linter_obj._facts, {"lint_files": [lint_file], "python_version": 3.8})
+        mocker.patch.object(linter_obj, '_run_flake8', return_value=(0b0, ''))
+        mocker.patch.object(linter_obj, '_run_bandit', return_value=(0b1, 'Issue: [B108:hardcoded_tmp_directory]'))
+
+        def run_lint_in_host(pack_linter):
+            pack_linter._run_lint_in_host(no_flake8=False, no_xsoar_linter=True, no_bandit=False, no_mypy=True,
+                                          no_vulture=True)
+            return linter_obj._run_flake8.call_count, linter_obj._run_bandit.call_count
+
+        assert run_lint_in_host(linter_obj) == (1, 1)
+        assert run_lint_in_host(linter_obj) == (1, 2)
+        assert linter_obj._pkg_lint_status["exit_code"] == 0b10
+
+        # The next run of the same package
+        LINT_RESULTS_CACHE.save()
+        LINT_RESULTS_CACHE.clear()
+        next_run_linter = Linter(pack_dir=tmp_path, content_repo=linter_obj._content_repo, req_3=["pytest==3.0"],
+                                 req_2=["pytest==2.0"], docker_engine=False)
+        mocker.patch.dict(next_run_linter._facts, {"lint_files": [lint_file], "python_version": 3.8})
+        mocker.patch.multiple(next_run_linter, _run_flake8=linter_obj._run_flake8,
+                              _run_bandit=linter_obj._run_bandit)
+        assert run_lint_in_host(next_run_linter) == (1, 3)
+
+        lint_file.write_text('import sys')
+        changed_linter = Linter(pack_dir=tmp_path, content_repo=linter_obj._content_repo, req_3=["pytest==3.0"],
+                                req_2=["pytest==2.0"], docker_engine=False)
+        mocker.patch.dict(changed_linter._facts, {"lint_files": [lint_file], "python_version": 3.8})
+        mocker.patch.multiple(changed_linter, _run_flake8=linter_obj._run_flake8,
+                              _run_bandit=linter_obj._run_bandit)
+        assert run_lint_in_host(changed_linter) == (2, 4)
+
+    def test_batched_flake8_skips_cached_files(self, mocker, linter_obj, tmp_path):
+        """
+        Given
+            - A python package with lint files and unit test files.
+
+        When
+            - Getting the package files for the batched flake8, before and after flake8 passed on the package.
+
+        Then
+            - Ensure the lint files and the unit test files are batched before flake8 passed on them, and are left out
+              of the batch after it, as their result is replayed from the cache.
+        """
+        from demisto_sdk.commands.common.constants import TYPE_PYTHON
+        lint_file = tmp_path / 'Sample.py'
+        lint_file.write_text('import os')
+        test_file = tmp_path / 'Sample_test.py'
+        test_file.write_text('import pytest')
+        mocker.patch.object(linter_obj, '_pack_abs_dir', tmp_path)
+        mocker.patch.object(linter_obj, '_skip', False)
+        mocker.patch.dict(linter_obj._pkg_lint_status, {"pack_type": TYPE_PYTHON})
+        mocker.patch.dict(linter_obj._facts, {"lint_files": [lint_file], "lint_unittest_files": [test_file],
+                                              "python_version": 3.8})
+        mocker.patch.object(linter_obj, '_run_flake8', return_value=(0b0, ''))
+
+        assert linter_obj.get_flake8_lint_files(modules={}) == [[lint_file], [test_file]]
+        linter_obj._run_lint_in_host(no_flake8=False, no_xsoar_linter=True, no_bandit=True, no_mypy=True,
+                                     no_vulture=True)
+        assert linter_obj._run_flake8.call_count == 2
+        assert linter_obj.get_flake8_lint_files(modules={}) == []
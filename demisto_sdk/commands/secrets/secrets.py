@@ -14,11 +14,11 @@ from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.constants import (
     EXTERNAL_PR_REGEX, PACKS_DIR, PACKS_INTEGRATION_README_REGEX,
     PACKS_WHITELIST_FILE_NAME, FileType, re)
-from demisto_sdk.commands.common.tools import (LOG_COLORS, find_type,
-                                               get_pack_name,
+from demisto_sdk.commands.common.tools import (GIT_CHANGE_SET, LOG_COLORS,
+                                               find_type, get_pack_name,
                                                is_file_path_in_pack,
                                                print_color, print_error,
-                                               print_warning, run_command)
+                                               print_warning)
 
 ENTROPY_THRESHOLD = 4.0
 ACCEPTED_FILE_STATUSES = ['m', 'a']
@@ -84,7 +84,7 @@ class SecretsValidator(object):
         else:
             secrets_file_paths = self.get_all_diff_text_files(branch_name, is_circle)
         # If a input path supplied, should not run on git. If not supplied make sure not in middle of merge.
-        if not run_command('git rev-parse -q --verify MERGE_HEAD') or self.input_paths:
+        if not GIT_CHANGE_SET.is_merging or self.input_paths:
             secret_to_location_mapping = self.search_potential_secrets(secrets_file_paths, self.ignore_entropy)
             if secret_to_location_mapping:
                 secrets_found_string = 'Secrets were found in the following files:'
@@ -129,10 +129,10 @@ class SecretsValidator(object):
                 self.prev_ver = 'origin/' + self.prev_ver
             print(f"Running secrets validation against {self.prev_ver}")
 
-            changed_files_string = run_command(f"git diff --name-status {self.prev_ver}...{branch_name}")
+            changed_files_string = GIT_CHANGE_SET.name_status(f"{self.prev_ver}...{branch_name}")
         else:
             print("Running secrets validation on all changes")
-            changed_files_string = run_command("git diff --name-status --no-merges HEAD")
+            changed_files_string = GIT_CHANGE_SET.name_status("HEAD")
         return list(self.get_diff_text_files(changed_files_string))
 
     def get_diff_text_files(self, files_string):
@@ -477,10 +477,7 @@ class SecretsValidator(object):
 
     @staticmethod
     def get_branch_name():
-        branches = run_command('git branch')
-        branch_name_reg = re.search(r'\* (.*)', branches)
-        branch_name = branch_name_reg.group(1)
-        return branch_name
+        return GIT_CHANGE_SET.branch_name
 
     def find_secrets(self):
         print_color('Starting secrets detection', LOG_COLORS.GREEN)
@@ -302,7 +302,7 @@ my_email = "fooo@someorg.com"
         assert secrets_output == ''
 
     def test_get_all_diff_text_files(self, mocker):
-        mocker.patch('demisto_sdk.commands.secrets.secrets.run_command',
+        mocker.patch('demisto_sdk.commands.common.tools.run_command',
                      return_value='m\tPacks/Integrations/integration/testing.py\n')
         validator = SecretsValidator(is_circle=True, white_list_path=os.path.join(TestSecrets.TEMP_DIR,
                                                                                   TestSecrets.WHITE_LIST_FILE_NAME))
@@ -828,7 +828,7 @@ class TestRNUpdateUnit:
                         +  name: isFetch\
                         +- display: Incident type'
 
-        mocker.patch('demisto_sdk.commands.update_release_notes.update_rn.run_command', return_value=return_value)
+        mocker.patch('demisto_sdk.commands.common.tools.run_command', return_value=return_value)
 
         is_docker_image_changed, docker_image_name = check_docker_image_changed('test.yml')
         assert is_docker_image_changed is False
@@ -848,7 +848,7 @@ class TestRNUpdateUnit:
         import os
         with open('demisto_sdk/commands/update_release_notes/tests_data/Packs/Test/pack_metadata.json', 'r') as file:
             pack_data = json.load(file)
-        mocker.patch('demisto_sdk.commands.update_release_notes.update_rn.run_command',
+        mocker.patch('demisto_sdk.commands.common.tools.run_command',
                      return_value='+  dockerimage:python/test:1243')
         mocker.patch('demisto_sdk.commands.update_release_notes.update_rn.pack_name_to_path',
                      return_value='demisto_sdk/commands/update_release_notes/tests_data/Packs/Test')
@@ -882,7 +882,7 @@ class TestRNUpdateUnit:
         from demisto_sdk.commands.update_release_notes.update_rn import UpdateRN
         with open('demisto_sdk/commands/update_release_notes/tests_data/Packs/Test/pack_metadata.json', 'r') as file:
             pack_data = json.load(file)
-        mocker.patch('demisto_sdk.commands.update_release_notes.update_rn.run_command',
+        mocker.patch('demisto_sdk.commands.common.tools.run_command',
                      return_value='+  dockerimage:python/test:1243')
         mocker.patch.object(UpdateRN, 'is_bump_required', return_value=False)
         mocker.patch.object(UpdateRN, 'get_pack_metadata', return_value=pack_data)
@@ -916,7 +916,7 @@ class TestRNUpdateUnit:
         import os
         with open('demisto_sdk/commands/update_release_notes/tests_data/Packs/Test/pack_metadata.json', 'r') as file:
             pack_data = json.load(file)
-        mocker.patch('demisto_sdk.commands.update_release_notes.update_rn.run_command',
+        mocker.patch('demisto_sdk.commands.common.tools.run_command',
                      return_value='+  type:True')
         mocker.patch('demisto_sdk.commands.update_release_notes.update_rn.pack_name_to_path',
                      return_value='demisto_sdk/commands/update_release_notes/tests_data/Packs/Test')
@@ -15,7 +15,9 @@ from demisto_sdk.commands.common.constants import (
     PACKS_PACK_META_FILE_NAME)
 from demisto_sdk.commands.common.hook_validations.structure import \
     StructureValidator
-from demisto_sdk.commands.common.tools import (LOG_COLORS, get_api_module_ids,
+from demisto_sdk.commands.common.id_set_db import load_id_set
+from demisto_sdk.commands.common.tools import (GIT_CHANGE_SET, LOG_COLORS,
+                                               get_api_module_ids,
                                                get_api_module_integrations_set,
                                                get_json,
                                                get_latest_release_notes_text,
@@ -310,6 +312,7 @@ class UpdateRN:
                 json.dump(metadata_dict, file_path, indent=4)
                 print_color(f"Updated pack metadata version at path : {self.metadata_path}",
                             LOG_COLORS.GREEN)
+            GIT_CHANGE_SET.invalidate_working_tree()
 
     @staticmethod
     def check_rn_dir(rn_path):
@@ -488,12 +491,14 @@ class UpdateRN:
             self.existing_rn_changed = True
             with open(release_notes_path, 'w') as fp:
                 fp.write(rn_string)
+        GIT_CHANGE_SET.invalidate_working_tree()
 
     def update_markdown(self, release_notes_path: str, rn_string: str):
         if os.path.exists(release_notes_path):
             self.existing_rn_changed = True
             with open(release_notes_path, 'a') as fp:
                 fp.write(rn_string)
+            GIT_CHANGE_SET.invalidate_working_tree()
         else:
             print_warning(f"Changes were detected, but could not find release notes file to update."
                           f"\ngiven path: {release_notes_path}")
@@ -527,8 +532,7 @@ def update_api_modules_dependents_rn(_pack, pre_release, update_type, added, mod
                         "available. Please run `demisto-sdk create-id-set` to generate it, and rerun this command.")
             return
         id_set_path = './Tests/id_set.json'
-    with open(id_set_path, 'r') as conf_file:
-        id_set = json.load(conf_file)
+    id_set = load_id_set(id_set_path)
     api_module_set = get_api_module_ids(added)
     api_module_set = api_module_set.union(get_api_module_ids(modified))
     integrations = get_api_module_integrations_set(api_module_set, id_set.get('integrations', []))
@@ -543,7 +547,7 @@ def update_api_modules_dependents_rn(_pack, pre_release, update_type, added, mod
 
 def check_docker_image_changed(added_or_modified_yml):
     try:
-        diff = run_command(f'git diff origin/master -- {added_or_modified_yml}', exit_on_error=False)
+        diff = GIT_CHANGE_SET.diff('origin/master', added_or_modified_yml, exit_on_error=False)
     except RuntimeError as e:
         if any(['is outside repository' in exp for exp in e.args]):
             return False, ''
@@ -27,6 +27,7 @@ from demisto_sdk.commands.common.hook_validations.old_release_notes import \
     OldReleaseNotesValidator
 from demisto_sdk.commands.common.hook_validations.playbook import \
     PlaybookValidator
+from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
 from demisto_sdk.commands.common.hook_validations.release_notes import \
     ReleaseNotesValidator
 from demisto_sdk.commands.common.hook_validations.reputation import \
@@ -1085,19 +1086,20 @@ class TestValidators:
         When
             - Run the validate command.
         Then
-            - Validate checks for the staged files using git diff.
+            - Validate checks for the staged files using git status.
             - get_modified_and_added_files returns a list of only staged files.
         """
         def run_command_effect(arg):
             # if the call is to check the staged files only - return the HelloWorld integration.
-            if arg == 'git diff --name-only --staged':
-                return 'Packs/HelloWorld/Integrations/HelloWorld.yml'
+            if arg.startswith('git status'):
+                return '# branch.head master\x001 M. N... 100644 100644 100644 0 0 ' \
+                       'Packs/HelloWorld/Integrations/HelloWorld.yml\x00'
 
             # else return all the files that were changed from master and their status in comparison to the master.
             else:
                 return 'M\tPacks/HelloWorld/Integrations/HelloWorld.yml\nM\tPacks/BigFix/Integrations/BigFix/BigFix.yml'
 
-        mocker.patch('demisto_sdk.commands.validate.validate_manager.run_command', side_effect=run_command_effect)
+        mocker.patch('demisto_sdk.commands.common.tools.run_command', side_effect=run_command_effect)
         mocker.patch('demisto_sdk.commands.validate.validate_manager.os.path.isfile', return_value=True)
         mocker.patch('demisto_sdk.commands.validate.validate_manager.find_type', return_value=FileType.INTEGRATION)
         mocker.patch.object(ValidateManager, '_is_py_script_or_integration', return_value=False)
@@ -1115,13 +1117,13 @@ class TestValidators:
         When
             - Run the validate command.
         Then
-            - Validate that not a git diff staged command runs
+            - Validate that the staged files are not read from git status
         """
         def run_command_effect(arg):
-            assert 'staged' not in arg
+            assert not arg.startswith('git status')
             return "M\tPacks/HelloWorld/Integrations/HelloWorld.yml"
 
-        mocker.patch('demisto_sdk.commands.validate.validate_manager.run_command', side_effect=run_command_effect)
+        mocker.patch('demisto_sdk.commands.common.tools.run_command', side_effect=run_command_effect)
         mocker.patch('demisto_sdk.commands.validate.validate_manager.os.path.isfile', return_value=True)
         mocker.patch('demisto_sdk.commands.validate.validate_manager.find_type', return_value=FileType.INTEGRATION)
         mocker.patch.object(ValidateManager, '_is_py_script_or_integration', return_value=False)
@@ -1208,6 +1210,98 @@ def test_run_validation_using_git_on_only_metadata_changed(mocker):
     assert res
 
 
+def test_run_validations_on_packs__workers(mocker, capsys):
+    """
+    Given
+        - packs with output, errors, ignored errors and ignored files, some of them shared between the packs.
+    When
+        - validating the packs one by one and with several workers.
+    Then
+        - validate the packs results and the final report are the same in both modes.
+        - validate the output of the workers is printed in the packs order.
+    """
+    from demisto_sdk.commands.common.errors import (
+        FOUND_FILES_AND_ERRORS, FOUND_FILES_AND_IGNORED_ERRORS)
+
+    def validate_pack(self, pack_path):
+        print(f'validating {pack_path}')
+        base_validator = BaseValidator(ignored_errors={'README.md': ['BA101']}, print_as_warnings=True)
+        base_validator.handle_error('error', 'IN100', os.path.join(pack_path, 'integration.yml'), should_print=False)
+        base_validator.handle_error('error', 'CJ100', 'Tests/conf.json', should_print=False)
+        base_validator.handle_error('error', 'BA101', os.path.join(pack_path, 'README.md'), should_print=False)
+        self.ignored_files.add(os.path.join(pack_path, 'CHANGELOG.md'))
+        return not pack_path.endswith('2')
+
+    mocker.patch.object(ValidateManager, 'run_validations_on_pack', validate_pack)
+    mocker.patch.object(BaseValidator, 'check_file_flags')
+    pack_paths = [f'Packs/Pack{i}' for i in range(1, 6)]
+    reports = []
+    for workers in (1, 3):
+        del FOUND_FILES_AND_ERRORS[:]
+        del FOUND_FILES_AND_IGNORED_ERRORS[:]
+        validate_manager = ValidateManager(workers=workers)
+        results = validate_manager.run_validations_on_packs(pack_paths)
+        reports.append((results, list(FOUND_FILES_AND_ERRORS), list(FOUND_FILES_AND_IGNORED_ERRORS),
+                        validate_manager.ignored_files))
+        output = capsys.readouterr().out
+        assert [line for line in output.splitlines() if line.startswith('validating')] == \
+            [f'validating {pack_path}' for pack_path in pack_paths]
+
+    assert reports[0] == reports[1]
+    assert reports[1][0] == [True, False, True, True, True]
+    assert reports[1][1][:3] == ['Packs/Pack1/integration.yml - [IN100]', 'Tests/conf.json - [CJ100]',
+                                 'Packs/Pack2/integration.yml - [IN100]']
+    assert len(reports[1][2]) == 5
+    del FOUND_FILES_AND_ERRORS[:]
+    del FOUND_FILES_AND_IGNORED_ERRORS[:]
+
+
+def test_run_validation_on_specific_files__workers(mocker, capsys, tmp_path):
+    """
+    Given
+        - packs and files given with -i, the files listed between the packs.
+    When
+        - validating them one by one and with several workers.
+    Then
+        - validate the output and the errors of the packs and the files are in the given order in both modes.
+    """
+    from demisto_sdk.commands.common.errors import FOUND_FILES_AND_ERRORS
+
+    def validate_pack(self, pack_path):
+        print(f'validating {pack_path}')
+        BaseValidator().handle_error('error', 'IN100', os.path.join(pack_path, 'integration.yml'), should_print=False)
+        return True
+
+    def validate_file(self, file_path, pack_error_ignore_list=None, is_modified=False):
+        print(f'validating {file_path}')
+        BaseValidator().handle_error('error', 'IN100', file_path, should_print=False)
+        return True
+
+    paths = []
+    for name in ('Pack1', 'Pack2', 'Pack3'):
+        pack_path = tmp_path / 'Packs' / name
+        pack_path.mkdir(parents=True)
+        file_path = tmp_path / f'{name}.yml'
+        file_path.write_text('')
+        paths += [str(pack_path), str(file_path)]
+
+    mocker.patch.object(ValidateManager, 'run_validations_on_pack', validate_pack)
+    mocker.patch.object(ValidateManager, 'run_validations_on_file', validate_file)
+    mocker.patch.object(ValidateManager, 'prefetch_docker_images_tags')
+    mocker.patch.object(ValidateManager, 'prefetch_readmes_mdx_results')
+    mocker.patch.object(BaseValidator, 'check_file_flags')
+    for workers in (1, 3):
+        del FOUND_FILES_AND_ERRORS[:]
+        validate_manager = ValidateManager(file_path=','.join(paths), workers=workers)
+        assert validate_manager.run_validation_on_specific_files()
+        output = capsys.readouterr().out
+        assert [line for line in output.splitlines() if line.startswith('validating')] == \
+            [f'validating {path}' for path in paths]
+        assert [error.split(' - ')[0] for error in FOUND_FILES_AND_ERRORS] == \
+            [path if path.endswith('.yml') else os.path.join(path, 'integration.yml') for path in paths]
+    del FOUND_FILES_AND_ERRORS[:]
+
+
 def test_is_mapping_fields_command_exist(integration):
     """
         Given
@@ -1252,3 +1346,64 @@ def test_mapping_fields_command_dont_exist(integration):
     validator = IntegrationValidator(structure_validator)
 
     assert not validator.is_mapping_fields_command_exist()
+
+
+def test_prefetch_docker_images_tags(mocker, tmp_path):
+    """
+    Given
+        - Integrations and scripts which share docker images, a renamed integration and a playbook.
+    When
+        - Prefetching the docker images tags of the changed files.
+    Then
+        - validate every distinct docker image of the integrations and scripts is prefetched once.
+        - validate no docker image is prefetched when the docker checks are skipped.
+    """
+    files = {
+        'integration1.yml': {'category': 'Utilities', 'script': {'dockerimage': 'demisto/python3:3.8.6.1'}},
+        'integration2.yml': {'category': 'Utilities', 'script': {'dockerimage': 'demisto/python3:3.8.6.2'}},
+        'integration3.yml': {'category': 'Utilities', 'script': {'subtype': 'python2'}},
+        'script.yml': {'script': '', 'dockerimage': 'demisto/pyjwt:1.0'},
+        'playbook.yml': {'tasks': {}},
+    }
+    for file_name, file_data in files.items():
+        (tmp_path / file_name).write_text(json.dumps(file_data))
+    file_paths = {str(tmp_path / 'integration1.yml'), (str(tmp_path / 'old.yml'), str(tmp_path / 'integration2.yml')),
+                  str(tmp_path / 'integration3.yml'), str(tmp_path / 'script.yml'), str(tmp_path / 'playbook.yml')}
+    prefetch = mocker.patch('demisto_sdk.commands.validate.validate_manager.DOCKER_TAGS_CACHE.prefetch')
+
+    ValidateManager().prefetch_docker_images_tags(file_paths)
+    prefetch.assert_called_once_with({'demisto/python3', 'demisto/python', 'demisto/pyjwt'})
+
+    prefetch.reset_mock()
+    ValidateManager(no_docker_checks=True).prefetch_docker_images_tags(file_paths)
+    assert not prefetch.called
+
+
+def test_prefetch_readmes_mdx_results(mocker, tmp_path):
+    """
+    Given
+        - A pack with a README, an integration README, a release notes file and an integration yml.
+    When
+        - Validating the pack.
+    Then
+        - validate the mdx of both READMEs is parsed in a single batch before the pack is validated.
+        - validate the batch results are passed to the READMEs validation.
+        - validate the docker images tags of the pack files are looked up before the pack is validated.
+    """
+    pack = tmp_path / 'Packs' / 'TestPack'
+    for file_path in ('README.md', 'Integrations/Integration/README.md', 'ReleaseNotes/1_0_1.md',
+                      'Integrations/Integration/Integration.yml'):
+        (pack / file_path).parent.mkdir(parents=True, exist_ok=True)
+        (pack / file_path).write_text('# text')
+    readmes = [str(pack / 'README.md'), str(pack / 'Integrations/Integration/README.md')]
+    mdx_results = {readmes[0]: '', readmes[1]: 'MDX parse failure'}
+    verify_mdx_files = mocker.patch.object(ReadMeValidator, 'verify_mdx_files', return_value=mdx_results)
+    mocker.patch.object(ValidateManager, 'run_validations_on_pack', return_value=True)
+    prefetch_docker_images_tags = mocker.patch.object(ValidateManager, 'prefetch_docker_images_tags')
+
+    validate_manager = ValidateManager()
+    assert validate_manager.run_validations_on_packs([str(pack)]) == [True]
+
+    assert sorted(verify_mdx_files.call_args[0][0]) == sorted(readmes)
+    assert validate_manager.readmes_mdx_results == mdx_results
+    assert str(pack / 'Integrations/Integration/Integration.yml') in prefetch_docker_images_tags.call_args[0][0]
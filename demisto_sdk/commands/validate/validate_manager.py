@@ -1,7 +1,10 @@
+import io
 import os
 import re
 from configparser import ConfigParser, MissingSectionHeaderError
-from typing import Optional
+from contextlib import redirect_stderr, redirect_stdout
+from multiprocessing import Pool
+from typing import Dict, Iterable, List, Optional
 
 import click
 from demisto_sdk.commands.common import tools
@@ -25,6 +28,8 @@ from demisto_sdk.commands.common.hook_validations.conf_json import \
     ConfJsonValidator
 from demisto_sdk.commands.common.hook_validations.dashboard import \
     DashboardValidator
+from demisto_sdk.commands.common.hook_validations.docker import (
+    DOCKER_TAGS_CACHE, get_yml_docker_image_name)
 from demisto_sdk.commands.common.hook_validations.id import IDSetValidator
 from demisto_sdk.commands.common.hook_validations.image import ImageValidator
 from demisto_sdk.commands.common.hook_validations.incident_field import \
@@ -52,7 +57,8 @@ from demisto_sdk.commands.common.hook_validations.structure import \
 from demisto_sdk.commands.common.hook_validations.test_playbook import \
     TestPlaybookValidator
 from demisto_sdk.commands.common.hook_validations.widget import WidgetValidator
-from demisto_sdk.commands.common.tools import (filter_packagify_changes,
+from demisto_sdk.commands.common.tools import (DOCUMENT_CACHE, GIT_CHANGE_SET,
+                                               filter_packagify_changes,
                                                find_type, get_api_module_ids,
                                                get_api_module_integrations_set,
                                                get_content_release_identifier,
@@ -61,9 +67,12 @@ from demisto_sdk.commands.common.tools import (filter_packagify_changes,
                                                get_pack_names_from_files,
                                                get_yaml, has_remote_configured,
                                                is_origin_content_repo,
-                                               open_id_set_file, run_command)
+                                               open_id_set_file)
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
 
+# The ValidateManager of a validation worker process, set by the pool initializer.
+WORKER_VALIDATE_MANAGER = None
+
 
 class ValidateManager:
     def __init__(
@@ -71,7 +80,7 @@ class ValidateManager:
             print_ignored_files=False, skip_conf_json=True, validate_id_set=False, file_path=None,
             validate_all=False, is_external_repo=False, skip_pack_rn_validation=False, print_ignored_errors=False,
             silence_init_prints=False, no_docker_checks=False, skip_dependencies=False, id_set_path=None, staged=False,
-            skip_id_set_creation=False
+            skip_id_set_creation=False, workers=1
     ):
         # General configuration
         self.skip_docker_checks = False
@@ -90,6 +99,7 @@ class ValidateManager:
         self.skip_id_set_creation = skip_id_set_creation or self.skip_dependencies
         self.compare_type = '...'
         self.staged = staged
+        self.workers = max(workers or 1, 1)
 
         # Class constants
         self.handle_error = BaseValidator(print_as_warnings=print_ignored_errors).handle_error
@@ -104,6 +114,7 @@ class ValidateManager:
         self.always_valid = False
         self.ignored_files = set()
         self.new_packs = set()
+        self.readmes_mdx_results: Dict[str, str] = {}
         self.skipped_file_types = (FileType.CHANGELOG,
                                    FileType.DESCRIPTION,
                                    FileType.DOC_IMAGE)
@@ -160,6 +171,7 @@ class ValidateManager:
             self.use_git = True
             self.is_circle = True
             is_valid = self.run_validation_using_git()
+        DOCUMENT_CACHE.print_stats()
         return self.print_final_report(is_valid)
 
     def run_validation_on_specific_files(self):
@@ -167,7 +179,17 @@ class ValidateManager:
         """
         files_validation_result = set()
 
-        for path in self.file_path.split(','):
+        paths = self.file_path.split(',')
+        self.prefetch_docker_images_tags(path for path in paths if os.path.isfile(path))
+        self.prefetch_readmes_mdx_results(path for path in paths if os.path.isfile(path))
+        pack_paths = [path.rstrip('/') for path in paths if self.is_pack_path(path)]
+        self.prefetch_packs(pack_paths)
+        if self.workers > 1:
+            # the packs are validated upfront, and each pack is reported at its own position among the paths
+            with self.validation_pool() as pool:
+                packs_worker_results = dict(zip(pack_paths, pool.map(run_validations_on_pack_in_worker, pack_paths)))
+
+        for path in paths:
             error_ignore_list = self.get_error_ignore_list(get_pack_name(path))
 
             if os.path.isfile(path):
@@ -182,10 +204,14 @@ class ValidateManager:
                                 fg="bright_cyan")
                     files_validation_result.add(self.run_validation_on_content_entities(path, error_ignore_list))
                 else:
-                    if os.path.basename(os.path.dirname(path)) == PACKS_DIR:
-                        click.secho(f'\n================= Validating pack {path} =================',
-                                    fg="bright_cyan")
-                        files_validation_result.add(self.run_validations_on_pack(path))
+                    if self.is_pack_path(path):
+                        if self.workers > 1:
+                            files_validation_result.add(self.report_pack_worker_result(path,
+                                                                                       packs_worker_results[path]))
+                        else:
+                            click.secho(f'\n================= Validating pack {path} =================',
+                                        fg="bright_cyan")
+                            files_validation_result.add(self.run_validations_on_pack(path))
 
                     else:
                         click.secho(f'\n================= Validating package {path} =================',
@@ -207,12 +233,69 @@ class ValidateManager:
             conf_json_validator = ConfJsonValidator()
             all_packs_valid.add(conf_json_validator.is_valid_conf_json())
 
-        for pack_name in os.listdir(PACKS_DIR):
-            pack_path = os.path.join(PACKS_DIR, pack_name)
-            all_packs_valid.add(self.run_validations_on_pack(pack_path))
+        pack_paths = (os.path.join(PACKS_DIR, pack_name) for pack_name in os.listdir(PACKS_DIR))
+        all_packs_valid.update(self.run_validations_on_packs(pack_paths))
 
         return all(all_packs_valid)
 
+    @staticmethod
+    def is_pack_path(path):
+        path = path.rstrip('/')
+        return os.path.isdir(path) and os.path.basename(path) not in CONTENT_ENTITIES_DIRS and \
+            os.path.basename(os.path.dirname(path)) == PACKS_DIR
+
+    def run_validations_on_packs(self, pack_paths: Iterable[str]) -> List[bool]:
+        """Runs validation on the given packs, in a process pool when running with more than one worker.
+
+        The output, errors, ignored errors and ignored files each worker finds are merged in the packs order, so the
+        final report is the same as when validating the packs one after the other.
+
+        Args:
+            pack_paths: the paths of the packs to validate.
+
+        Returns:
+            List[bool]. whether each pack is valid, in the packs order.
+        """
+        pack_paths = list(pack_paths)
+        self.prefetch_packs(pack_paths)
+
+        if self.workers == 1:
+            return [self.run_validations_on_pack(pack_path) for pack_path in pack_paths]
+
+        with self.validation_pool() as pool:
+            # the results are reported while the next packs are validated
+            return [self.report_pack_worker_result(pack_path, worker_result) for pack_path, worker_result in
+                    zip(pack_paths, pool.imap(run_validations_on_pack_in_worker, pack_paths))]
+
+    def validation_pool(self):
+        """Returns a pool of validation workers, whose run_validations_on_pack_in_worker results are reported with
+        report_pack_worker_result."""
+        tools.wait_for_remote_release_version_refresh()
+        return Pool(processes=self.workers, initializer=init_validation_worker, initargs=(self,))
+
+    def report_pack_worker_result(self, pack_path: str, worker_result: tuple) -> bool:
+        """Prints the output of a pack validated in a worker, and merges its errors, ignored errors, ignored files
+        and parsed documents cache stats into the main process.
+
+        Args:
+            pack_path: the path to the pack.
+            worker_result: the pack result returned by run_validations_on_pack_in_worker.
+
+        Returns:
+            bool. true if all files in pack are valid, false otherwise.
+        """
+        is_valid, errors, ignored_errors, ignored_files, output, cache_stats = worker_result
+        click.secho(f'\n================= Validating pack {pack_path} =================', fg="bright_cyan")
+        click.echo(output, nl=False)
+        for error in errors:
+            BaseValidator.add_to_report_error_list_entry(error, FOUND_FILES_AND_ERRORS)
+        for error in ignored_errors:
+            BaseValidator.add_to_report_error_list_entry(error, FOUND_FILES_AND_IGNORED_ERRORS)
+        self.ignored_files.update(ignored_files)
+        DOCUMENT_CACHE.hits += cache_stats[0]
+        DOCUMENT_CACHE.misses += cache_stats[1]
+        return is_valid
+
     def run_validations_on_pack(self, pack_path):
         """Runs validation on all files in given pack. (i,g,a)
 
@@ -408,6 +491,9 @@ class ValidateManager:
         modified_files, added_files, old_format_files, changed_meta_files, _ = \
             self.get_modified_and_added_files(self.compare_type, self.prev_ver)
 
+        self.prefetch_docker_images_tags(set(modified_files).union(added_files))
+        self.prefetch_readmes_mdx_results(set(modified_files).union(added_files))
+
         validation_results = set()
 
         validation_results.add(self.validate_modified_files(modified_files))
@@ -434,11 +520,58 @@ class ValidateManager:
 
         return all(validation_results)
 
+    def prefetch_docker_images_tags(self, file_paths):
+        """Looks up the latest tags of the docker images of the given integrations and scripts concurrently, so
+        validating the files doesn't wait for a docker hub request per file.
+
+        Args:
+            file_paths: the paths of the validated files, a renamed file is a tuple of its old and new paths.
+        """
+        if self.skip_docker_checks:
+            return
+
+        docker_images = set()
+        for file_path in file_paths:
+            if isinstance(file_path, tuple):
+                file_path = file_path[1]
+            if not file_path.endswith('.yml') or not os.path.isfile(file_path):
+                continue
+            if find_type(file_path) in (FileType.INTEGRATION, FileType.BETA_INTEGRATION, FileType.SCRIPT):
+                docker_images.add(get_yml_docker_image_name(get_yaml(file_path)))
+
+        DOCKER_TAGS_CACHE.prefetch(docker_images)
+
+    def prefetch_packs(self, pack_paths: List[str]):
+        """Looks up the docker images tags and parses the READMEs mdx of the files of the given packs, see
+        prefetch_docker_images_tags and prefetch_readmes_mdx_results."""
+        file_paths = [os.path.join(root, file_name) for pack_path in pack_paths
+                      for root, _, file_names in os.walk(pack_path) for file_name in file_names]
+        self.prefetch_docker_images_tags(file_paths)
+        self.prefetch_readmes_mdx_results(file_paths)
+
+    def prefetch_readmes_mdx_results(self, file_paths):
+        """Parses the mdx of the given READMEs concurrently with a pool of mdx servers, and keeps the results for
+        the READMEs validation, so it doesn't wait for the mdx parse of every README.
+
+        Args:
+            file_paths: the paths of the validated files, a renamed file is a tuple of its old and new paths.
+        """
+        readmes = []
+        for file_path in file_paths:
+            if isinstance(file_path, tuple):
+                file_path = file_path[1]
+            if file_path.endswith('.md') and find_type(file_path) == FileType.README and os.path.isfile(file_path):
+                readmes.append(file_path)
+
+        if readmes:
+            self.readmes_mdx_results.update(ReadMeValidator.verify_mdx_files(readmes))
+
     """ ######################################## Unique Validations ####################################### """
 
     def validate_readme(self, file_path, pack_error_ignore_list):
         readme_validator = ReadMeValidator(file_path, ignored_errors=pack_error_ignore_list,
-                                           print_as_warnings=self.print_ignored_errors)
+                                           print_as_warnings=self.print_ignored_errors,
+                                           mdx_results=self.readmes_mdx_results)
         return readme_validator.is_valid_file()
 
     def validate_test_playbook(self, structure_validator, pack_error_ignore_list):
@@ -805,10 +938,9 @@ class ValidateManager:
     def filter_staged_only(self, modified_files, added_files, old_format_files, changed_meta_files):
         """The function gets sets of files which were changed in the current branch and filters
         out only the files that were changed in the current commit"""
-        all_changed_files = run_command(f'git diff --name-only --staged').split()
         formatted_changed_files = set()
 
-        for file in all_changed_files:
+        for file in GIT_CHANGE_SET.staged_files:
             if find_type(file) in [FileType.POWERSHELL_FILE, FileType.PYTHON_FILE]:
                 file = os.path.splitext(file)[0] + '.yml'
             formatted_changed_files.add(file)
@@ -837,8 +969,7 @@ class ValidateManager:
 
         prev_ver = self.add_origin(prev_ver)
         # all committed changes of the current branch vs the prev_ver
-        all_committed_files_string = run_command(
-            f'git diff --name-status {prev_ver}{compare_type}refs/heads/{self.branch_name}')
+        all_committed_files_string = GIT_CHANGE_SET.name_status(f'{prev_ver}{compare_type}refs/heads/{self.branch_name}')
 
         modified_files, added_files, _, old_format_files, changed_meta_files = \
             self.filter_changed_files(all_committed_files_string, prev_ver,
@@ -858,13 +989,12 @@ class ValidateManager:
 
                 # only changes against prev_ver (without local changes)
 
-                all_changed_files_string = run_command(
-                    f'git diff --name-status {repo}/master...HEAD')
+                all_changed_files_string = GIT_CHANGE_SET.name_status(f'{repo}/master...HEAD')
                 modified_files_from_tag, added_files_from_tag, _, _, changed_meta_files_from_tag = \
                     self.filter_changed_files(all_changed_files_string, print_ignored_files=self.print_ignored_files)
 
                 # all local non-committed changes and changes against prev_ver
-                outer_changes_files_string = run_command(f'git diff --name-status --no-merges {repo}/master...HEAD')
+                outer_changes_files_string = GIT_CHANGE_SET.name_status(f'{repo}/master...HEAD')
                 nc_modified_files, nc_added_files, nc_deleted_files, nc_old_format_files, nc_changed_meta_files = \
                     self.filter_changed_files(outer_changes_files_string, print_ignored_files=self.print_ignored_files)
 
@@ -878,12 +1008,12 @@ class ValidateManager:
                     click.echo("Collecting all local changed files against the content master")
 
                 # only changes against prev_ver (without local changes)
-                all_changed_files_string = run_command('git diff --name-status {}'.format(prev_ver))
+                all_changed_files_string = GIT_CHANGE_SET.name_status(prev_ver)
                 modified_files_from_tag, added_files_from_tag, _, _, changed_meta_files_from_tag = \
                     self.filter_changed_files(all_changed_files_string, print_ignored_files=self.print_ignored_files)
 
                 # all local non-committed changes and changes against prev_ver
-                outer_changes_files_string = run_command('git diff --name-status --no-merges HEAD')
+                outer_changes_files_string = GIT_CHANGE_SET.name_status('HEAD')
                 nc_modified_files, nc_added_files, nc_deleted_files, nc_old_format_files, nc_changed_meta_files = \
                     self.filter_changed_files(outer_changes_files_string, print_ignored_files=self.print_ignored_files)
 
@@ -1086,9 +1216,7 @@ class ValidateManager:
 
     @staticmethod
     def get_current_working_branch():
-        branches = run_command('git branch')
-        branch_name_reg = re.search(r'\* (.*)', branches)
-        return branch_name_reg.group(1)
+        return GIT_CHANGE_SET.branch_name
 
     def get_content_release_identifier(self) -> Optional[str]:
         return tools.get_content_release_identifier(self.branch_name)
@@ -1177,3 +1305,32 @@ class ValidateManager:
         else:
             id_set = open_id_set_file(id_set_path)
         return id_set
+
+
+def init_validation_worker(validate_manager: ValidateManager):
+    global WORKER_VALIDATE_MANAGER
+    WORKER_VALIDATE_MANAGER = validate_manager
+
+
+def run_validations_on_pack_in_worker(pack_path: str):
+    """Runs validation on a single pack in a validation worker process.
+
+    The output, errors, ignored files and parsed files cache stats are collected per pack and returned to the main
+    process to be merged there, so the output of the workers isn't interleaved.
+
+    Returns:
+        tuple. whether the pack is valid, the found errors, the found ignored errors, the ignored files, the pack
+        validation output and the parsed files cache (hits, misses).
+    """
+    assert WORKER_VALIDATE_MANAGER, 'The validation worker was not initialized'
+    del FOUND_FILES_AND_ERRORS[:]
+    del FOUND_FILES_AND_IGNORED_ERRORS[:]
+    WORKER_VALIDATE_MANAGER.ignored_files = set()
+    cache_hits, cache_misses = DOCUMENT_CACHE.hits, DOCUMENT_CACHE.misses
+
+    output = io.StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        is_valid = WORKER_VALIDATE_MANAGER.run_validations_on_pack(pack_path)
+    return is_valid, list(FOUND_FILES_AND_ERRORS), list(FOUND_FILES_AND_IGNORED_ERRORS), \
+        WORKER_VALIDATE_MANAGER.ignored_files, output.getvalue(), \
+        (DOCUMENT_CACHE.hits - cache_hits, DOCUMENT_CACHE.misses - cache_misses)
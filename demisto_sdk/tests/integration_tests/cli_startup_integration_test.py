@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Modules which only some of the commands need, and the CLI startup must not import.
+COMMANDS_ONLY_MODULES = ['docker', 'networkx', 'pykwalify', 'PyPDF2', 'pebble', 'demisto_client', 'git', 'jinja2',
+                         'pandas', 'demisto_sdk.commands.validate.validate_manager',
+                         'demisto_sdk.commands.lint.lint_manager']
+
+
+def get_imported_modules(*args: str) -> set:
+    """Runs the CLI with `python -X importtime` and returns the names of the imported modules."""
+    env = dict(os.environ, DEMISTO_SDK_SKIP_VERSION_CHECK='1')
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-m', 'demisto_sdk', *args],
+                            capture_output=True, text=True, env=env)
+    assert result.returncode == 0, result.stderr
+
+    return {line.split('|')[-1].strip() for line in result.stderr.splitlines() if line.startswith('import time:')}
+
+
+@pytest.mark.parametrize('args', ['-h', '--version'])
+def test_cli_startup_imports(args):
+    """
+    Given
+    - The demisto-sdk CLI.
+
+    When
+    - Running the CLI with -h or --version.
+
+    Then
+    - Ensure the modules which only some of the commands need are not imported.
+    """
+    imported_modules = get_imported_modules(args)
+
+    assert not [module for module in COMMANDS_ONLY_MODULES if module in imported_modules]
@@ -9,7 +9,7 @@ SECRETS_CMD = "secrets"
 
 def mock_git(mocker, is_merge: bool = False):
     mocker.patch.object(SecretsValidator, 'get_branch_name', return_value='branch name')
-    mocker.patch('demisto_sdk.commands.secrets.secrets.run_command', return_value=is_merge)
+    mocker.patch('demisto_sdk.commands.common.tools.run_command', return_value=is_merge)
 
 
 def test_integration_secrets_incident_field_positive(mocker, repo):
@@ -29,7 +29,7 @@ def test_integration_secrets_incident_field_positive(mocker, repo):
     integration = pack.create_integration('integration')
     mock_git(mocker)
     mocker.patch(
-        "demisto_sdk.__main__.SecretsValidator.get_all_diff_text_files",
+        "demisto_sdk.commands.secrets.secrets.SecretsValidator.get_all_diff_text_files",
         return_value=[
             integration.yml.rel_path
         ]
@@ -65,7 +65,7 @@ def test_integration_secrets_integration_negative(mocker, repo):
     secret_string = 'Dynamics365ForMarketingEmail'
     integration.yml.write({'this is a secrets': secret_string})
     mocker.patch(
-        "demisto_sdk.__main__.SecretsValidator.get_all_diff_text_files",
+        "demisto_sdk.commands.secrets.secrets.SecretsValidator.get_all_diff_text_files",
         return_value=[integration.yml.rel_path]
     )
     with ChangeCWD(repo.path):
@@ -104,7 +104,7 @@ def test_integration_secrets_integration_positive(mocker, repo):
             secret_string
         ])
     mocker.patch(
-        "demisto_sdk.__main__.SecretsValidator.get_all_diff_text_files",
+        "demisto_sdk.commands.secrets.secrets.SecretsValidator.get_all_diff_text_files",
         return_value=[integration.code.rel_path]
     )
     with ChangeCWD(integration.repo_path):
@@ -133,7 +133,7 @@ def test_integration_secrets_integration_global_whitelist_positive_using_git(moc
     mock_git(mocker)
     # Mock git diff
     mocker.patch(
-        "demisto_sdk.__main__.SecretsValidator.get_all_diff_text_files",
+        "demisto_sdk.commands.secrets.secrets.SecretsValidator.get_all_diff_text_files",
         return_value=[integration.code.rel_path]
     )
     # Change working dir to repo